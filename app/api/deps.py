@@ -6,6 +6,7 @@ and service initialization.
 """
 
 from fastapi import Header, HTTPException, Depends
+from functools import lru_cache
 from typing import Dict, Any
 from app.config import settings
 from app.services.ocean_service import OceanService
@@ -44,12 +45,14 @@ async def get_current_user(authorization: str = Header(None)) -> Dict[str, Any]:
     }
 
 
+@lru_cache()
 def get_ocean_service() -> OceanService:
     """
     Dependency to get OceanService instance.
 
-    This creates a new OceanService instance configured with ZeroDB
-    connection details from application settings.
+    Returns a process-wide OceanService configured with ZeroDB connection
+    details from application settings. The instance is shared across requests
+    so concurrent searches can be coalesced into batched embedding calls.
 
     Returns:
         Configured OceanService instance
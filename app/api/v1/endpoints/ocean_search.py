@@ -13,26 +13,12 @@ import re
 
 from app.schemas.ocean import SearchResponse, SearchResult, ErrorResponse
 from app.services.ocean_service import OceanService
-from app.config import settings
+from app.api.deps import get_ocean_service
 
 
 router = APIRouter()
 
 
-def get_ocean_service() -> OceanService:
-    """
-    Dependency injection for OceanService.
-
-    Returns:
-        Configured OceanService instance
-    """
-    return OceanService(
-        api_url=settings.ZERODB_API_URL,
-        api_key=settings.ZERODB_API_KEY,
-        project_id=settings.ZERODB_PROJECT_ID
-    )
-
-
 def extract_highlights(query: str, content: dict, block_type: str) -> list[str]:
     """
     Extract matching terms from block content for highlighting.
@@ -1,7 +1,7 @@
 """Application Configuration"""
 
 from typing import List, Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import secrets
 
 
@@ -34,9 +34,13 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Settings are read once at startup; frozen makes that explicit so the
+    # shared instance can be cached and reused safely
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True
+    )
 
     def validate_zerodb_config(self) -> bool:
         """Check if ZeroDB configuration is complete."""
@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
+from app.api.deps import get_ocean_service
 from app.api.v1.endpoints import ocean_pages, ocean_blocks, ocean_links, ocean_tags, ocean_search
 from app.middleware import QueryTimingMiddleware
 from app.logging_config import setup_logging
@@ -100,6 +101,13 @@ async def startup_event():
     logger.info("=" * 60)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Shutdown event - release the shared ZeroDB connection pool."""
+    if get_ocean_service.cache_info().currsize:
+        await get_ocean_service().aclose()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API information."""
@@ -0,0 +1,106 @@
+"""
+Embedding Cache - In-process LRU cache for query embeddings.
+
+Repeated searches for the same text (ignoring case and surrounding whitespace)
+reuse the stored vector instead of calling the embeddings API again.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, shaped like functools.lru_cache's cache_info()."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU mapping of normalized query text to embedding vectors.
+
+    Vectors are stored as read-only float32 arrays and returned as-is, so
+    callers must not modify them.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of embeddings kept before evicting the
+                least recently used entry
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(query: str) -> str:
+        """
+        Build the cache key for a query.
+
+        The model is uncased, so queries differing only in case or surrounding
+        whitespace share an embedding.
+
+        Args:
+            query: Search query text
+
+        Returns:
+            SHA-256 hex digest of the normalized query
+        """
+        return hashlib.sha256(query.strip().lower().encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Look up an embedding and mark it as recently used.
+
+        Args:
+            key: Key from EmbeddingCache.key
+
+        Returns:
+            Cached embedding, or None on a miss
+        """
+        embedding = self._entries.get(key)
+        if embedding is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return embedding
+
+    def put(self, key: str, embedding: np.ndarray) -> None:
+        """
+        Store an embedding, evicting the oldest entries if over maxsize.
+
+        Args:
+            key: Key from EmbeddingCache.key
+            embedding: Query embedding vector
+        """
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """Report hit/miss counts and current size."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
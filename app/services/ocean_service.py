@@ -8,10 +8,53 @@ NOTE: This implementation uses direct HTTP requests to ZeroDB API instead of the
       because the SDK's MCP bridge has endpoint compatibility issues.
 """
 
+import asyncio
+import functools
+import heapq
+import importlib.util
+import inspect
 import uuid
 import httpx
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import numpy as np
+import orjson
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Set
+
+from app.services.embedding_cache import CacheInfo, EmbeddingCache
+from app.services.semantic_cache import SemanticResultCache
+from app.services.ttl_cache import TTLCache
+
+
+def _invalidates_after_write(*cache_names: str) -> Callable:
+    """
+    Invalidate the named org-scoped caches once the decorated write finishes.
+
+    Writes also invalidate up front, but a read that started before the write
+    can still fetch the old rows and cache them under the new generation. The
+    second invalidation, run whether the write succeeds or raises, drops such
+    entries and stops reads still in flight from caching theirs.
+
+    Args:
+        *cache_names: OceanService attributes holding the caches (each has
+            invalidate(org_id)); the write method must take an org_id argument
+    """
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            org_id = signature.bind(self, *args, **kwargs).arguments["org_id"]
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                for name in cache_names:
+                    getattr(self, name).invalidate(org_id)
+
+        return wrapper
+
+    return decorator
 
 
 class OceanService:
@@ -22,7 +65,62 @@ class OceanService:
     All methods enforce organization_id filtering to prevent cross-organization data access.
     """
 
-    def __init__(self, api_url: str, api_key: str, project_id: str):
+    # Query embedding micro-batching: concurrent searches arriving within the
+    # window share a single /embeddings/generate request (see _generate_query_embedding)
+    EMBEDDING_BATCH_WINDOW = 0.008  # seconds
+    EMBEDDING_BATCH_MAX_SIZE = 32
+
+    # Block embeddings are generated and stored in requests of at most this
+    # many texts (chunks of one create_block_batch call are sent concurrently)
+    EMBEDDING_STORE_BATCH_SIZE = 64
+
+    # Max number of query embeddings kept in the in-process LRU cache
+    EMBEDDING_CACHE_SIZE = 10000
+
+    # Semantic/hybrid search results are reused for queries whose embedding
+    # is at least this cosine-similar to a cached one (see SemanticResultCache)
+    RESULT_CACHE_THRESHOLD = 0.95
+    RESULT_CACHE_MAX_ENTRIES = 1024
+    RESULT_CACHE_TTL = 30.0  # seconds
+
+    # get_tags results are cached per (org, filters) and dropped on tag writes
+    TAG_CACHE_MAX_ENTRIES = 500
+    TAG_CACHE_TTL = 30.0  # seconds
+
+    # Backlink lists are cached per (org, target) and dropped on link or
+    # source block writes
+    BACKLINK_CACHE_MAX_ENTRIES = 500
+    BACKLINK_CACHE_TTL = 30.0  # seconds
+
+    # Rows listed per query by bulk_delete_by_org, and DELETEs it keeps in
+    # flight at once
+    BULK_DELETE_PAGE_SIZE = 1000
+    BULK_DELETE_CONCURRENCY = 20
+
+    # Position PATCHes move_block keeps in flight at once
+    MOVE_BLOCK_CONCURRENCY = 20
+
+    # Links read per query when loading the link graph for a cycle check, and
+    # the most blocks the check may reach before a link create is rejected
+    LINK_GRAPH_PAGE_SIZE = 1000
+    LINK_GRAPH_MAX_BLOCKS = 10000
+
+    # Shared ZeroDB connection pool (see _http_client)
+    HTTP_MAX_CONNECTIONS = 50
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+    HTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
+    HTTP_CONNECT_RETRIES = 3
+    # Multiplex concurrent requests over one connection when h2 is installed
+    # (httpx[http2]); otherwise fall back to the HTTP/1.1 pool
+    HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        project_id: str,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Ocean service.
 
@@ -30,6 +128,9 @@ class OceanService:
             api_url: ZeroDB API base URL
             api_key: ZeroDB API key
             project_id: ZeroDB project ID for this Ocean instance
+            client: Optional HTTP client to send all requests through (e.g. one
+                shared by several services); the caller owns it and closes it.
+                By default the service manages its own pool.
         """
         self.api_url = api_url.rstrip('/')
         self.api_key = api_key
@@ -38,10 +139,135 @@ class OceanService:
         self.tags_table_name = "ocean_tags"
         self.blocks_table_name = "ocean_blocks"
         self.links_table_name = "ocean_block_links"
-        self.headers = {
+        # Built once and shared by every request; read-only so no call site
+        # can leak per-request headers into the others
+        self.headers = MappingProxyType({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
-        }
+        })
+        self._embedding_queue: Optional[asyncio.Queue] = None
+        self._embedding_worker: Optional[asyncio.Task] = None
+        self._embedding_cache = EmbeddingCache(maxsize=self.EMBEDDING_CACHE_SIZE)
+        self._result_cache = SemanticResultCache(
+            threshold=self.RESULT_CACHE_THRESHOLD,
+            max_entries=self.RESULT_CACHE_MAX_ENTRIES,
+            ttl=self.RESULT_CACHE_TTL
+        )
+        self._tag_cache = TTLCache(maxsize=self.TAG_CACHE_MAX_ENTRIES, ttl=self.TAG_CACHE_TTL)
+        self._backlink_cache = TTLCache(
+            maxsize=self.BACKLINK_CACHE_MAX_ENTRIES,
+            ttl=self.BACKLINK_CACHE_TTL
+        )
+        # Cleared if ZeroDB rejects __in/__gte/__lte query operators
+        self._filter_operators_supported = True
+        # Cleared if ZeroDB vector search rejects __in metadata filter operators
+        self._vector_filter_operators_supported = True
+        self._external_client = client
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Closes of clients left behind by a previous event loop, still running
+        self._closing_clients: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "OceanService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client, creating it on first use.
+
+        One client (and connection pool) is kept per event loop, so TCP/TLS
+        connections to ZeroDB are reused across calls and concurrent requests
+        from asyncio.gather are not serialized on a single connection (or,
+        over HTTP/2, share one multiplexed connection). Connection failures
+        are retried by the transport. When the running loop changes, the
+        previous loop's client is closed in the background.
+
+        Returns:
+            Shared httpx.AsyncClient bound to the running event loop, or the
+            client passed to __init__
+        """
+        if self._external_client is not None:
+            return self._external_client
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                task = loop.create_task(self._close_stale_client(self._client))
+                self._closing_clients.add(task)
+                task.add_done_callback(self._closing_clients.discard)
+            self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=self.HTTP2_ENABLED,
+                    retries=self.HTTP_CONNECT_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=self.HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=self.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=self.HTTP_KEEPALIVE_EXPIRY
+                    )
+                )
+            )
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    async def _close_stale_client(client: httpx.AsyncClient) -> None:
+        """Close a client bound to an event loop that is no longer running."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Non-critical: its loop may already be closed along with the sockets
+            print(f"WARNING: Failed to close HTTP client from a previous event loop: {e}")
+
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Borrow the pooled HTTP client for a block of requests.
+
+        Unlike ``async with httpx.AsyncClient()``, leaving the block does not
+        close the client; use aclose() to release the pool.
+        """
+        yield self._get_client()
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP client, if one was created.
+
+        A client passed to __init__ is left open for its owner to close.
+        """
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    @staticmethod
+    def _encode_json(payload: Any) -> bytes:
+        """
+        Serialize a request body with orjson.
+
+        numpy arrays (query embeddings) are written directly from their buffers.
+
+        Args:
+            payload: JSON-serializable request body
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    @staticmethod
+    def _decode_json(response: httpx.Response) -> Any:
+        """
+        Parse a JSON response body with orjson.
+
+        Args:
+            response: HTTP response from ZeroDB
+
+        Returns:
+            Decoded JSON document
+        """
+        return orjson.loads(response.content)
 
     async def create_page(
         self,
@@ -102,13 +328,13 @@ class OceanService:
         }
 
         # Insert into ZeroDB using direct HTTP
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/rows",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": page_doc
-                },
+                }),
                 timeout=30.0
             )
 
@@ -116,7 +342,7 @@ class OceanService:
                 raise Exception(f"Failed to insert page: {response.status_code} - {response.text}")
 
             # Extract row_id from response
-            result = response.json()
+            result = self._decode_json(response)
             page_doc["row_id"] = result["row_id"]
 
         return page_doc
@@ -137,18 +363,18 @@ class OceanService:
             Page document if found and belongs to organization, None otherwise
         """
         # Query by page_id and organization_id
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "page_id": page_id,
                         "organization_id": org_id
                     },
                     "limit": 1,
                     "skip": 0
-                },
+                }),
                 timeout=30.0
             )
 
@@ -156,7 +382,7 @@ class OceanService:
                 print(f"DEBUG: query_rows failed: {response.status_code} - {response.text}")
                 return None
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
             if not rows:
                 return None
@@ -206,22 +432,22 @@ class OceanService:
         offset = pagination.get("offset", 0) if pagination else 0
 
         # Query pages
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": query_filters,
                     "limit": limit,
                     "skip": offset
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return []
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
 
             # Extract row_data from each row
@@ -257,22 +483,22 @@ class OceanService:
 
         # Query with limit=0 to get just count (if supported)
         # Otherwise, query all and count locally
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": query_filters,
                     "limit": 1000,  # Get all for count (ZeroDB limit)
                     "skip": 0
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return 0
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
             return len(rows)
 
@@ -315,25 +541,25 @@ class OceanService:
                 update_payload[field] = updates[field]
 
         # Update in ZeroDB - requires two-step process
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             # Step 1: Query to get row_id
             query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "page_id": page_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if query_response.status_code != 200:
                 return None
 
-            query_result = query_response.json()
+            query_result = self._decode_json(query_response)
             rows = query_result.get("data", [])
             if not rows:
                 return None
@@ -344,9 +570,9 @@ class OceanService:
             update_response = await client.patch(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/rows/{row_id}",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": update_payload
-                },
+                }),
                 timeout=30.0
             )
 
@@ -354,7 +580,7 @@ class OceanService:
                 return None
 
             # Response contains updated row with row_data
-            result = update_response.json()
+            result = self._decode_json(update_response)
             return result.get("row_data")
 
     async def delete_page(
@@ -378,25 +604,25 @@ class OceanService:
             return False
 
         # Soft delete: set is_archived=True using two-step process
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             # Step 1: Query to get row_id
             query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "page_id": page_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if query_response.status_code != 200:
                 return False
 
-            query_result = query_response.json()
+            query_result = self._decode_json(query_response)
             rows = query_result.get("data", [])
             if not rows:
                 return False
@@ -407,12 +633,12 @@ class OceanService:
             update_response = await client.patch(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/rows/{row_id}",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": {
                         "is_archived": True,
                         "updated_at": datetime.utcnow().isoformat()
                     }
-                },
+                }),
                 timeout=30.0
             )
 
@@ -454,25 +680,25 @@ class OceanService:
         new_position = await self._get_next_position(org_id, new_parent_id)
 
         # Update page using two-step process
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             # Step 1: Query to get row_id
             query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "page_id": page_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if query_response.status_code != 200:
                 return None
 
-            query_result = query_response.json()
+            query_result = self._decode_json(query_response)
             rows = query_result.get("data", [])
             if not rows:
                 return None
@@ -483,13 +709,13 @@ class OceanService:
             update_response = await client.patch(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.table_name}/rows/{row_id}",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": {
                         "parent_page_id": new_parent_id,
                         "position": new_position,
                         "updated_at": datetime.utcnow().isoformat()
                     }
-                },
+                }),
                 timeout=30.0
             )
 
@@ -497,13 +723,14 @@ class OceanService:
                 return None
 
             # Response contains updated row with row_data
-            result = update_response.json()
+            result = self._decode_json(update_response)
             return result.get("row_data")
 
     # ========================================================================
     # BLOCK OPERATIONS (Issue #7)
     # ========================================================================
 
+    @_invalidates_after_write("_result_cache")
     async def create_block(
         self,
         page_id: str,
@@ -534,6 +761,9 @@ class OceanService:
         Raises:
             ValueError: If required fields are missing or block_type is invalid
         """
+        # Cached search results for this org are now stale
+        self._result_cache.invalidate(org_id)
+
         # Validate required fields
         if not org_id or not user_id or not page_id:
             raise ValueError("organization_id, user_id, and page_id are required")
@@ -547,19 +777,20 @@ class OceanService:
         if block_data["block_type"] not in valid_types:
             raise ValueError(f"block_type must be one of: {', '.join(valid_types)}")
 
-        # Verify page exists and belongs to organization
-        page = await self.get_page(page_id, org_id)
+        # Verify page exists and calculate position (if not provided) concurrently
+        position = block_data.get("position")
+        page, next_position = await asyncio.gather(
+            self.get_page(page_id, org_id),
+            self._get_next_block_position(page_id, org_id) if position is None
+            else asyncio.sleep(0, result=position)
+        )
         if not page:
             raise ValueError(f"Page {page_id} not found or does not belong to organization")
+        position = next_position
 
         # Generate block ID
         block_id = str(uuid.uuid4())
 
-        # Calculate position if not provided
-        position = block_data.get("position")
-        if position is None:
-            position = await self._get_next_block_position(page_id, org_id)
-
         # Build block document
         now = datetime.utcnow().isoformat()
         block_doc = {
@@ -580,6 +811,8 @@ class OceanService:
 
         # Generate embedding if block has searchable content
         searchable_text = self._extract_searchable_text(block_doc)
+        block_doc["searchable_text"] = searchable_text.lower()
+        block_doc["text_hash"] = self._text_hash(searchable_text)
         if searchable_text:
             try:
                 vector_id = await self._generate_and_store_embedding(
@@ -596,18 +829,18 @@ class OceanService:
                 print(f"WARNING: Failed to generate embedding for block {block_id}: {e}")
 
         # Insert into ZeroDB
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/public/zerodb/mcp/execute",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "operation": "insert_rows",
                     "params": {
                         "project_id": self.project_id,
                         "table_name": self.blocks_table_name,
                         "rows": [block_doc]
                     }
-                },
+                }),
                 timeout=30.0
             )
 
@@ -616,6 +849,7 @@ class OceanService:
 
         return block_doc
 
+    @_invalidates_after_write("_result_cache")
     async def create_block_batch(
         self,
         page_id: str,
@@ -647,6 +881,9 @@ class OceanService:
         Raises:
             ValueError: If required fields are missing or batch size exceeds limit
         """
+        # Cached search results for this org are now stale
+        self._result_cache.invalidate(org_id)
+
         if not blocks_list:
             return []
 
@@ -705,6 +942,8 @@ class OceanService:
 
             # Extract searchable text for embedding
             searchable_text = self._extract_searchable_text(block_doc)
+            block_doc["searchable_text"] = searchable_text.lower()
+            block_doc["text_hash"] = self._text_hash(searchable_text)
             if searchable_text:
                 texts_for_embedding.append(searchable_text)
                 text_to_block_mapping.append({
@@ -741,18 +980,18 @@ class OceanService:
                 print(f"WARNING: Failed to generate batch embeddings: {e}")
 
         # Batch insert into ZeroDB
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/public/zerodb/mcp/execute",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "operation": "insert_rows",
                     "params": {
                         "project_id": self.project_id,
                         "table_name": self.blocks_table_name,
                         "rows": block_docs
                     }
-                },
+                }),
                 timeout=60.0  # Longer timeout for batch operations
             )
 
@@ -776,11 +1015,11 @@ class OceanService:
         Returns:
             Block document if found and belongs to organization, None otherwise
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/public/zerodb/mcp/execute",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "operation": "query_rows",
                     "params": {
                         "project_id": self.project_id,
@@ -791,14 +1030,14 @@ class OceanService:
                         },
                         "limit": 1
                     }
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return None
 
-            result = response.json()
+            result = self._decode_json(response)
             if not result.get("success"):
                 return None
 
@@ -846,22 +1085,22 @@ class OceanService:
         offset = pagination.get("offset", 0) if pagination else 0
 
         # Query blocks
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": query_filters,
                     "limit": limit,
                     "skip": offset
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return []
 
-            result = response.json()
+            result = self._decode_json(response)
             rows_data = result.get("data", [])
 
             # Extract row_data from each row
@@ -902,25 +1141,26 @@ class OceanService:
                 query_filters["parent_block_id"] = filters["parent_block_id"]
 
         # Query all blocks to count (ZeroDB limit: 1000)
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": query_filters,
                     "limit": 1000,
                     "skip": 0
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return 0
 
-            result = response.json()
+            result = self._decode_json(response)
             rows_data = result.get("data", [])
             return len(rows_data)
 
+    @_invalidates_after_write("_result_cache", "_backlink_cache")
     async def update_block(
         self,
         block_id: str,
@@ -942,6 +1182,10 @@ class OceanService:
         Returns:
             Updated block document if found and belongs to organization, None otherwise
         """
+        # Cached search results and backlink previews for this org are now stale
+        self._result_cache.invalidate(org_id)
+        self._backlink_cache.invalidate(org_id)
+
         # Verify block exists and belongs to organization
         existing_block = await self.get_block(block_id, org_id)
         if not existing_block:
@@ -952,17 +1196,7 @@ class OceanService:
             "updated_at": datetime.utcnow().isoformat()
         }
 
-        # Check if content changed (requires embedding regeneration)
-        content_changed = False
         if "content" in updates:
-            old_text = self._extract_searchable_text(existing_block)
-            # Temporarily update for text extraction
-            temp_block = {**existing_block, "content": updates["content"]}
-            new_text = self._extract_searchable_text(temp_block)
-
-            if old_text != new_text:
-                content_changed = True
-
             update_payload["content"] = updates["content"]
 
         # Add other allowed fields
@@ -971,77 +1205,24 @@ class OceanService:
             if field in updates:
                 update_payload[field] = updates[field]
 
-        # Regenerate embedding if content changed
-        if content_changed:
-            try:
-                # Delete old embedding if exists
-                if existing_block.get("vector_id"):
-                    await self._delete_embedding(existing_block["vector_id"])
-
-                # Generate new embedding
-                searchable_text = self._extract_searchable_text({**existing_block, **update_payload})
-                if searchable_text:
-                    vector_id = await self._generate_and_store_embedding(
-                        text=searchable_text,
-                        block_id=block_id,
-                        block_type=update_payload.get("block_type", existing_block["block_type"]),
-                        page_id=existing_block["page_id"],
-                        org_id=org_id
-                    )
-                    update_payload["vector_id"] = vector_id
-                    update_payload["vector_dimensions"] = 768
-                else:
-                    # No searchable text in new content
-                    update_payload["vector_id"] = None
-                    update_payload["vector_dimensions"] = None
-
-            except Exception as e:
-                # Non-critical: continue without embedding update
-                print(f"WARNING: Failed to regenerate embedding for block {block_id}: {e}")
-
-        # Update in ZeroDB (two-step process)
-        async with httpx.AsyncClient() as client:
-            # Step 1: Query to get row_id
-            query_response = await client.post(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
-                headers=self.headers,
-                json={
-                    "filter": {
-                        "block_id": block_id,
-                        "organization_id": org_id
-                    },
-                    "limit": 1
-                },
-                timeout=30.0
-            )
-
-            if query_response.status_code != 200:
-                return None
-
-            query_result = query_response.json()
-            rows = query_result.get("data", [])
-            if not rows:
-                return None
-
-            row_id = rows[0]["row_id"]
-
-            # Step 2: Update by row_id
-            response = await client.patch(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{row_id}",
-                headers=self.headers,
-                json={
-                    "row_data": update_payload
-                },
-                timeout=30.0
-            )
-
-            if response.status_code != 200:
-                return None
-
-            # Return updated row_data
-            result = response.json()
-            return result.get("row_data")
+        # Keep the precomputed search text in sync with content/type changes;
+        # only a change in the normalized text requires a new embedding
+        text_changed = False
+        if "content" in update_payload or "block_type" in update_payload:
+            new_text = self._extract_searchable_text({**existing_block, **update_payload})
+            update_payload["searchable_text"] = new_text.lower()
+            update_payload["text_hash"] = self._text_hash(new_text)
+            text_changed = update_payload["text_hash"] != self._get_text_hash(existing_block)
+
+        # Regenerate embedding if the text changed
+        return await self._write_block_update(
+            existing_block,
+            org_id,
+            update_payload,
+            new_text=new_text if text_changed else None
+        )
 
+    @_invalidates_after_write("_result_cache", "_backlink_cache")
     async def delete_block(
         self,
         block_id: str,
@@ -1057,6 +1238,10 @@ class OceanService:
         Returns:
             True if block was deleted, False if not found or wrong organization
         """
+        # Cached search results and backlink previews for this org are now stale
+        self._result_cache.invalidate(org_id)
+        self._backlink_cache.invalidate(org_id)
+
         # Verify block exists and belongs to organization
         existing_block = await self.get_block(block_id, org_id)
         if not existing_block:
@@ -1071,25 +1256,25 @@ class OceanService:
                 print(f"WARNING: Failed to delete embedding for block {block_id}: {e}")
 
         # Delete block from ZeroDB (two-step process)
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             # Step 1: Query to get row_id
             query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "block_id": block_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if query_response.status_code != 200:
                 return False
 
-            query_result = query_response.json()
+            query_result = self._decode_json(query_response)
             rows = query_result.get("data", [])
             if not rows:
                 return False
@@ -1105,6 +1290,7 @@ class OceanService:
 
             return response.status_code == 204  # Changed from 200 to 204
 
+    @_invalidates_after_write("_result_cache")
     async def move_block(
         self,
         block_id: str,
@@ -1123,8 +1309,12 @@ class OceanService:
             org_id: Organization ID (multi-tenant isolation)
 
         Returns:
-            Updated block document if successful, None if block not found
+            Updated block document if successful, None if block not found or
+            any position update was rejected
         """
+        # Cached search results for this org are now stale
+        self._result_cache.invalidate(org_id)
+
         # Verify block exists and belongs to organization
         existing_block = await self.get_block(block_id, org_id)
         if not existing_block:
@@ -1134,18 +1324,39 @@ class OceanService:
         if old_position == new_position:
             return existing_block  # No change needed
 
-        # Get all blocks on the same page
-        all_blocks = await self.get_blocks_by_page(
-            existing_block["page_id"],
-            org_id
-        )
+        # One query for all rows on the page: positions and row_ids together,
+        # so no per-block lookup is needed before updating
+        async with self._http_client() as client:
+            response = await client.post(
+                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
+                headers=self.headers,
+                content=self._encode_json({
+                    "filter": {
+                        "page_id": existing_block["page_id"],
+                        "organization_id": org_id
+                    },
+                    "limit": 1000,
+                    "skip": 0
+                }),
+                timeout=30.0
+            )
+
+            if response.status_code != 200:
+                return None
+
+            page_rows = self._decode_json(response).get("data", [])
+
+        row_ids = {row["row_data"]["block_id"]: row["row_id"] for row in page_rows}
+        if block_id not in row_ids:
+            return None
 
         # Calculate position updates for affected blocks
         updates_needed = []
 
         if new_position > old_position:
             # Moving down: shift blocks between old and new position up
-            for block in all_blocks:
+            for row in page_rows:
+                block = row["row_data"]
                 pos = block.get("position", 0)
                 if old_position < pos <= new_position and block["block_id"] != block_id:
                     updates_needed.append({
@@ -1154,7 +1365,8 @@ class OceanService:
                     })
         else:
             # Moving up: shift blocks between new and old position down
-            for block in all_blocks:
+            for row in page_rows:
+                block = row["row_data"]
                 pos = block.get("position", 0)
                 if new_position <= pos < old_position and block["block_id"] != block_id:
                     updates_needed.append({
@@ -1162,88 +1374,48 @@ class OceanService:
                         "new_position": pos + 1
                     })
 
-        # Update affected blocks (two-step for each)
-        async with httpx.AsyncClient() as client:
-            for update in updates_needed:
-                # Query to get row_id
-                query_response = await client.post(
-                    f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
-                    headers=self.headers,
-                    json={
-                        "filter": {
-                            "block_id": update["block_id"],
-                            "organization_id": org_id
-                        },
-                        "limit": 1
-                    },
-                    timeout=30.0
-                )
-
-                if query_response.status_code == 200:
-                    query_result = query_response.json()
-                    rows = query_result.get("data", [])
-                    if rows:
-                        row_id = rows[0]["row_id"]
-
-                        # Update by row_id
-                        await client.patch(
-                            f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{row_id}",
-                            headers=self.headers,
-                            json={
-                                "row_data": {
-                                    "position": update["new_position"],
-                                    "updated_at": datetime.utcnow().isoformat()
-                                }
-                            },
-                            timeout=30.0
-                        )
+        # Update the moved block and all shifted blocks concurrently, at most
+        # MOVE_BLOCK_CONCURRENCY at a time
+        now = datetime.utcnow().isoformat()
+        semaphore = asyncio.Semaphore(self.MOVE_BLOCK_CONCURRENCY)
+        async with self._http_client() as client:
+            async def set_position(target_block_id: str, position: int) -> httpx.Response:
+                async with semaphore:
+                    return await client.patch(
+                        f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{row_ids[target_block_id]}",
+                        headers=self.headers,
+                        content=self._encode_json({
+                            "row_data": {
+                                "position": position,
+                                "updated_at": now
+                            }
+                        }),
+                        timeout=30.0
+                    )
 
-        # Update the moved block (two-step process)
-        async with httpx.AsyncClient() as client:
-            # Query to get row_id
-            query_response = await client.post(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
-                headers=self.headers,
-                json={
-                    "filter": {
-                        "block_id": block_id,
-                        "organization_id": org_id
-                    },
-                    "limit": 1
-                },
-                timeout=30.0
+            # Let every PATCH finish before reporting a failure, so the caller
+            # sees the error only once no update is still in flight
+            responses = await asyncio.gather(
+                set_position(block_id, new_position),
+                *(
+                    set_position(update["block_id"], update["new_position"])
+                    for update in updates_needed
+                ),
+                return_exceptions=True
             )
-
-            if query_response.status_code != 200:
-                return None
-
-            query_result = query_response.json()
-            rows = query_result.get("data", [])
-            if not rows:
+            for response in responses:
+                if isinstance(response, Exception):
+                    raise response
+            if any(response.status_code != 200 for response in responses):
                 return None
 
-            row_id = rows[0]["row_id"]
-
-            # Update by row_id
-            response = await client.patch(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{row_id}",
-                headers=self.headers,
-                json={
-                    "row_data": {
-                        "position": new_position,
-                        "updated_at": datetime.utcnow().isoformat()
-                    }
-                },
-                timeout=30.0
-            )
-
-            if response.status_code != 200:
-                return None
+            response = responses[0]
 
             # Return updated row_data
-            result = response.json()
+            result = self._decode_json(response)
             return result.get("row_data")
 
+    @_invalidates_after_write("_result_cache", "_backlink_cache")
     async def convert_block_type(
         self,
         block_id: str,
@@ -1267,6 +1439,10 @@ class OceanService:
         Raises:
             ValueError: If new_type is invalid
         """
+        # Cached search results and backlink previews for this org are now stale
+        self._result_cache.invalidate(org_id)
+        self._backlink_cache.invalidate(org_id)
+
         # Validate new type
         valid_types = ["text", "heading", "list", "task", "link", "page_link"]
         if new_type not in valid_types:
@@ -1286,90 +1462,32 @@ class OceanService:
         new_content = self._convert_block_content(old_content, old_type, new_type)
 
         # Check if searchable text changed
-        old_text = self._extract_searchable_text(existing_block)
         temp_block = {**existing_block, "content": new_content, "block_type": new_type}
         new_text = self._extract_searchable_text(temp_block)
+        text_hash = self._text_hash(new_text)
 
         # Build update payload
         update_payload = {
             "block_type": new_type,
             "content": new_content,
+            "searchable_text": new_text.lower(),
+            "text_hash": text_hash,
             "updated_at": datetime.utcnow().isoformat()
         }
 
         # Regenerate embedding if searchable text changed
-        if old_text != new_text:
-            try:
-                # Delete old embedding if exists
-                if existing_block.get("vector_id"):
-                    await self._delete_embedding(existing_block["vector_id"])
-
-                # Generate new embedding
-                if new_text:
-                    vector_id = await self._generate_and_store_embedding(
-                        text=new_text,
-                        block_id=block_id,
-                        block_type=new_type,
-                        page_id=existing_block["page_id"],
-                        org_id=org_id
-                    )
-                    update_payload["vector_id"] = vector_id
-                    update_payload["vector_dimensions"] = 768
-                else:
-                    update_payload["vector_id"] = None
-                    update_payload["vector_dimensions"] = None
-
-            except Exception as e:
-                # Non-critical: continue without embedding update
-                print(f"WARNING: Failed to regenerate embedding during conversion: {e}")
-
-        # Update in ZeroDB (two-step process)
-        async with httpx.AsyncClient() as client:
-            # Query to get row_id
-            query_response = await client.post(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
-                headers=self.headers,
-                json={
-                    "filter": {
-                        "block_id": block_id,
-                        "organization_id": org_id
-                    },
-                    "limit": 1
-                },
-                timeout=30.0
-            )
-
-            if query_response.status_code != 200:
-                return None
-
-            query_result = query_response.json()
-            rows = query_result.get("data", [])
-            if not rows:
-                return None
-
-            row_id = rows[0]["row_id"]
-
-            # Update by row_id
-            response = await client.patch(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{row_id}",
-                headers=self.headers,
-                json={
-                    "row_data": update_payload
-                },
-                timeout=30.0
-            )
-
-            if response.status_code != 200:
-                return None
-
-            # Return updated row_data
-            result = response.json()
-            return result.get("row_data")
+        return await self._write_block_update(
+            existing_block,
+            org_id,
+            update_payload,
+            new_text=new_text if text_hash != self._get_text_hash(existing_block) else None
+        )
 
     # ========================================================================
     # LINK MANAGEMENT OPERATIONS (Issue #10)
     # ========================================================================
 
+    @_invalidates_after_write("_backlink_cache")
     async def create_link(
         self,
         source_block_id: str,
@@ -1393,33 +1511,40 @@ class OceanService:
 
         Raises:
             ValueError: If circular reference detected or invalid parameters
+            Exception: If the links needed for the circular reference check
+                       cannot be loaded
         """
         # Validate link type
         valid_link_types = ["reference", "embed", "mention"]
         if link_type not in valid_link_types:
             raise ValueError(f"Invalid link_type. Must be one of: {valid_link_types}")
 
+        # Cached backlinks for this org are now stale
+        self._backlink_cache.invalidate(org_id)
+
+        # Look up source, target and (for block-to-block links) the links
+        # reachable from the target concurrently: all three are independent reads
+        source_block, target, link_graph = await asyncio.gather(
+            self._get_block_by_id(source_block_id, org_id),
+            self.get_page(target_id, org_id) if is_page_link
+            else self._get_block_by_id(target_id, org_id),
+            asyncio.sleep(0, result={}) if is_page_link
+            else self._get_block_link_graph(org_id, [target_id])
+        )
+
         # Validate organization isolation - verify source block exists and belongs to org
-        source_block = await self._get_block_by_id(source_block_id, org_id)
         if not source_block:
             raise ValueError(f"Source block {source_block_id} not found or does not belong to organization")
 
         # Validate target exists and belongs to org
-        if is_page_link:
-            target = await self.get_page(target_id, org_id)
-            if not target:
+        if not target:
+            if is_page_link:
                 raise ValueError(f"Target page {target_id} not found or does not belong to organization")
-        else:
-            target = await self._get_block_by_id(target_id, org_id)
-            if not target:
-                raise ValueError(f"Target block {target_id} not found or does not belong to organization")
+            raise ValueError(f"Target block {target_id} not found or does not belong to organization")
 
         # Prevent circular references (only for block-to-block links)
         if not is_page_link:
-            has_circular = await self._has_circular_reference(
-                source_block_id, target_id, org_id
-            )
-            if has_circular:
+            if self._has_circular_reference(source_block_id, target_id, link_graph):
                 raise ValueError(
                     f"Circular reference detected: target block {target_id} "
                     f"already links to source block {source_block_id}"
@@ -1441,13 +1566,13 @@ class OceanService:
         }
 
         # Insert into ocean_block_links table
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/rows",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": link_doc
-                },
+                }),
                 timeout=30.0
             )
 
@@ -1455,59 +1580,192 @@ class OceanService:
                 raise Exception(f"Failed to create link: {response.status_code} - {response.text}")
 
             # Save row_id from response for future operations
-            result = response.json()
+            result = self._decode_json(response)
             link_doc["row_id"] = result["row_id"]
 
         return link_doc
 
-    async def delete_link(
+    @_invalidates_after_write("_backlink_cache")
+    async def create_link_batch(
         self,
-        link_id: str,
-        org_id: str
-    ) -> bool:
+        org_id: str,
+        links_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """
-        Delete a link by ID.
+        Bulk create multiple links with a single insert.
+
+        Every source and target is looked up once (concurrently) and the org's
+        link graph is loaded once, so circular references are checked against
+        existing links and earlier links in the same batch.
 
         Args:
-            link_id: Link ID to delete
             org_id: Organization ID (multi-tenant isolation)
+            links_list: List of link data dictionaries with source_block_id,
+                        target_id, link_type and optional is_page_link
+                        (same meaning as the create_link arguments)
+                        Maximum 500 links per batch
 
         Returns:
-            True if link was deleted, False if not found or wrong organization
+            List of complete link documents with generated link_ids
+
+        Raises:
+            ValueError: If circular reference detected, invalid parameters or
+                        batch size exceeds limit
+            Exception: If the links needed for the circular reference check
+                       cannot be loaded
         """
-        # Verify link exists and belongs to organization
-        existing_link = await self._get_link_by_id(link_id, org_id)
-        if not existing_link:
-            return False
+        if not links_list:
+            return []
 
-        # Step 1: Query to get row_id
-        async with httpx.AsyncClient() as client:
-            query_response = await client.post(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/query",
-                headers=self.headers,
-                json={
-                    "filter": {
-                        "link_id": link_id,
-                        "organization_id": org_id
-                    },
-                    "limit": 1,
-                    "skip": 0
-                },
-                timeout=30.0
+        # Validate batch size
+        if len(links_list) > 500:
+            raise ValueError(
+                f"Batch size {len(links_list)} exceeds maximum limit of 500 links. "
+                "Split large imports into multiple batches."
             )
 
-            if query_response.status_code != 200:
-                return False
-
-            query_result = query_response.json()
-            rows = query_result.get("data", [])
-            if not rows:
-                return False
+        valid_link_types = ["reference", "embed", "mention"]
+        for idx, link_data in enumerate(links_list):
+            if link_data.get("link_type") not in valid_link_types:
+                raise ValueError(
+                    f"Invalid link_type for link at index {idx}. Must be one of: {valid_link_types}"
+                )
 
-            row_id = rows[0]["row_id"]
+        # Cached backlinks for this org are now stale
+        self._backlink_cache.invalidate(org_id)
+
+        # Look up every distinct block and page once, plus the links reachable
+        # from the block targets if any block-to-block link needs a cycle check
+        # (a cycle through an earlier link of the batch continues at that
+        # link's target, so the batch's targets cover every path)
+        target_block_ids = [
+            link_data["target_id"] for link_data in links_list if not link_data.get("is_page_link")
+        ]
+        block_ids = list(dict.fromkeys(
+            [link_data["source_block_id"] for link_data in links_list] + target_block_ids
+        ))
+        page_ids = list(dict.fromkeys(
+            link_data["target_id"] for link_data in links_list if link_data.get("is_page_link")
+        ))
+        results = await asyncio.gather(
+            *(self._get_block_by_id(block_id, org_id) for block_id in block_ids),
+            *(self.get_page(page_id, org_id) for page_id in page_ids),
+            self._get_block_link_graph(org_id, target_block_ids) if target_block_ids
+            else asyncio.sleep(0, result={})
+        )
+        found_blocks = {block_id for block_id, block in zip(block_ids, results) if block}
+        found_pages = {
+            page_id for page_id, page in zip(page_ids, results[len(block_ids):]) if page
+        }
+        link_graph = results[-1]
 
-        # Step 2: Delete by row_id
-        async with httpx.AsyncClient() as client:
+        now = datetime.utcnow().isoformat()
+        link_docs = []
+        for link_data in links_list:
+            source_block_id = link_data["source_block_id"]
+            target_id = link_data["target_id"]
+            is_page_link = link_data.get("is_page_link", False)
+
+            # Validate organization isolation for source and target
+            if source_block_id not in found_blocks:
+                raise ValueError(f"Source block {source_block_id} not found or does not belong to organization")
+            if is_page_link and target_id not in found_pages:
+                raise ValueError(f"Target page {target_id} not found or does not belong to organization")
+            if not is_page_link and target_id not in found_blocks:
+                raise ValueError(f"Target block {target_id} not found or does not belong to organization")
+
+            # Prevent circular references (only for block-to-block links)
+            if not is_page_link:
+                if self._has_circular_reference(source_block_id, target_id, link_graph):
+                    raise ValueError(
+                        f"Circular reference detected: target block {target_id} "
+                        f"already links to source block {source_block_id}"
+                    )
+                link_graph.setdefault(source_block_id, []).append(target_id)
+
+            link_docs.append({
+                "link_id": str(uuid.uuid4()),
+                "organization_id": org_id,  # Multi-tenant isolation
+                "source_block_id": source_block_id,
+                "target_block_id": None if is_page_link else target_id,
+                "target_page_id": target_id if is_page_link else None,
+                "link_type": link_data["link_type"],
+                "created_at": now
+            })
+
+        # Batch insert into ZeroDB
+        async with self._http_client() as client:
+            response = await client.post(
+                f"{self.api_url}/v1/public/zerodb/mcp/execute",
+                headers=self.headers,
+                content=self._encode_json({
+                    "operation": "insert_rows",
+                    "params": {
+                        "project_id": self.project_id,
+                        "table_name": self.links_table_name,
+                        "rows": link_docs
+                    }
+                }),
+                timeout=60.0  # Longer timeout for batch operations
+            )
+
+            if response.status_code != 200:
+                raise Exception(f"Failed to batch insert links: {response.status_code} - {response.text}")
+
+        return link_docs
+
+    @_invalidates_after_write("_backlink_cache")
+    async def delete_link(
+        self,
+        link_id: str,
+        org_id: str
+    ) -> bool:
+        """
+        Delete a link by ID.
+
+        Args:
+            link_id: Link ID to delete
+            org_id: Organization ID (multi-tenant isolation)
+
+        Returns:
+            True if link was deleted, False if not found or wrong organization
+        """
+        # Cached backlinks for this org are now stale
+        self._backlink_cache.invalidate(org_id)
+
+        # Verify link exists and belongs to organization
+        existing_link = await self._get_link_by_id(link_id, org_id)
+        if not existing_link:
+            return False
+
+        # Step 1: Query to get row_id
+        async with self._http_client() as client:
+            query_response = await client.post(
+                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/query",
+                headers=self.headers,
+                content=self._encode_json({
+                    "filter": {
+                        "link_id": link_id,
+                        "organization_id": org_id
+                    },
+                    "limit": 1,
+                    "skip": 0
+                }),
+                timeout=30.0
+            )
+
+            if query_response.status_code != 200:
+                return False
+
+            query_result = self._decode_json(query_response)
+            rows = query_result.get("data", [])
+            if not rows:
+                return False
+
+            row_id = rows[0]["row_id"]
+
+        # Step 2: Delete by row_id
+        async with self._http_client() as client:
             delete_response = await client.delete(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/rows/{row_id}",
                 headers=self.headers,
@@ -1531,51 +1789,42 @@ class OceanService:
         Returns:
             List of backlink information with source details
         """
+        key = self._backlink_cache.key(org_id, {"target_page_id": page_id})
+        cached = self._backlink_cache.get(key)
+        if cached is not None:
+            return cached
+        generation = self._backlink_cache.generation(org_id)
+
         # Verify page exists and belongs to organization
         page = await self.get_page(page_id, org_id)
         if not page:
             return []
 
         # Query links where target_page_id matches
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "target_page_id": page_id,
                         "organization_id": org_id
                     },
                     "limit": 1000,
                     "skip": 0
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return []
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
             links = [row.get("row_data") for row in rows]
 
-        # Enrich with source block information
-        backlinks = []
-        for link in links:
-            source_block = await self._get_block_by_id(
-                link["source_block_id"], org_id
-            )
-            if source_block:
-                backlinks.append({
-                    "link_id": link["link_id"],
-                    "link_type": link["link_type"],
-                    "source_block_id": link["source_block_id"],
-                    "source_page_id": source_block.get("page_id"),
-                    "source_block_type": source_block.get("block_type"),
-                    "source_content_preview": self._get_content_preview(source_block),
-                    "created_at": link["created_at"]
-                })
-
+        backlinks = await self._enrich_backlinks(links, org_id)
+        self._backlink_cache.put(key, backlinks, generation)
         return backlinks
 
     async def get_block_backlinks(
@@ -1593,51 +1842,42 @@ class OceanService:
         Returns:
             List of backlink information with source details
         """
+        key = self._backlink_cache.key(org_id, {"target_block_id": block_id})
+        cached = self._backlink_cache.get(key)
+        if cached is not None:
+            return cached
+        generation = self._backlink_cache.generation(org_id)
+
         # Verify block exists and belongs to organization
         block = await self._get_block_by_id(block_id, org_id)
         if not block:
             return []
 
         # Query links where target_block_id matches
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "target_block_id": block_id,
                         "organization_id": org_id
                     },
                     "limit": 1000,
                     "skip": 0
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return []
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
             links = [row.get("row_data") for row in rows]
 
-        # Enrich with source block information
-        backlinks = []
-        for link in links:
-            source_block = await self._get_block_by_id(
-                link["source_block_id"], org_id
-            )
-            if source_block:
-                backlinks.append({
-                    "link_id": link["link_id"],
-                    "link_type": link["link_type"],
-                    "source_block_id": link["source_block_id"],
-                    "source_page_id": source_block.get("page_id"),
-                    "source_block_type": source_block.get("block_type"),
-                    "source_content_preview": self._get_content_preview(source_block),
-                    "created_at": link["created_at"]
-                })
-
+        backlinks = await self._enrich_backlinks(links, org_id)
+        self._backlink_cache.put(key, backlinks, generation)
         return backlinks
 
     # ========================================================================
@@ -1678,6 +1918,58 @@ class OceanService:
 
         return ""
 
+    def _get_searchable_text_lower(self, block: Dict[str, Any]) -> str:
+        """
+        Get a block's lower-cased searchable text for text matching.
+
+        Blocks written since searchable_text was introduced carry it precomputed;
+        older rows fall back to extracting it on the fly.
+
+        Args:
+            block: Block document
+
+        Returns:
+            Lower-cased searchable text, or empty string if none
+        """
+        searchable_text = block.get("searchable_text")
+        if isinstance(searchable_text, str):
+            return searchable_text
+        return self._extract_searchable_text(block).lower()
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        """
+        Hash a block's searchable text, ignoring case and surrounding whitespace.
+
+        Texts with equal hashes embed identically, so an update that keeps the
+        hash keeps the block's embedding.
+
+        Args:
+            text: Searchable text
+
+        Returns:
+            Hex digest of the normalized text
+        """
+        return EmbeddingCache.key(text)
+
+    def _get_text_hash(self, block: Dict[str, Any]) -> str:
+        """
+        Get the searchable-text hash of a stored block.
+
+        Blocks written since text_hash was introduced carry it precomputed;
+        older rows fall back to hashing their extracted text.
+
+        Args:
+            block: Block document
+
+        Returns:
+            Hex digest of the block's normalized searchable text
+        """
+        text_hash = block.get("text_hash")
+        if isinstance(text_hash, str):
+            return text_hash
+        return self._text_hash(self._extract_searchable_text(block))
+
     async def _generate_and_store_embedding(
         self,
         text: str,
@@ -1702,11 +1994,11 @@ class OceanService:
         Raises:
             Exception: If embedding generation fails
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/{self.project_id}/embeddings/embed-and-store",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "texts": [text],
                     "model": "BAAI/bge-base-en-v1.5",
                     "namespace": "ocean_blocks",
@@ -1716,14 +2008,14 @@ class OceanService:
                         "page_id": page_id,
                         "organization_id": org_id
                     }]
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 raise Exception(f"Failed to generate embedding: {response.status_code} - {response.text}")
 
-            result = response.json()
+            result = self._decode_json(response)
             vector_ids = result.get("vector_ids", [])
             if not vector_ids:
                 raise Exception("No vector_ids returned from embedding generation")
@@ -1738,33 +2030,48 @@ class OceanService:
         """
         Batch generate and store embeddings for multiple texts.
 
+        Texts are sent in one embed-and-store request per
+        EMBEDDING_STORE_BATCH_SIZE texts (a single request for typical
+        batches); larger batches are split and the chunks sent concurrently.
+
         Args:
             texts: List of texts to embed
             metadata_list: List of metadata dictionaries (one per text)
 
         Returns:
-            List of vector IDs from ZeroDB
+            List of vector IDs from ZeroDB, in the order of texts
 
         Raises:
             Exception: If embedding generation fails
         """
-        async with httpx.AsyncClient() as client:
+        size = self.EMBEDDING_STORE_BATCH_SIZE
+        if len(texts) > size:
+            chunks = await asyncio.gather(*(
+                self._generate_and_store_embeddings_batch(
+                    texts[i:i + size],
+                    metadata_list[i:i + size]
+                )
+                for i in range(0, len(texts), size)
+            ))
+            return [vector_id for chunk in chunks for vector_id in chunk]
+
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/{self.project_id}/embeddings/embed-and-store",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "texts": texts,
                     "model": "BAAI/bge-base-en-v1.5",
                     "namespace": "ocean_blocks",
                     "metadata": metadata_list
-                },
+                }),
                 timeout=60.0  # Longer timeout for batch
             )
 
             if response.status_code != 200:
                 raise Exception(f"Failed to batch generate embeddings: {response.status_code} - {response.text}")
 
-            result = response.json()
+            result = self._decode_json(response)
             vector_ids = result.get("vector_ids", [])
             if len(vector_ids) != len(texts):
                 raise Exception(f"Expected {len(texts)} vector_ids, got {len(vector_ids)}")
@@ -1781,24 +2088,132 @@ class OceanService:
         Raises:
             Exception: If deletion fails
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/public/zerodb/mcp/execute",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "operation": "delete_vector",
                     "params": {
                         "project_id": self.project_id,
                         "vector_id": vector_id,
                         "namespace": "ocean_blocks"
                     }
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 raise Exception(f"Failed to delete embedding: {response.status_code} - {response.text}")
 
+    async def _write_block_update(
+        self,
+        block: Dict[str, Any],
+        org_id: str,
+        update_payload: Dict[str, Any],
+        new_text: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        PATCH a block's row, swapping its embedding if new_text is given.
+
+        The row_id is resolved first, so nothing is embedded for a block that
+        no longer exists. The old vector is deleted only once the row points at
+        the new one; if the PATCH fails the new vector is deleted instead.
+        Embedding failures are non-critical: they are logged and the block
+        keeps its vector fields.
+
+        Args:
+            block: Existing block document
+            org_id: Organization ID (multi-tenant isolation)
+            update_payload: Fields to write (vector fields are added to it)
+            new_text: New searchable text to embed (empty: the block gets no
+                embedding), or None to keep the current embedding
+
+        Returns:
+            Updated block document, or None if the block was not found or the
+            update failed
+        """
+        row_id = await self._get_block_row_id(block["block_id"], org_id)
+        if row_id is None:
+            return None
+
+        vector_fields: Dict[str, Any] = {}
+        if new_text == "":
+            # No searchable text in new content
+            vector_fields = {"vector_id": None, "vector_dimensions": None}
+        elif new_text is not None:
+            try:
+                vector_id = await self._generate_and_store_embedding(
+                    text=new_text,
+                    block_id=block["block_id"],
+                    block_type=update_payload.get("block_type", block["block_type"]),
+                    page_id=block["page_id"],
+                    org_id=org_id
+                )
+                vector_fields = {"vector_id": vector_id, "vector_dimensions": 768}
+            except Exception as e:
+                # Non-critical: continue without embedding update
+                print(f"WARNING: Failed to regenerate embedding for block {block['block_id']}: {e}")
+        update_payload.update(vector_fields)
+
+        updated = None
+        try:
+            # Update in ZeroDB by row_id
+            async with self._http_client() as client:
+                response = await client.patch(
+                    f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{row_id}",
+                    headers=self.headers,
+                    content=self._encode_json({
+                        "row_data": update_payload
+                    }),
+                    timeout=30.0
+                )
+
+                if response.status_code == 200:
+                    updated = self._decode_json(response).get("row_data")
+        finally:
+            # Delete whichever vector the row no longer references
+            if vector_fields:
+                stale_vector_id = block.get("vector_id") if updated is not None else vector_fields["vector_id"]
+                if stale_vector_id:
+                    try:
+                        await self._delete_embedding(stale_vector_id)
+                    except Exception as e:
+                        print(f"WARNING: Failed to delete embedding {stale_vector_id} for block {block['block_id']}: {e}")
+
+        return updated
+
+    async def _get_block_row_id(self, block_id: str, org_id: str) -> Optional[str]:
+        """
+        Look up the ZeroDB row_id of a block (needed to update it).
+
+        Args:
+            block_id: Block ID
+            org_id: Organization ID (multi-tenant isolation)
+
+        Returns:
+            Row ID, or None if the block is not found
+        """
+        async with self._http_client() as client:
+            response = await client.post(
+                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
+                headers=self.headers,
+                content=self._encode_json({
+                    "filter": {
+                        "block_id": block_id,
+                        "organization_id": org_id
+                    },
+                    "limit": 1
+                }),
+                timeout=30.0
+            )
+
+            if response.status_code != 200:
+                return None
+
+            rows = self._decode_json(response).get("data", [])
+            return rows[0]["row_id"] if rows else None
+
     async def _get_next_block_position(
         self,
         page_id: str,
@@ -1876,6 +2291,7 @@ class OceanService:
 
     # Tag Management Methods
 
+    @_invalidates_after_write("_tag_cache")
     async def create_tag(
         self,
         org_id: str,
@@ -1903,8 +2319,11 @@ class OceanService:
         if not tag_data.get("name"):
             raise ValueError("name is required")
 
+        # Cached tag lists for this org are now stale
+        self._tag_cache.invalidate(org_id)
+
         # Validate tag name uniqueness within organization
-        existing_tags = await self.get_tags(org_id, {"name": tag_data["name"]})
+        existing_tags = await self._query_tags(org_id, {"name": tag_data["name"]}) or []
         if existing_tags:
             raise ValueError(f"Tag '{tag_data['name']}' already exists in this organization")
 
@@ -1925,13 +2344,13 @@ class OceanService:
         }
 
         # Insert into ZeroDB
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/rows",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": tag_doc
-                },
+                }),
                 timeout=30.0
             )
 
@@ -1939,7 +2358,7 @@ class OceanService:
                 raise Exception(f"Failed to create tag: {response.status_code} - {response.text}")
 
             # Extract row_id from response
-            result = response.json()
+            result = self._decode_json(response)
             tag_doc["row_id"] = result["row_id"]
 
         return tag_doc
@@ -1962,6 +2381,38 @@ class OceanService:
         Returns:
             List of tag documents sorted by usage_count (descending)
         """
+        key = self._tag_cache.key(org_id, filters)
+        cached = self._tag_cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = self._tag_cache.generation(org_id)
+        rows = await self._query_tags(org_id, filters)
+        if rows is None:
+            return []
+
+        self._tag_cache.put(key, rows, generation)
+        return rows
+
+    async def _query_tags(
+        self,
+        org_id: str,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Query tags from ZeroDB, bypassing the tag cache.
+
+        Tag writes use this for their existence, uniqueness and usage-count
+        reads, which must not see stale data.
+
+        Args:
+            org_id: Organization ID (multi-tenant isolation)
+            filters: Optional filters (see get_tags)
+
+        Returns:
+            List of tag documents sorted by usage_count (descending), or None
+            if the query failed
+        """
         # Build query filters
         query_filters = {"organization_id": org_id}
 
@@ -1973,22 +2424,22 @@ class OceanService:
                 query_filters["color"] = filters["color"]
 
         # Query tags
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": query_filters,
                     "skip": 0,
                     "limit": 1000  # Reasonable limit for tags
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
-                return []
+                return None
 
-            result = response.json()
+            result = self._decode_json(response)
             rows_data = result.get("data", [])
             rows = [row.get("row_data") for row in rows_data]
 
@@ -2001,6 +2452,38 @@ class OceanService:
 
             return rows
 
+    def _cache_tag_update(
+        self,
+        org_id: str,
+        tags: List[Dict[str, Any]],
+        tag_id: str,
+        tag_update: Dict[str, Any],
+        generation: int
+    ) -> None:
+        """
+        Cache an organization's tag list with one tag's fields updated.
+
+        assign_tag_to_block and remove_tag_from_block already hold the fresh,
+        unfiltered tag list, so the get_tags call that usually follows them is
+        answered from the cache instead of another query.
+
+        Args:
+            org_id: Organization ID
+            tags: Tag list from _query_tags (not modified)
+            tag_id: Tag that was updated
+            tag_update: Fields written to the tag
+            generation: Tag cache generation the list is valid for: the one
+                taken before tags was queried, plus the write's own
+                invalidation after its PATCH
+        """
+        rows = [
+            {**tag, **tag_update} if tag.get("tag_id") == tag_id else tag
+            for tag in tags
+        ]
+        rows.sort(key=lambda r: r.get("usage_count", 0), reverse=True)
+        self._tag_cache.put(self._tag_cache.key(org_id), rows, generation)
+
+    @_invalidates_after_write("_tag_cache")
     async def update_tag(
         self,
         tag_id: str,
@@ -2024,15 +2507,18 @@ class OceanService:
         Raises:
             ValueError: If new name conflicts with existing tag
         """
+        # Cached tag lists for this org are now stale
+        self._tag_cache.invalidate(org_id)
+
         # Verify tag exists and belongs to organization
-        existing_tags = await self.get_tags(org_id)
+        existing_tags = await self._query_tags(org_id) or []
         existing_tag = next((t for t in existing_tags if t.get("tag_id") == tag_id), None)
         if not existing_tag:
             return None
 
         # Check name uniqueness if updating name
         if "name" in updates and updates["name"] != existing_tag.get("name"):
-            conflicting_tags = await self.get_tags(org_id, {"name": updates["name"]})
+            conflicting_tags = await self._query_tags(org_id, {"name": updates["name"]}) or []
             if conflicting_tags:
                 raise ValueError(f"Tag '{updates['name']}' already exists in this organization")
 
@@ -2048,25 +2534,25 @@ class OceanService:
                 update_payload[field] = updates[field]
 
         # Update in ZeroDB (2-step: query then update)
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             # Step 1: Query to get row_id
             query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "tag_id": tag_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if query_response.status_code != 200:
                 return None
 
-            query_result = query_response.json()
+            query_result = self._decode_json(query_response)
             rows = query_result.get("data", [])
             if not rows:
                 return None
@@ -2077,9 +2563,9 @@ class OceanService:
             update_response = await client.patch(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/rows/{row_id}",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": update_payload
-                },
+                }),
                 timeout=30.0
             )
 
@@ -2087,9 +2573,10 @@ class OceanService:
                 return None
 
             # Return updated row_data
-            result = update_response.json()
+            result = self._decode_json(update_response)
             return result.get("row_data")
 
+    @_invalidates_after_write("_result_cache", "_tag_cache")
     async def delete_tag(
         self,
         tag_id: str,
@@ -2105,8 +2592,12 @@ class OceanService:
         Returns:
             True if tag was deleted, False if not found or wrong organization
         """
+        # Cached search results and tag lists for this org are now stale
+        self._result_cache.invalidate(org_id)
+        self._tag_cache.invalidate(org_id)
+
         # Verify tag exists and belongs to organization
-        existing_tags = await self.get_tags(org_id)
+        existing_tags = await self._query_tags(org_id) or []
         existing_tag = next((t for t in existing_tags if t.get("tag_id") == tag_id), None)
         if not existing_tag:
             return False
@@ -2117,25 +2608,25 @@ class OceanService:
         # For now, just delete the tag document
 
         # Delete tag from ZeroDB (2-step: query then delete)
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             # Step 1: Query to get row_id
             query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "tag_id": tag_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if query_response.status_code != 200:
                 return False
 
-            query_result = query_response.json()
+            query_result = self._decode_json(query_response)
             rows = query_result.get("data", [])
             if not rows:
                 return False
@@ -2151,6 +2642,7 @@ class OceanService:
 
             return delete_response.status_code == 204
 
+    @_invalidates_after_write("_result_cache")
     async def assign_tag_to_block(
         self,
         block_id: str,
@@ -2171,31 +2663,36 @@ class OceanService:
         Raises:
             ValueError: If block or tag don't belong to organization
         """
+        # Cached search results and tag lists for this org are now stale
+        self._result_cache.invalidate(org_id)
+        self._tag_cache.invalidate(org_id)
+        generation = self._tag_cache.generation(org_id)
+
         # Verify tag exists and belongs to organization
-        existing_tags = await self.get_tags(org_id)
+        existing_tags = await self._query_tags(org_id) or []
         existing_tag = next((t for t in existing_tags if t.get("tag_id") == tag_id), None)
         if not existing_tag:
             raise ValueError(f"Tag {tag_id} not found or does not belong to organization")
 
         # Get block to verify it exists and belongs to organization
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "block_id": block_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 raise ValueError(f"Block {block_id} not found or does not belong to organization")
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
             if not rows:
                 raise ValueError(f"Block {block_id} not found")
@@ -2219,12 +2716,12 @@ class OceanService:
             update_response = await client.patch(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{block_row_id}",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": {
                         "properties": properties,
                         "updated_at": datetime.utcnow().isoformat()
                     }
-                },
+                }),
                 timeout=30.0
             )
 
@@ -2235,35 +2732,45 @@ class OceanService:
             tag_query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "tag_id": tag_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if tag_query_response.status_code == 200:
-                tag_result = tag_query_response.json()
+                tag_result = self._decode_json(tag_query_response)
                 tag_rows = tag_result.get("data", [])
                 if tag_rows:
                     tag_row_id = tag_rows[0]["row_id"]
-                    await client.patch(
-                        f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/rows/{tag_row_id}",
-                        headers=self.headers,
-                        json={
-                            "row_data": {
-                                "usage_count": existing_tag.get("usage_count", 0) + 1,
-                                "updated_at": datetime.utcnow().isoformat()
-                            }
-                        },
-                        timeout=30.0
-                    )
+                    tag_update = {
+                        "usage_count": existing_tag.get("usage_count", 0) + 1,
+                        "updated_at": datetime.utcnow().isoformat()
+                    }
+                    try:
+                        tag_update_response = await client.patch(
+                            f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/rows/{tag_row_id}",
+                            headers=self.headers,
+                            content=self._encode_json({
+                                "row_data": tag_update
+                            }),
+                            timeout=30.0
+                        )
+                    finally:
+                        # Tag lists read while the PATCH was in flight are stale
+                        self._tag_cache.invalidate(org_id)
+                    if tag_update_response.status_code == 200:
+                        # Cached only if that invalidation is the sole one since
+                        # existing_tags was queried (no other tag write ran)
+                        self._cache_tag_update(org_id, existing_tags, tag_id, tag_update, generation + 1)
 
             return True
 
+    @_invalidates_after_write("_result_cache")
     async def remove_tag_from_block(
         self,
         block_id: str,
@@ -2284,31 +2791,36 @@ class OceanService:
         Raises:
             ValueError: If block or tag don't belong to organization
         """
+        # Cached search results and tag lists for this org are now stale
+        self._result_cache.invalidate(org_id)
+        self._tag_cache.invalidate(org_id)
+        generation = self._tag_cache.generation(org_id)
+
         # Verify tag exists and belongs to organization
-        existing_tags = await self.get_tags(org_id)
+        existing_tags = await self._query_tags(org_id) or []
         existing_tag = next((t for t in existing_tags if t.get("tag_id") == tag_id), None)
         if not existing_tag:
             raise ValueError(f"Tag {tag_id} not found or does not belong to organization")
 
         # Get block to verify it exists and belongs to organization
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "block_id": block_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 raise ValueError(f"Block {block_id} not found or does not belong to organization")
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
             if not rows:
                 raise ValueError(f"Block {block_id} not found")
@@ -2332,12 +2844,12 @@ class OceanService:
             update_response = await client.patch(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/rows/{block_row_id}",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "row_data": {
                         "properties": properties,
                         "updated_at": datetime.utcnow().isoformat()
                     }
-                },
+                }),
                 timeout=30.0
             )
 
@@ -2349,35 +2861,114 @@ class OceanService:
             tag_query_response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "tag_id": tag_id,
                         "organization_id": org_id
                     },
                     "limit": 1
-                },
+                }),
                 timeout=30.0
             )
 
             if tag_query_response.status_code == 200:
-                tag_result = tag_query_response.json()
+                tag_result = self._decode_json(tag_query_response)
                 tag_rows = tag_result.get("data", [])
                 if tag_rows:
                     tag_row_id = tag_rows[0]["row_id"]
-                    await client.patch(
-                        f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/rows/{tag_row_id}",
-                        headers=self.headers,
-                        json={
-                            "row_data": {
-                                "usage_count": new_usage_count,
-                                "updated_at": datetime.utcnow().isoformat()
-                            }
-                        },
-                        timeout=30.0
-                    )
+                    tag_update = {
+                        "usage_count": new_usage_count,
+                        "updated_at": datetime.utcnow().isoformat()
+                    }
+                    try:
+                        tag_update_response = await client.patch(
+                            f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.tags_table_name}/rows/{tag_row_id}",
+                            headers=self.headers,
+                            content=self._encode_json({
+                                "row_data": tag_update
+                            }),
+                            timeout=30.0
+                        )
+                    finally:
+                        # Tag lists read while the PATCH was in flight are stale
+                        self._tag_cache.invalidate(org_id)
+                    if tag_update_response.status_code == 200:
+                        # Cached only if that invalidation is the sole one since
+                        # existing_tags was queried (no other tag write ran)
+                        self._cache_tag_update(org_id, existing_tags, tag_id, tag_update, generation + 1)
 
             return True
 
+    # ========================================================================
+    # ORGANIZATION DATA CLEANUP
+    # ========================================================================
+
+    @_invalidates_after_write("_result_cache", "_tag_cache", "_backlink_cache")
+    async def bulk_delete_by_org(self, table_name: str, org_id: str) -> int:
+        """
+        Permanently delete every row of an organization from one table.
+
+        Intended for test teardown. Rows are listed with one query per page of
+        BULK_DELETE_PAGE_SIZE and deleted by row_id, at most
+        BULK_DELETE_CONCURRENCY at a time (ZeroDB's MCP delete_rows with a
+        filter is not supported). Embedding vectors are not removed.
+
+        Args:
+            table_name: ZeroDB table (e.g. ocean_tags, ocean_blocks, ocean_pages)
+            org_id: Organization ID whose rows are deleted
+
+        Returns:
+            Number of rows deleted
+
+        Raises:
+            ValueError: If org_id is empty
+        """
+        if not org_id:
+            raise ValueError("organization_id is required")
+
+        # Cached search results, tag lists and backlinks for this org are now stale
+        self._result_cache.invalidate(org_id)
+        self._tag_cache.invalidate(org_id)
+        self._backlink_cache.invalidate(org_id)
+
+        semaphore = asyncio.Semaphore(self.BULK_DELETE_CONCURRENCY)
+
+        async def delete_row(client: httpx.AsyncClient, row_id: str) -> httpx.Response:
+            async with semaphore:
+                return await client.delete(
+                    f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{table_name}/rows/{row_id}",
+                    headers=self.headers,
+                    timeout=30.0
+                )
+
+        deleted = 0
+        async with self._http_client() as client:
+            while True:
+                response = await client.post(
+                    f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{table_name}/query",
+                    headers=self.headers,
+                    content=self._encode_json({
+                        "filter": {"organization_id": org_id},
+                        "limit": self.BULK_DELETE_PAGE_SIZE,
+                        "skip": 0
+                    }),
+                    timeout=30.0
+                )
+
+                if response.status_code != 200:
+                    return deleted
+
+                rows = self._decode_json(response).get("data", [])
+                responses = await asyncio.gather(*(
+                    delete_row(client, row["row_id"]) for row in rows
+                ))
+                deleted_now = sum(1 for r in responses if r.status_code == 204)
+                deleted += deleted_now
+
+                # Stop on the last page, or if nothing could be deleted
+                if len(rows) < self.BULK_DELETE_PAGE_SIZE or not deleted_now:
+                    return deleted
+
     # Helper methods
 
     async def _get_next_position(
@@ -2403,11 +2994,11 @@ class OceanService:
         # For root pages, don't filter by parent_page_id - we'll filter in memory
 
         # Query existing pages
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/public/zerodb/mcp/execute",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "operation": "query_rows",
                     "params": {
                         "project_id": self.project_id,
@@ -2415,14 +3006,14 @@ class OceanService:
                         "filter": filters,
                         "limit": 1000  # Reasonable limit for siblings
                     }
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return 0
 
-            result = response.json()
+            result = self._decode_json(response)
             # MCP bridge returns: {"success": True, "result": {"rows": [...]}}
             if not result.get("success"):
                 return 0
@@ -2440,77 +3031,138 @@ class OceanService:
     # PRIVATE HELPER METHODS FOR LINKS
     # ========================================================================
 
-    async def _has_circular_reference(
+    async def _get_block_link_graph(
         self,
-        source_block_id: str,
-        target_block_id: str,
         org_id: str,
-        visited: Optional[set] = None
-    ) -> bool:
+        block_ids: List[str]
+    ) -> Dict[str, List[str]]:
         """
-        Check if creating a link would create a circular reference.
+        Load the block-to-block links reachable from some blocks.
 
-        Uses recursive traversal to detect if target_block_id already
-        links (directly or indirectly) to source_block_id.
+        Links are walked breadth-first from block_ids: each depth level is one
+        round of concurrent queries, one per newly reached block (ZeroDB
+        filters don't support IN). Only blocks a new link could loop back
+        through are read, not the organization's whole link table.
 
         Args:
-            source_block_id: Block that will contain the new link
-            target_block_id: Block that will be linked to
             org_id: Organization ID
-            visited: Set of visited block IDs (for recursion tracking)
+            block_ids: Blocks to start from (the targets of the new links)
 
         Returns:
-            True if circular reference detected, False if safe
+            source_block_id -> list of linked target_block_ids, for every
+            reached block that has links
+
+        Raises:
+            Exception: If a query fails or more than LINK_GRAPH_MAX_BLOCKS
+                blocks are reachable, so the cycle check cannot be completed
         """
-        if visited is None:
-            visited = set()
+        graph: Dict[str, List[str]] = {}
+        level = list(dict.fromkeys(block_ids))
+        visited = set(level)
+        async with self._http_client() as client:
+            while level:
+                linked_ids = await asyncio.gather(*(
+                    self._get_linked_block_ids(client, block_id, org_id) for block_id in level
+                ))
+                next_level = []
+                for block_id, targets in zip(level, linked_ids):
+                    if targets:
+                        graph[block_id] = targets
+                    for target_id in targets:
+                        if target_id not in visited:
+                            visited.add(target_id)
+                            next_level.append(target_id)
+
+                if len(visited) > self.LINK_GRAPH_MAX_BLOCKS:
+                    raise Exception(
+                        f"Cannot check link for cycles: more than {self.LINK_GRAPH_MAX_BLOCKS} linked blocks reachable"
+                    )
+                level = next_level
 
-        # Prevent infinite loops
-        if target_block_id in visited:
-            return False
+        return graph
+
+    async def _get_linked_block_ids(
+        self,
+        client: httpx.AsyncClient,
+        block_id: str,
+        org_id: str
+    ) -> List[str]:
+        """
+        Get the blocks one block links to (block-to-block links only).
 
-        visited.add(target_block_id)
+        Args:
+            client: HTTP client to query through
+            block_id: Source block ID
+            org_id: Organization ID (multi-tenant isolation)
+
+        Returns:
+            Target block IDs of the block's links
 
-        # Query all links from target_block
-        async with httpx.AsyncClient() as client:
+        Raises:
+            Exception: If a query fails
+        """
+        linked: List[str] = []
+        skip = 0
+        while True:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
-                        "source_block_id": target_block_id,
+                        "source_block_id": block_id,
                         "organization_id": org_id
                     },
-                    "limit": 1000,
-                    "skip": 0
-                },
+                    "limit": self.LINK_GRAPH_PAGE_SIZE,
+                    "skip": skip
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
-                return False
+                raise Exception(f"Failed to load links of block {block_id}: {response.status_code} - {response.text}")
 
-            result = response.json()
-            rows = result.get("data", [])
-            links = [row.get("row_data") for row in rows]
+            rows = self._decode_json(response).get("data", [])
+            # Only block-to-block links can form cycles
+            linked.extend(
+                row["row_data"]["target_block_id"] for row in rows
+                if (row.get("row_data") or {}).get("target_block_id")
+            )
 
-        # Check if any link points back to source
-        for link in links:
-            # Only check block-to-block links
-            linked_block_id = link.get("target_block_id")
-            if not linked_block_id:
-                continue
+            if len(rows) < self.LINK_GRAPH_PAGE_SIZE:
+                return linked
+            skip += len(rows)
 
-            # Direct circular reference
-            if linked_block_id == source_block_id:
-                return True
+    @staticmethod
+    def _has_circular_reference(
+        source_block_id: str,
+        target_block_id: str,
+        link_graph: Dict[str, List[str]]
+    ) -> bool:
+        """
+        Check if creating a link would create a circular reference.
 
-            # Recursive check for indirect circular reference
-            if await self._has_circular_reference(
-                source_block_id, linked_block_id, org_id, visited
-            ):
-                return True
+        Runs an iterative depth-first search over the link graph to detect if
+        target_block_id already links (directly or indirectly) to
+        source_block_id.
+
+        Args:
+            source_block_id: Block that will contain the new link
+            target_block_id: Block that will be linked to
+            link_graph: Adjacency list from _get_block_link_graph
 
+        Returns:
+            True if circular reference detected, False if safe
+        """
+        stack = [target_block_id]
+        visited = set()
+        while stack:
+            block_id = stack.pop()
+            if block_id == source_block_id:
+                return True
+            if block_id in visited:
+                continue
+            visited.add(block_id)
+            stack.extend(link_graph.get(block_id, ()))
         return False
 
     async def _get_block_by_id(
@@ -2528,11 +3180,11 @@ class OceanService:
         Returns:
             Block document if found and belongs to organization, None otherwise
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/public/zerodb/mcp/execute",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "operation": "query_rows",
                     "params": {
                         "project_id": self.project_id,
@@ -2543,14 +3195,14 @@ class OceanService:
                         },
                         "limit": 1
                     }
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return None
 
-            result = response.json()
+            result = self._decode_json(response)
             if not result.get("success"):
                 return None
 
@@ -2572,25 +3224,25 @@ class OceanService:
         Returns:
             Link document if found and belongs to organization, None otherwise
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.links_table_name}/query",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "filter": {
                         "link_id": link_id,
                         "organization_id": org_id
                     },
                     "limit": 1,
                     "skip": 0
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 return None
 
-            result = response.json()
+            result = self._decode_json(response)
             rows = result.get("data", [])
             if not rows:
                 return None
@@ -2598,6 +3250,50 @@ class OceanService:
             # Return row_data with row_id included
             return rows[0].get("row_data")
 
+    async def _enrich_backlinks(
+        self,
+        links: List[Dict[str, Any]],
+        org_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Add source block details to backlinks (helper method for link operations).
+
+        Each distinct source block is fetched once, concurrently, and its
+        preview computed once, however many links it is the source of.
+        Links whose source block no longer exists are dropped.
+
+        Args:
+            links: Link documents pointing at one target
+            org_id: Organization ID
+
+        Returns:
+            List of backlink information with source details
+        """
+        source_ids = list(dict.fromkeys(link["source_block_id"] for link in links))
+        source_blocks = await asyncio.gather(*(
+            self._get_block_by_id(source_id, org_id) for source_id in source_ids
+        ))
+        sources = {
+            source_id: (block, self._get_content_preview(block))
+            for source_id, block in zip(source_ids, source_blocks) if block
+        }
+
+        backlinks = []
+        for link in links:
+            if link["source_block_id"] not in sources:
+                continue
+            source_block, preview = sources[link["source_block_id"]]
+            backlinks.append({
+                "link_id": link["link_id"],
+                "link_type": link["link_type"],
+                "source_block_id": link["source_block_id"],
+                "source_page_id": source_block.get("page_id"),
+                "source_block_type": source_block.get("block_type"),
+                "source_content_preview": preview,
+                "created_at": link["created_at"]
+            })
+        return backlinks
+
     def _get_content_preview(
         self,
         block: Dict[str, Any],
@@ -2685,20 +3381,70 @@ class OceanService:
         if filters is None:
             filters = {}
 
+        # Metadata search is filter-only: no embedding, nothing to cache
+        if search_type == "metadata":
+            return await self._search_metadata(query, org_id, filters, limit)
+
+        # Page-scoped hybrid search: load the page's blocks while the query is
+        # being embedded so enrichment can be served from memory instead of
+        # per-block fetches
+        page_blocks_task = None
+        if search_type == "hybrid" and "page_id" in filters:
+            page_blocks_task = asyncio.ensure_future(self.get_blocks_by_page(
+                filters["page_id"],
+                org_id,
+                pagination={"limit": 1000, "offset": 0}
+            ))
+
+        # Serve near-duplicate queries from the semantic result cache. Hybrid
+        # ranking boosts exact query-text matches, so hybrid results are only
+        # shared between searches for the same text.
+        try:
+            query_embedding = await self._generate_query_embedding(query)
+        except BaseException:
+            if page_blocks_task is not None:
+                page_blocks_task.cancel()
+            raise
+        namespace = self._result_cache.namespace(
+            org_id,
+            search_type=search_type,
+            filters=filters,
+            limit=limit,
+            threshold=threshold,
+            query=query if search_type == "hybrid" else None
+        )
+        cached = self._result_cache.lookup(namespace, query_embedding)
+        if cached is not None:
+            if page_blocks_task is not None:
+                page_blocks_task.cancel()
+            return cached
+        generation = self._result_cache.generation(org_id)
+
         # Route to appropriate search method
         if search_type == "semantic":
-            return await self._search_semantic(query, org_id, limit, threshold)
-        elif search_type == "metadata":
-            return await self._search_metadata(query, org_id, filters, limit)
+            results = await self._search_semantic(
+                query, org_id, limit, threshold, query_embedding=query_embedding
+            )
         else:  # hybrid
-            return await self._search_hybrid(query, org_id, filters, limit, threshold)
+            prefetched_blocks = None
+            if page_blocks_task is not None:
+                prefetched_blocks = {b["block_id"]: b for b in await page_blocks_task if b}
+            results = await self._search_hybrid(
+                query, org_id, filters, limit, threshold,
+                query_embedding=query_embedding,
+                prefetched_blocks=prefetched_blocks
+            )
+
+        self._result_cache.store(namespace, query_embedding, results, generation)
+        return results
 
     async def _search_semantic(
         self,
         query: str,
         org_id: str,
         limit: int,
-        threshold: float
+        threshold: float,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Pure semantic search using vector similarity.
@@ -2708,12 +3454,14 @@ class OceanService:
             org_id: Organization ID
             limit: Maximum results
             threshold: Minimum similarity score
+            query_embedding: Precomputed query embedding (generated if omitted)
 
         Returns:
             List of search results with similarity scores
         """
         # Generate embedding for query
-        query_embedding = await self._generate_query_embedding(query)
+        if query_embedding is None:
+            query_embedding = await self._generate_query_embedding(query)
 
         # Search vectors with organization filter
         metadata_filter = {"organization_id": org_id}
@@ -2753,65 +3501,64 @@ class OceanService:
         """
         # Build query filters
         query_filters = {"organization_id": org_id}
-
-        # Apply block type filter
-        if "block_types" in filters:
-            # Note: ZeroDB doesn't support IN queries yet, so we'll filter after retrieval
-            pass
+        block_types = filters.get("block_types") or []
+        date_range = filters.get("date_range") or {}
 
         # Apply page_id filter
         if "page_id" in filters:
             query_filters["page_id"] = filters["page_id"]
 
-        # Query all blocks for organization (or specific page)
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
-                headers=self.headers,
-                json={
-                    "filter": query_filters,
-                    "limit": 1000,  # Get all blocks, then filter in-memory
-                    "skip": 0
-                },
-                timeout=30.0
-            )
-
-            if response.status_code != 200:
+        # A single block type is a plain equality filter ZeroDB always supports
+        if len(block_types) == 1:
+            query_filters["block_type"] = block_types[0]
+
+        # IN / range operators trim the fetch further when the backend accepts them
+        pushdown_filters = dict(query_filters)
+        if len(block_types) > 1:
+            pushdown_filters["block_type__in"] = list(block_types)
+        if date_range.get("start"):
+            pushdown_filters["created_at__gte"] = date_range["start"]
+        if date_range.get("end"):
+            pushdown_filters["created_at__lte"] = date_range["end"]
+
+        blocks = None
+        if pushdown_filters != query_filters and self._filter_operators_supported:
+            blocks = await self._query_blocks_for_search(pushdown_filters)
+
+        # Fall back to the plain filter only when the operators were rejected; an
+        # empty result is a real answer. The in-memory predicates below still
+        # apply, so results are identical either way.
+        if blocks is None:
+            blocks = await self._query_blocks_for_search(query_filters)
+            if blocks is None:
                 return []
 
-            result = response.json()
-            rows = result.get("data", [])
-            # Extract row_data from each row
-            blocks = [row.get("row_data") for row in rows]
-
-        # Filter by block types if specified
-        if "block_types" in filters:
-            allowed_types = set(filters["block_types"])
-            blocks = [b for b in blocks if b.get("block_type") in allowed_types]
-
-        # Filter by tags if specified
-        if "tags" in filters:
-            required_tags = set(filters["tags"])
-            blocks = [
-                b for b in blocks
-                if any(tag in required_tags for tag in b.get("properties", {}).get("tags", []))
-            ]
-
-        # Filter by date range if specified
-        if "date_range" in filters:
-            start = filters["date_range"].get("start")
-            end = filters["date_range"].get("end")
-            blocks = self._filter_by_date_range(blocks, start, end)
+        # Filter predicates, evaluated in the same pass as text matching
+        allowed_types = set(filters["block_types"]) if "block_types" in filters else None
+        required_tags = set(filters["tags"]) if "tags" in filters else None
+        start = date_range.get("start")
+        end = date_range.get("end")
 
-        # Text matching against searchable content
+        # Single pass: filter by block type, tags and date range, then text-match
         query_lower = query.lower()
         matched_blocks = []
 
         for block in blocks:
-            searchable_text = self._extract_searchable_text(block).lower()
-            if query_lower in searchable_text:
-                # Calculate simple text match score based on position
-                position = searchable_text.find(query_lower)
+            if allowed_types is not None and block.get("block_type") not in allowed_types:
+                continue
+            if required_tags is not None and not any(
+                tag in required_tags for tag in block.get("properties", {}).get("tags", [])
+            ):
+                continue
+            if start or end:
+                created_at = block.get("created_at", "")
+                if (start and created_at < start) or (end and created_at > end):
+                    continue
+
+            searchable_text = self._get_searchable_text_lower(block)
+            # Single scan: find() both tests for a match and gives its position
+            position = searchable_text.find(query_lower)
+            if position != -1:
                 # Score: 1.0 if at start, decreases with position
                 score = max(0.5, 1.0 - (position / max(len(searchable_text), 1)))
 
@@ -2821,9 +3568,47 @@ class OceanService:
                     "match_type": "metadata"
                 })
 
-        # Sort by score and limit
-        matched_blocks.sort(key=lambda x: x["score"], reverse=True)
-        return matched_blocks[:limit]
+        # Top-k by score (same ordering as a stable full sort, without sorting every match)
+        return heapq.nlargest(limit, matched_blocks, key=lambda x: x["score"])
+
+    async def _query_blocks_for_search(
+        self,
+        query_filters: Dict[str, Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch candidate blocks for metadata search.
+
+        Args:
+            query_filters: ZeroDB query filter (may contain __in/__gte/__lte operators)
+
+        Returns:
+            List of block documents (up to 1000), or None if the query failed
+        """
+        async with self._http_client() as client:
+            response = await client.post(
+                f"{self.api_url}/v1/projects/{self.project_id}/database/tables/{self.blocks_table_name}/query",
+                headers=self.headers,
+                content=self._encode_json({
+                    "filter": query_filters,
+                    "limit": 1000,  # Get all blocks, then filter in-memory
+                    "skip": 0
+                }),
+                timeout=30.0
+            )
+
+            if response.status_code in (400, 422, 501):
+                # Filter operators not supported: stop sending them
+                if any("__" in key for key in query_filters):
+                    self._filter_operators_supported = False
+                return None
+
+            if response.status_code != 200:
+                return None
+
+            result = self._decode_json(response)
+            rows = result.get("data", [])
+            # Extract row_data from each row
+            return [row.get("row_data") for row in rows]
 
     async def _search_hybrid(
         self,
@@ -2831,7 +3616,9 @@ class OceanService:
         org_id: str,
         filters: Dict[str, Any],
         limit: int,
-        threshold: float
+        threshold: float,
+        query_embedding: np.ndarray,
+        prefetched_blocks: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """
         Hybrid search combining vector similarity and metadata filtering.
@@ -2845,13 +3632,13 @@ class OceanService:
             filters: Metadata filters
             limit: Maximum results
             threshold: Minimum similarity score
+            query_embedding: Query embedding
+            prefetched_blocks: Blocks of the filtered page by block_id (see
+                search), used for enrichment instead of per-block fetches
 
         Returns:
             List of search results ranked by combined score
         """
-        # Generate embedding for query
-        query_embedding = await self._generate_query_embedding(query)
-
         # Build metadata filter
         metadata_filter = {"organization_id": org_id}
 
@@ -2859,9 +3646,13 @@ class OceanService:
         if "page_id" in filters:
             metadata_filter["page_id"] = filters["page_id"]
 
-        # Apply block_type filter if single type specified
-        if "block_types" in filters and len(filters["block_types"]) == 1:
-            metadata_filter["block_type"] = filters["block_types"][0]
+        # Push block_type filters into the vector scan (equality for one type,
+        # __in for several) so ZeroDB never scores blocks we would discard
+        block_types = filters.get("block_types") or []
+        if len(block_types) == 1:
+            metadata_filter["block_type"] = block_types[0]
+        elif block_types and self._vector_filter_operators_supported:
+            metadata_filter["block_type__in"] = list(block_types)
 
         # Search vectors with metadata filter
         vector_results = await self._search_vectors(
@@ -2872,55 +3663,207 @@ class OceanService:
         )
 
         # Enrich with block data
-        enriched = await self._enrich_search_results(vector_results, org_id)
+        enriched = await self._enrich_search_results(
+            vector_results,
+            org_id,
+            prefetched_blocks=prefetched_blocks
+        )
 
-        # Apply additional filters (block_types, tags, date_range)
+        # Apply additional filters. block_types are re-checked against the
+        # enriched rows: vector metadata keeps the block_type from the last
+        # embedding, which convert_block_type and text-preserving updates
+        # leave stale.
         filtered = self._apply_additional_filters(enriched, filters)
 
-        # Rank and deduplicate
-        final_results = self._rank_and_dedupe(filtered, query)
-
-        # Limit results
-        return final_results[:limit]
+        # Rank and deduplicate, keeping only the top results
+        return self._rank_and_dedupe(filtered, query, limit=limit)
 
-    async def _generate_query_embedding(self, query: str) -> List[float]:
+    async def _generate_query_embedding(self, query: str) -> np.ndarray:
         """
         Generate embedding vector for search query.
 
+        Embeddings are memoized in an LRU cache keyed by the normalized query.
+        Cache misses are handed to a background micro-batcher so that concurrent
+        searches are embedded together in one API round trip instead of one
+        request per query.
+
         Args:
             query: Search query text
 
         Returns:
-            768-dimensional embedding vector
+            768-dimensional unit-length float32 embedding vector (read-only,
+            shared with the cache)
+
+        Raises:
+            Exception: If embedding generation fails
+        """
+        cache_key = self._embedding_cache_key(query)
+        cached = self._embedding_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+
+        # (Re)start the batch worker on demand: it exits once the queue drains,
+        # and a service may outlive an event loop (e.g. repeated asyncio.run() calls)
+        worker = self._embedding_worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._embedding_queue = asyncio.Queue()
+            self._embedding_worker = loop.create_task(
+                self._embedding_batch_worker(self._embedding_queue)
+            )
+
+        future = loop.create_future()
+        self._embedding_queue.put_nowait((query, future))
+        embedding = await future
+        self._embedding_cache.put(cache_key, embedding)
+        return embedding
+
+    async def warm_cache(self, queries: List[str]) -> int:
+        """
+        Pre-populate the query embedding cache.
+
+        Uncached queries are embedded in batches of EMBEDDING_BATCH_MAX_SIZE
+        (one API call per batch), so the first real search for each of them
+        skips the embedding round trip.
+
+        Args:
+            queries: Frequently used search queries
+
+        Returns:
+            Number of queries newly added to the cache
+
+        Raises:
+            Exception: If embedding generation fails
+        """
+        # Deduplicate on the cache key, skipping queries already cached
+        pending: Dict[str, str] = {}
+        for query in queries:
+            if not query or not query.strip():
+                continue
+            cache_key = self._embedding_cache_key(query)
+            if cache_key not in self._embedding_cache:
+                pending.setdefault(cache_key, query)
+
+        items = list(pending.items())
+        for i in range(0, len(items), self.EMBEDDING_BATCH_MAX_SIZE):
+            chunk = items[i:i + self.EMBEDDING_BATCH_MAX_SIZE]
+            embeddings = await self._generate_embeddings([query for _, query in chunk])
+            for (cache_key, _), embedding in zip(chunk, embeddings):
+                self._embedding_cache.put(cache_key, embedding)
+
+        return len(items)
+
+    def embedding_cache_info(self) -> CacheInfo:
+        """
+        Report query embedding cache statistics.
+
+        Returns:
+            CacheInfo(hits, misses, maxsize, currsize)
+        """
+        return self._embedding_cache.cache_info()
+
+    @staticmethod
+    def _embedding_cache_key(query: str) -> str:
+        """Build the embedding cache key for a query (see EmbeddingCache.key)."""
+        return EmbeddingCache.key(query)
+
+    async def _embedding_batch_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Drain queued query embeddings in batches.
+
+        Takes the first queued query, then collects further queries for up to
+        EMBEDDING_BATCH_WINDOW seconds (or EMBEDDING_BATCH_MAX_SIZE queries)
+        and resolves every waiting caller from a single API response. Returns
+        once the queue is empty so no task lingers between searches.
+
+        Args:
+            queue: Queue of (query, future) pairs fed by _generate_query_embedding
+        """
+        loop = asyncio.get_running_loop()
+
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            deadline = loop.time() + self.EMBEDDING_BATCH_WINDOW
+
+            while len(batch) < self.EMBEDDING_BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Skip callers that gave up (e.g. request cancelled) while queued
+            batch = [(query, future) for query, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                embeddings = await self._generate_embeddings([query for query, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+    async def _generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embedding vectors for a batch of texts in one API call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Read-only float32 array of shape (len(texts), 768), one L2-normalized
+            row per text, in order
 
         Raises:
             Exception: If embedding generation fails
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/api/v1/embeddings/generate",
                 headers=self.headers,
-                json={
-                    "texts": [query],
+                content=self._encode_json({
+                    "texts": texts,
                     "model": "BAAI/bge-base-en-v1.5"
-                },
+                }),
                 timeout=30.0
             )
 
             if response.status_code != 200:
                 raise Exception(f"Failed to generate query embedding: {response.status_code} - {response.text}")
 
-            result = response.json()
+            result = self._decode_json(response)
             embeddings = result.get("embeddings", [])
 
             if not embeddings:
                 raise Exception("No embeddings returned from API")
 
-            return embeddings[0]
+            if len(embeddings) != len(texts):
+                raise Exception(
+                    f"Embedding count mismatch: expected {len(texts)}, got {len(embeddings)}"
+                )
+
+            # Keep vectors as one contiguous float32 buffer; rows handed out to
+            # callers (and the cache) are views, so freeze them against mutation
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            # Normalize once here so every later similarity check (ZeroDB cosine
+            # is scale-invariant; the result cache uses a plain dot product)
+            # works on unit vectors without recomputing norms
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+            embeddings.flags.writeable = False
+            return embeddings
 
     async def _search_vectors(
         self,
-        query_embedding: List[float],
+        query_embedding: np.ndarray,
         metadata_filter: Dict[str, Any],
         threshold: float,
         limit: int
@@ -2937,32 +3880,44 @@ class OceanService:
         Returns:
             List of vector search results with similarity scores
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{self.api_url}/v1/projects/{self.project_id}/database/vectors/search",
                 headers=self.headers,
-                json={
+                content=self._encode_json({
                     "query_vector": query_embedding,
                     "namespace": "ocean_blocks",
                     "metadata_filter": metadata_filter,
                     "threshold": threshold,
                     "limit": limit
-                },
+                }),
                 timeout=30.0
             )
 
+            operator_keys = [key for key in metadata_filter if "__" in key]
+            if response.status_code in (400, 422, 501) and operator_keys:
+                # Filter operators not supported: stop sending them and retry
+                # with the plain equality filter (callers re-filter client-side)
+                self._vector_filter_operators_supported = False
+                plain_filter = {
+                    key: value for key, value in metadata_filter.items()
+                    if key not in operator_keys
+                }
+                return await self._search_vectors(query_embedding, plain_filter, threshold, limit)
+
             if response.status_code != 200:
                 # Non-critical: return empty results on search failure
                 print(f"WARNING: Vector search failed: {response.status_code} - {response.text}")
                 return []
 
-            result = response.json()
+            result = self._decode_json(response)
             return result.get("results", [])
 
     async def _enrich_search_results(
         self,
         vector_results: List[Dict[str, Any]],
-        org_id: str
+        org_id: str,
+        prefetched_blocks: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """
         Enrich vector search results with full block data.
@@ -2970,25 +3925,35 @@ class OceanService:
         Args:
             vector_results: Results from vector search
             org_id: Organization ID
+            prefetched_blocks: Optional block_id -> block mapping already loaded
+                by the caller; only blocks missing from it are fetched
 
         Returns:
             Enriched results with block data and similarity scores
         """
-        enriched = []
-
-        for result in vector_results:
-            # Extract similarity score (different APIs may use different keys)
-            similarity = result.get("similarity") or result.get("score", 0.0)
+        # Fetch all referenced blocks up front instead of one await per result
+        block_ids = [
+            result.get("metadata", {}).get("block_id")
+            for result in vector_results
+        ]
+        blocks_by_id = dict(prefetched_blocks or {})
+        missing_ids = [
+            block_id for block_id in block_ids
+            if block_id and block_id not in blocks_by_id
+        ]
+        if missing_ids:
+            blocks_by_id.update(await self._get_blocks_by_ids(missing_ids, org_id))
 
-            # Extract metadata
-            metadata = result.get("metadata", {})
-            block_id = metadata.get("block_id")
+        enriched = []
 
+        for result, block_id in zip(vector_results, block_ids):
             if not block_id:
                 continue
 
-            # Fetch full block data
-            block = await self.get_block(block_id, org_id)
+            # Extract similarity score (different APIs may use different keys)
+            similarity = result.get("similarity") or result.get("score", 0.0)
+
+            block = blocks_by_id.get(block_id)
 
             if block:
                 enriched.append({
@@ -3000,6 +3965,34 @@ class OceanService:
 
         return enriched
 
+    async def _get_blocks_by_ids(
+        self,
+        block_ids: List[str],
+        org_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch multiple blocks by ID concurrently.
+
+        ZeroDB query filters don't support IN yet, so the per-block lookups are
+        issued in parallel: wall-clock cost is one round trip instead of one per block.
+
+        Args:
+            block_ids: Block IDs to fetch (duplicates are fetched once)
+            org_id: Organization ID (multi-tenant isolation)
+
+        Returns:
+            Mapping of block_id to block document for the blocks that were found
+        """
+        unique_ids = list(dict.fromkeys(block_ids))
+        blocks = await asyncio.gather(
+            *(self.get_block(block_id, org_id) for block_id in unique_ids)
+        )
+        return {
+            block_id: block
+            for block_id, block in zip(unique_ids, blocks)
+            if block
+        }
+
     def _apply_additional_filters(
         self,
         results: List[Dict[str, Any]],
@@ -3008,6 +4001,9 @@ class OceanService:
         """
         Apply additional filters that couldn't be applied at vector search level.
 
+        Block types are always checked here, even when the vector search
+        filtered on them, since vector metadata can lag the block row.
+
         Args:
             results: Search results to filter
             filters: Filter criteria
@@ -3015,38 +4011,31 @@ class OceanService:
         Returns:
             Filtered results
         """
-        filtered = results
-
-        # Filter by block types (if multiple types specified)
-        if "block_types" in filters and len(filters["block_types"]) > 1:
-            allowed_types = set(filters["block_types"])
-            filtered = [
-                r for r in filtered
-                if r["block"].get("block_type") in allowed_types
-            ]
-
-        # Filter by tags
-        if "tags" in filters:
-            required_tags = set(filters["tags"])
-            filtered = [
-                r for r in filtered
-                if any(
-                    tag in required_tags
-                    for tag in r["block"].get("properties", {}).get("tags", [])
-                )
-            ]
-
-        # Filter by date range
-        if "date_range" in filters:
-            start = filters["date_range"].get("start")
-            end = filters["date_range"].get("end")
-            filtered_blocks = self._filter_by_date_range(
-                [r["block"] for r in filtered],
-                start,
-                end
-            )
-            block_ids = {b["block_id"] for b in filtered_blocks}
-            filtered = [r for r in filtered if r["block"]["block_id"] in block_ids]
+        block_types = filters.get("block_types")
+        allowed_types = frozenset(block_types) if block_types else None
+        required_tags = frozenset(filters["tags"]) if "tags" in filters else None
+        date_range = filters.get("date_range") or {}
+        start = date_range.get("start")
+        end = date_range.get("end")
+
+        if allowed_types is None and required_tags is None and not (start or end):
+            return results
+
+        # Single pass over results with short-circuiting predicates
+        filtered = []
+        for r in results:
+            block = r["block"]
+            if allowed_types is not None and block.get("block_type") not in allowed_types:
+                continue
+            if required_tags is not None and not any(
+                tag in required_tags for tag in block.get("properties", {}).get("tags", [])
+            ):
+                continue
+            if start or end:
+                created_at = block.get("created_at", "")
+                if (start and created_at < start) or (end and created_at > end):
+                    continue
+            filtered.append(r)
 
         return filtered
 
@@ -3086,7 +4075,8 @@ class OceanService:
     def _rank_and_dedupe(
         self,
         results: List[Dict[str, Any]],
-        query: str
+        query: str,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Rank results by combined score and remove duplicates.
@@ -3099,6 +4089,7 @@ class OceanService:
         Args:
             results: Search results to rank
             query: Original search query
+            limit: Only return the top results (partial selection instead of a full sort)
 
         Returns:
             Ranked and deduplicated results
@@ -3106,9 +4097,12 @@ class OceanService:
         # Deduplicate by block_id
         seen_blocks = set()
         deduped = []
+        query_lower = query.lower()
+        now = datetime.utcnow()
 
         for result in results:
-            block_id = result["block"]["block_id"]
+            block = result["block"]
+            block_id = block["block_id"]
 
             if block_id in seen_blocks:
                 continue
@@ -3119,16 +4113,15 @@ class OceanService:
             base_score = result["score"]
 
             # Boost 1: Exact query term match in content (up to +0.1)
-            searchable_text = self._extract_searchable_text(result["block"]).lower()
-            query_lower = query.lower()
+            searchable_text = self._get_searchable_text_lower(block)
             query_boost = 0.1 if query_lower in searchable_text else 0.0
 
             # Boost 2: Freshness (newer blocks get up to +0.05)
-            created_at = result["block"].get("created_at", "")
-            freshness_boost = self._calculate_freshness_boost(created_at)
+            created_at = block.get("created_at", "")
+            freshness_boost = self._calculate_freshness_boost(created_at, now)
 
             # Boost 3: Block type relevance (heading blocks get +0.03)
-            type_boost = 0.03 if result["block"].get("block_type") == "heading" else 0.0
+            type_boost = 0.03 if block.get("block_type") == "heading" else 0.0
 
             # Calculate final score (capped at 1.0)
             final_score = min(1.0, base_score + query_boost + freshness_boost + type_boost)
@@ -3136,17 +4129,26 @@ class OceanService:
             result["final_score"] = final_score
             deduped.append(result)
 
-        # Sort by final score descending
+        # Sort by final score descending (top-k only when a limit is given)
+        if limit is not None and limit < len(deduped):
+            return heapq.nlargest(limit, deduped, key=lambda x: x["final_score"])
+
         deduped.sort(key=lambda x: x["final_score"], reverse=True)
 
         return deduped
 
-    def _calculate_freshness_boost(self, created_at: str) -> float:
+    def _calculate_freshness_boost(
+        self,
+        created_at: str,
+        now: Optional[datetime] = None
+    ) -> float:
         """
         Calculate freshness boost based on creation date.
 
         Args:
             created_at: ISO format creation timestamp
+            now: Reference time as naive UTC; pass one value for a whole ranking
+                pass to avoid re-reading the clock per result (default: utcnow)
 
         Returns:
             Boost value (0.0 to 0.05)
@@ -3155,9 +4157,12 @@ class OceanService:
             return 0.0
 
         try:
-            from datetime import datetime
             created = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            now = datetime.utcnow().replace(tzinfo=created.tzinfo)
+            if created.tzinfo is not None:
+                # Normalize to naive UTC to compare with the reference time
+                created = created.astimezone(timezone.utc).replace(tzinfo=None)
+            if now is None:
+                now = datetime.utcnow()
 
             age_days = (now - created).days
 
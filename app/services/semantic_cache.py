@@ -0,0 +1,194 @@
+"""
+Semantic Result Cache - Reuse search results for near-duplicate queries.
+
+Search results are cached together with the L2-normalized query embedding that
+produced them. A later search in the same namespace (organization + search
+parameters) whose embedding has cosine similarity >= threshold with a cached
+one is answered from memory: one matrix-vector product instead of a ZeroDB
+vector search and block enrichment.
+
+Embeddings must already be unit length (OceanService normalizes them when they
+are generated), so cosine similarity is a plain dot product.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+
+Namespace = Tuple[str, bytes]
+
+
+class _NamespaceEntries:
+    """Cached (embedding, results) pairs for one namespace."""
+
+    def __init__(self, dimensions: int, capacity: int):
+        self.vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.expires_at = np.zeros(capacity, dtype=np.float64)
+        self.last_used = np.zeros(capacity, dtype=np.float64)
+        self.results: List[List[Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+class SemanticResultCache:
+    """
+    Per-organization similarity cache for search results.
+
+    Entries expire after ttl seconds and are dropped for an organization as
+    soon as any of its blocks are written (see invalidate).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 1024,
+        max_namespaces: int = 256,
+        ttl: float = 30.0
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum cached queries per namespace (LRU eviction)
+            max_namespaces: Maximum namespaces kept across organizations
+            ttl: Seconds a cached result stays valid
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_namespaces = max_namespaces
+        self.ttl = ttl
+        self._namespaces: "OrderedDict[Namespace, _NamespaceEntries]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def namespace(org_id: str, **params: Any) -> Namespace:
+        """
+        Build the cache namespace for a search.
+
+        Results are only shared between searches with the same organization
+        and identical parameters (search type, filters, limit, threshold).
+
+        Args:
+            org_id: Organization ID
+            **params: Search parameters that affect the results
+
+        Returns:
+            Hashable namespace key
+        """
+        return (org_id, orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str))
+
+    def generation(self, org_id: str) -> int:
+        """
+        Current write generation for an organization.
+
+        Read it before running a search and pass it to store(): results are
+        only cached if no invalidate() happened since, so a search that
+        overlaps a write (which invalidates before and after) is not cached.
+        """
+        return self._generations.get(org_id, 0)
+
+    def lookup(
+        self,
+        namespace: Namespace,
+        query_embedding: np.ndarray
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find cached results for a similar query.
+
+        Args:
+            namespace: Key from namespace()
+            query_embedding: Unit-length query embedding
+
+        Returns:
+            Deep copy of the cached results on a hit, None on a miss
+        """
+        entries = self._namespaces.get(namespace)
+        if not entries:
+            return None
+
+        n = len(entries)
+        sims = entries.vectors[:n] @ query_embedding
+        sims[entries.expires_at[:n] <= time.monotonic()] = -np.inf
+
+        idx = int(np.argmax(sims))
+        if sims[idx] < self.threshold:
+            return None
+
+        entries.last_used[idx] = time.monotonic()
+        self._namespaces.move_to_end(namespace)
+        return copy.deepcopy(entries.results[idx])
+
+    def store(
+        self,
+        namespace: Namespace,
+        query_embedding: np.ndarray,
+        results: List[Dict[str, Any]],
+        generation: int
+    ) -> None:
+        """
+        Cache the results of a search.
+
+        Args:
+            namespace: Key from namespace()
+            query_embedding: Unit-length query embedding the results were computed for
+            results: Search results
+            generation: Value of generation() taken before the search ran
+        """
+        org_id = namespace[0]
+        if generation != self.generation(org_id):
+            return
+
+        entries = self._namespaces.get(namespace)
+        if entries is None:
+            entries = _NamespaceEntries(query_embedding.shape[0], min(16, self.max_entries))
+            self._namespaces[namespace] = entries
+            while len(self._namespaces) > self.max_namespaces:
+                self._namespaces.popitem(last=False)
+        self._namespaces.move_to_end(namespace)
+
+        now = time.monotonic()
+        n = len(entries)
+        if n < self.max_entries:
+            if n == entries.vectors.shape[0]:
+                self._grow(entries, min(n * 2, self.max_entries))
+            idx = n
+            entries.results.append(copy.deepcopy(results))
+        else:
+            # Full: replace the least recently used (or expired) entry
+            idx = int(np.argmin(entries.last_used))
+            entries.results[idx] = copy.deepcopy(results)
+
+        entries.vectors[idx] = query_embedding
+        entries.expires_at[idx] = now + self.ttl
+        entries.last_used[idx] = now
+
+    def invalidate(self, org_id: str) -> None:
+        """
+        Drop all cached results for an organization.
+
+        Call before writing blocks (or block tags) of the organization, and
+        again once the write has finished.
+
+        Args:
+            org_id: Organization ID
+        """
+        self._generations[org_id] = self._generations.get(org_id, 0) + 1
+        for namespace in [ns for ns in self._namespaces if ns[0] == org_id]:
+            del self._namespaces[namespace]
+
+    @staticmethod
+    def _grow(entries: _NamespaceEntries, capacity: int) -> None:
+        """Resize a namespace's preallocated arrays to the new capacity."""
+        n = len(entries)
+        for name in ("vectors", "expires_at", "last_used"):
+            old = getattr(entries, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(entries, name, new)
@@ -0,0 +1,120 @@
+"""
+TTL Cache - Short-lived in-process cache for organization-scoped query results.
+
+Entries are keyed by (org_id, query parameters) and expire after ttl seconds.
+Writes to an organization drop its entries (see invalidate) before and after
+they run, and a per-org generation counter keeps results fetched while a
+write was in flight from being cached.
+
+Values are deep-copied on put() and get(), so callers may mutate the rows
+they store or receive without corrupting the cached entry.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+
+CacheKey = Tuple[str, bytes]
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed time."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before evicting the least
+                recently used one
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def key(org_id: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        """
+        Build the cache key for a query.
+
+        Args:
+            org_id: Organization ID
+            params: Query parameters that affect the result
+
+        Returns:
+            Hashable cache key
+        """
+        return (org_id, orjson.dumps(params or {}, option=orjson.OPT_SORT_KEYS, default=str))
+
+    def generation(self, org_id: str) -> int:
+        """
+        Current write generation for an organization.
+
+        Read it before running a query and pass it to put(): the result is
+        only cached if no invalidate() happened since, so a query that
+        overlaps a write (which invalidates before and after) is not cached.
+        """
+        return self._generations.get(org_id, 0)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Look up an unexpired entry and mark it as recently used.
+
+        Args:
+            key: Key from TTLCache.key
+
+        Returns:
+            Deep copy of the cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: CacheKey, value: Any, generation: int) -> None:
+        """
+        Store a value, evicting the oldest entries if over maxsize.
+
+        Args:
+            key: Key from TTLCache.key
+            value: Query result (a deep copy is stored)
+            generation: Value of generation() taken before the query ran
+        """
+        if generation != self.generation(key[0]):
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, org_id: str) -> None:
+        """
+        Drop all entries for an organization.
+
+        Call before writing data the cached queries read, and again once the
+        write has finished: a query that started before the write may
+        otherwise cache the old rows under the new generation.
+
+        Args:
+            org_id: Organization ID
+        """
+        self._generations[org_id] = self._generations.get(org_id, 0) + 1
+        for key in [k for k in self._entries if k[0] == org_id]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
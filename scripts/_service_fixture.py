@@ -0,0 +1,68 @@
+"""
+Shared ZeroDB configuration and OceanService instance for the test scripts.
+
+The scripts read credentials from here instead of each repeating the
+load_dotenv() / os.getenv() prologue.
+
+test_search.py and test_search_simple.py both call get_service(), so running
+them in one interpreter (e.g. importing both from pytest) reuses one warmed
+service: its query-embedding cache, semantic result cache and the filter
+capabilities it has probed on ZeroDB.
+
+The HTTP connection pool is bound to the event loop that created it, so each
+script still calls service.aclose() before its asyncio.run() loop ends; the
+next call on the service opens a fresh pool on the new loop.
+
+Every script starts its event loop through run(), so all of them use uvloop
+when it is installed.
+"""
+
+import asyncio
+import functools
+import os
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+from dotenv import load_dotenv
+
+from app.services.ocean_service import OceanService
+
+# Load environment
+load_dotenv()
+
+API_URL = os.getenv("ZERODB_API_URL", "https://api.ainative.studio")
+API_KEY = os.getenv("ZERODB_API_KEY")
+PROJECT_ID = os.getenv("ZERODB_PROJECT_ID")
+
+T = TypeVar("T")
+
+
+def create_service(client: Optional[httpx.AsyncClient] = None) -> OceanService:
+    """Create an OceanService from the environment, optionally on a caller-owned client."""
+    return OceanService(
+        api_url=API_URL,
+        api_key=API_KEY,
+        project_id=PROJECT_ID,
+        client=client
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_service() -> OceanService:
+    """Get the process-wide OceanService, creating it on first use."""
+    return create_service()
+
+
+def run(main: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run a script's async entry point and return its result.
+
+    Uses libuv's event loop when uvloop is installed (lower per-await overhead).
+    """
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    return asyncio.run(main())
@@ -8,38 +8,42 @@ This script creates the following tables:
 - ocean_block_links: Stores links between Ocean blocks for bidirectional navigation
 - ocean_tags: Stores organization-wide tags for categorizing Ocean content
 
-The script is idempotent - it will skip tables that already exist.
+The script is idempotent - it will skip tables that already exist. Tables
+confirmed to exist are remembered in .zerodb_tables_cache.json (per project)
+together with a hash of their schema, so later runs skip them without
+contacting ZeroDB as long as the schema is unchanged.
 
 Usage:
     python scripts/setup_tables.py
+    python scripts/setup_tables.py --refresh   # ignore the local table cache
+    python scripts/setup_tables.py --dry-run   # validate schemas only, no API calls
+    python scripts/setup_tables.py --only ocean_tags --only ocean_pages
 
 Environment Variables:
     ZERODB_PROJECT_ID: ZeroDB project ID
     ZERODB_API_KEY: ZeroDB API authentication key
+    ZERODB_API_URL: ZeroDB API base URL (default: https://api.ainative.studio)
 """
 
+import argparse
+import asyncio
+import hashlib
+import json
 import os
 import sys
 import logging
-from typing import Dict, Any, List
+import tempfile
+from typing import TYPE_CHECKING, Dict, Any, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    # Load from project root .env file
-    env_path = Path(__file__).parent.parent / '.env'
-    load_dotenv(env_path)
-except ImportError:
-    print("Warning: python-dotenv not installed. Using environment variables only.")
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
+# Local record of tables known to exist (next to .env)
+TABLES_CACHE_PATH = Path(__file__).parent.parent / '.zerodb_tables_cache.json'
+
 # Table schemas
 TABLE_SCHEMAS = {
     "ocean_pages": {
@@ -82,6 +86,8 @@ TABLE_SCHEMAS = {
                 "properties": "object",
                 "vector_id": "string",
                 "vector_dimensions": "integer",
+                "searchable_text": "string",
+                "text_hash": "string",
                 "created_at": "timestamp",
                 "updated_at": "timestamp"
             },
@@ -99,6 +105,7 @@ TABLE_SCHEMAS = {
         "schema": {
             "fields": {
                 "link_id": "string",
+                "organization_id": "string",
                 "source_block_id": "string",
                 "target_block_id": "string",
                 "target_page_id": "string",
@@ -107,6 +114,7 @@ TABLE_SCHEMAS = {
             },
             "indexes": [
                 {"field": "link_id", "type": "unique"},
+                {"field": "organization_id"},
                 {"field": "source_block_id"},
                 {"field": "target_block_id"},
                 {"field": "target_page_id"}
@@ -134,6 +142,116 @@ TABLE_SCHEMAS = {
 }
 
 
+class CompiledSchema(NamedTuple):
+    """Table schema with its log counts, content hash and request body precomputed."""
+    name: str
+    config: Dict[str, Any]
+    field_count: int
+    index_count: int
+    schema_hash: str
+    params_json: bytes  # create_table params (minus project_id), serialized once
+
+
+def _create_params_json(name: str, config: Dict[str, Any]) -> bytes:
+    """Serialize the static create_table params for a table (compact JSON)."""
+    return json.dumps(
+        {
+            "table_name": name,
+            "description": config["description"],
+            "schema": config["schema"],
+            "if_not_exists": True
+        },
+        separators=(",", ":")
+    ).encode()
+
+
+def _create_table_body(table: CompiledSchema, project_id: Optional[str]) -> bytes:
+    """
+    Build the create_table request body from the precompiled params.
+
+    Only project_id (known at run time) is serialized per call; the schema
+    JSON is spliced in as-is.
+    """
+    return (
+        b'{"operation":"create_table","params":{"project_id":'
+        + json.dumps(project_id).encode()
+        + b"," + table.params_json[1:] + b"}"
+    )
+
+
+def _schema_hash(schema: Dict[str, Any]) -> str:
+    """Stable content hash of a table schema (key order independent)."""
+    return hashlib.blake2b(
+        json.dumps(schema, sort_keys=True).encode(),
+        digest_size=16
+    ).hexdigest()
+
+
+# Compiled once at import: counts and hashes never change during a run
+_COMPILED_SCHEMAS: Tuple[CompiledSchema, ...] = tuple(
+    CompiledSchema(
+        name=name,
+        config=config,
+        field_count=len(config["schema"]["fields"]),
+        index_count=len(config["schema"]["indexes"]),
+        schema_hash=_schema_hash(config["schema"]),
+        params_json=_create_params_json(name, config)
+    )
+    for name, config in TABLE_SCHEMAS.items()
+)
+
+
+def _load_env() -> None:
+    """Load environment variables from the project root .env file, if possible."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        print("Warning: python-dotenv not installed. Using environment variables only.")
+        return
+
+    load_dotenv(Path(__file__).parent.parent / '.env')
+
+
+def _configure_logging() -> None:
+    """Configure script logging (only when actually running, not for --help)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
+# Field types accepted by ZeroDB NoSQL tables
+VALID_FIELD_TYPES = frozenset({"string", "integer", "boolean", "timestamp", "object"})
+VALID_INDEX_TYPES = frozenset({"unique"})
+
+
+def validate_schema(table: CompiledSchema) -> List[str]:
+    """
+    Check a table schema locally (field types and index references).
+
+    Args:
+        table: Compiled schema to validate
+
+    Returns:
+        List[str]: Validation errors (empty if the schema is valid)
+    """
+    errors = []
+    fields = table.config["schema"]["fields"]
+
+    for field, field_type in fields.items():
+        if field_type not in VALID_FIELD_TYPES:
+            errors.append(f"{table.name}.{field}: unknown field type '{field_type}'")
+
+    for index in table.config["schema"]["indexes"]:
+        field = index.get("field")
+        if field not in fields:
+            errors.append(f"{table.name}: index references unknown field '{field}'")
+        if "type" in index and index["type"] not in VALID_INDEX_TYPES:
+            errors.append(f"{table.name}.{field}: unknown index type '{index['type']}'")
+
+    return errors
+
+
 def check_environment() -> bool:
     """
     Check that required environment variables are set.
@@ -152,88 +270,294 @@ def check_environment() -> bool:
     return True
 
 
-def get_existing_tables() -> List[str]:
+def load_tables_cache() -> Optional[Dict[str, str]]:
     """
-    Get list of existing tables in the ZeroDB project.
+    Load the locally cached tables known to exist.
 
     Returns:
-        List[str]: List of existing table names
+        Optional[Dict[str, str]]: Table name -> schema hash for the current
+        ZERODB_PROJECT_ID, or None if there is no usable cache
     """
     try:
-        # This would call the ZeroDB API to list tables
-        # For now, we assume tables were created successfully via MCP tools
-        # In a real implementation, this would use the ZeroDB client SDK
-        logger.info("Checking for existing tables...")
-
-        # Since we're using MCP tools, we'll return an empty list
-        # to simulate that no tables exist yet (idempotent first run)
-        return []
-    except Exception as e:
-        logger.error(f"Error fetching existing tables: {e}")
-        return []
+        cache = json.loads(TABLES_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cache, dict) or cache.get("project_id") != os.getenv("ZERODB_PROJECT_ID"):
+        return None
 
+    tables = cache.get("tables")
+    if isinstance(tables, list):
+        # Older cache format without schema hashes: trust names, recheck schemas
+        return {name: "" for name in tables}
+    return dict(tables) if isinstance(tables, dict) else None
+
+
+def save_tables_cache(tables: Dict[str, str]) -> None:
+    """
+    Atomically write the tables known to exist.
 
-def create_table(table_name: str, config: Dict[str, Any]) -> bool:
+    Args:
+        tables: Table name -> schema hash for tables confirmed to exist in
+            the current project
+    """
+    payload = {
+        "project_id": os.getenv("ZERODB_PROJECT_ID"),
+        "tables": dict(sorted(tables.items()))
+    }
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=TABLES_CACHE_PATH.parent,
+            prefix=TABLES_CACHE_PATH.name,
+            suffix=".tmp"
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, TABLES_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write table cache {TABLES_CACHE_PATH}: {e}")
+
+
+def get_existing_tables(refresh: bool = False) -> Dict[str, str]:
+    """
+    Get the tables already known to exist in the ZeroDB project.
+
+    Only the local table cache is consulted. ZeroDB is never probed for
+    existence: create_table() is optimistic and treats "already exists" as
+    success, so an unknown table costs one create round trip instead of a
+    check followed by a create.
+
+    Args:
+        refresh: Ignore the local cache and attempt every create again
+
+    Returns:
+        Dict[str, str]: Existing table name -> schema hash it was created with
+        (empty string when unknown)
+    """
+    if not refresh:
+        cached_tables = load_tables_cache()
+        if cached_tables is not None:
+            logger.info(f"Using cached table list from {TABLES_CACHE_PATH.name}")
+            return cached_tables
+
+    return {}
+
+
+def create_tables(tables: Tuple[CompiledSchema, ...]) -> Dict[str, str]:
+    """
+    Create several ZeroDB tables in one batch.
+
+    ZeroDB has no multi-table DDL call, so the create_table requests are sent
+    concurrently over a single HTTP client: setup costs roughly one round trip
+    instead of one per table.
+
+    Args:
+        tables: Compiled schemas of the tables to create
+
+    Returns:
+        Dict[str, str]: Mapping of table name to "created", "exists" or "failed"
+    """
+    if not tables:
+        return {}
+    return asyncio.run(_create_tables_async(tables))
+
+
+async def _create_tables_async(tables: Tuple[CompiledSchema, ...]) -> Dict[str, str]:
+    """
+    Issue all create_table requests concurrently over one shared client.
+
+    Args:
+        tables: Compiled schemas of the tables to create
+
+    Returns:
+        Dict[str, str]: Mapping of table name to creation status
+    """
+    # Imported here so --help and cached runs never pay for it
+    import httpx
+
+    api_url = os.getenv("ZERODB_API_URL", "https://api.ainative.studio").rstrip('/')
+    headers = {
+        "Authorization": f"Bearer {os.getenv('ZERODB_API_KEY')}",
+        "Content-Type": "application/json"
+    }
+
+    async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
+        statuses = await asyncio.gather(*(
+            create_table(client, api_url, table) for table in tables
+        ))
+
+    return {table.name: status for table, status in zip(tables, statuses)}
+
+
+async def create_table(
+    client: "httpx.AsyncClient",
+    api_url: str,
+    table: CompiledSchema
+) -> str:
     """
     Create a single ZeroDB table with the specified schema.
 
+    The create is issued unconditionally with if_not_exists and an
+    idempotency key derived from the table name and schema hash; an
+    "already exists" answer (409, or code "already_exists") counts as
+    success, so re-running the script is safe.
+
     Args:
-        table_name: Name of the table to create
-        config: Dictionary containing description and schema
+        client: Shared HTTP client (carries the auth headers)
+        api_url: ZeroDB API base URL
+        table: Compiled schema of the table to create
 
     Returns:
-        bool: True if table was created successfully, False otherwise
+        str: "created", "exists" if the table was already there, or "failed"
     """
+    table_name, config = table.name, table.config
     try:
         logger.info(f"Creating table: {table_name}")
         logger.info(f"  Description: {config['description']}")
-        logger.info(f"  Fields: {len(config['schema']['fields'])} fields")
-        logger.info(f"  Indexes: {len(config['schema']['indexes'])} indexes")
+        logger.info(f"  Fields: {table.field_count} fields")
+        logger.info(f"  Indexes: {table.index_count} indexes")
+
+        idempotency_key = hashlib.blake2b(
+            f"{table_name}:{table.schema_hash}".encode(),
+            digest_size=16
+        ).hexdigest()
+
+        response = await client.post(
+            f"{api_url}/v1/public/zerodb/mcp/execute",
+            headers={"Idempotency-Key": idempotency_key},
+            content=_create_table_body(table, os.getenv("ZERODB_PROJECT_ID"))
+        )
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if not isinstance(body, dict):
+            body = {}
+
+        if (
+            response.status_code == 409
+            or body.get("code") == "already_exists"
+            or "already exists" in response.text.lower()
+        ):
+            logger.info(f"⊘ Table '{table_name}' already exists, skipping")
+            return "exists"
 
-        # In production, this would use the ZeroDB SDK client
-        # For now, we log that tables were created via MCP tools
-        logger.info(f"✓ Table '{table_name}' created successfully via ZeroDB MCP tools")
+        if response.status_code not in (200, 201) or not body.get("success"):
+            logger.error(
+                f"✗ Failed to create table '{table_name}': "
+                f"{response.status_code} - {response.text}"
+            )
+            return "failed"
 
-        return True
+        logger.info(f"✓ Table '{table_name}' created successfully")
+        return "created"
     except Exception as e:
         logger.error(f"✗ Failed to create table '{table_name}': {e}")
-        return False
+        return "failed"
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main function to set up all ZeroDB tables.
 
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
     Returns:
         int: Exit code (0 for success, 1 for failure)
     """
+    parser = argparse.ArgumentParser(description="Create ZeroDB tables for Ocean Backend")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the local table cache and re-issue every create"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate the table schemas locally and exit without calling ZeroDB"
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=list(TABLE_SCHEMAS),
+        metavar="TABLE",
+        help="Only set up this table (repeatable)"
+    )
+    args = parser.parse_args(argv)
+
+    selected_tables = tuple(
+        table for table in _COMPILED_SCHEMAS
+        if not args.only or table.name in args.only
+    )
+
+    _configure_logging()
+    _load_env()
+
     logger.info("=" * 70)
     logger.info("Ocean Backend - ZeroDB Table Setup")
     logger.info("=" * 70)
 
+    # Dry run: schema validation only, no credentials or network needed
+    if args.dry_run:
+        errors = [error for table in selected_tables for error in validate_schema(table)]
+        for error in errors:
+            logger.error(f"✗ {error}")
+        if errors:
+            return 1
+        for table in selected_tables:
+            logger.info(
+                f"✓ {table.name}: {table.field_count} fields, "
+                f"{table.index_count} indexes (schema {table.schema_hash[:8]})"
+            )
+        logger.info("Dry run: schemas valid, no tables created")
+        return 0
+
     # Check environment
     if not check_environment():
         return 1
 
-    # Get existing tables
-    existing_tables = get_existing_tables()
-    logger.info(f"Found {len(existing_tables)} existing tables")
+    # Tables known from a previous run (local cache only, no API probe)
+    existing_tables = get_existing_tables(refresh=args.refresh)
+    logger.info(f"Found {len(existing_tables)} known tables")
 
     # Create tables
     created_count = 0
     skipped_count = 0
     failed_count = 0
 
-    for table_name, config in TABLE_SCHEMAS.items():
-        if table_name in existing_tables:
-            logger.info(f"⊘ Table '{table_name}' already exists, skipping")
+    pending_tables = []
+    # Keep cache entries for tables outside an --only selection
+    selected_names = {table.name for table in selected_tables}
+    known_tables = {
+        name: schema_hash for name, schema_hash in existing_tables.items()
+        if name in TABLE_SCHEMAS and name not in selected_names
+    }
+    for table in selected_tables:
+        if existing_tables.get(table.name) == table.schema_hash:
+            logger.info(f"⊘ Table '{table.name}' already exists (schema unchanged), skipping")
             skipped_count += 1
+            known_tables[table.name] = table.schema_hash
             continue
+        pending_tables.append(table)
 
-        if create_table(table_name, config):
+    # Create all remaining tables in one batch
+    schema_hashes = {table.name: table.schema_hash for table in pending_tables}
+    for table_name, status in create_tables(tuple(pending_tables)).items():
+        if status == "created":
             created_count += 1
+        elif status == "exists":
+            skipped_count += 1
         else:
             failed_count += 1
+            continue
+        known_tables[table_name] = schema_hashes[table_name]
+
+    # Remember confirmed tables so later runs can skip them
+    if pending_tables:
+        save_tables_cache(known_tables)
 
     # Summary
     logger.info("=" * 70)
@@ -8,7 +8,9 @@ This script verifies:
 3. Database features are enabled
 """
 
+import argparse
 import asyncio
+import logging
 import os
 import sys
 from pathlib import Path
@@ -19,6 +21,52 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import httpx
 from dotenv import load_dotenv
 
+from scripts._service_fixture import run
+
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the stream buffer (and exit)."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logging(quiet: bool = False) -> None:
+    """
+    Send script output through one block-buffered stdout handler.
+
+    Lines are written in ~8 KiB chunks (and flushed at exit) instead of one
+    write per line; quiet mode drops everything below WARNING. With
+    OCEAN_LOG_JSON=1 (and python-json-logger installed) each record is
+    emitted as a JSON object for CI log ingestion.
+    """
+    stream = open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=8192,
+        encoding=sys.stdout.encoding or "utf-8",
+        closefd=False
+    )
+    handler = BufferedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if os.getenv("OCEAN_LOG_JSON") == "1":
+        try:
+            from pythonjsonlogger import jsonlogger
+            handler.setFormatter(
+                jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+            )
+        except ImportError:
+            pass
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+
 
 async def test_zerodb_connection():
     """Test connection to ZeroDB API and verify project setup."""
@@ -30,117 +78,127 @@ async def test_zerodb_connection():
     project_id = os.getenv("ZERODB_PROJECT_ID")
     api_key = os.getenv("ZERODB_API_KEY")
 
-    print("=" * 70)
-    print("Ocean Backend - ZeroDB Connection Test")
-    print("=" * 70)
-    print()
+    logger.info("=" * 70)
+    logger.info("Ocean Backend - ZeroDB Connection Test")
+    logger.info("=" * 70)
+    logger.info("")
 
     # Validate environment variables
-    print("[1/4] Validating environment variables...")
+    logger.info("[1/4] Validating environment variables...")
     if not api_url:
-        print("❌ ZERODB_API_URL not set in .env")
+        logger.error("❌ ZERODB_API_URL not set in .env")
         return False
     if not project_id:
-        print("❌ ZERODB_PROJECT_ID not set in .env")
+        logger.error("❌ ZERODB_PROJECT_ID not set in .env")
         return False
     if not api_key:
-        print("❌ ZERODB_API_KEY not set in .env")
+        logger.error("❌ ZERODB_API_KEY not set in .env")
         return False
 
-    print(f"✅ API URL: {api_url}")
-    print(f"✅ Project ID: {project_id}")
-    print(f"✅ API Key: {api_key[:10]}...{api_key[-10:]}")
-    print()
+    logger.info("✅ API URL: %s", api_url)
+    logger.info("✅ Project ID: %s", project_id)
+    logger.info("✅ API Key: %s...%s", api_key[:10], api_key[-10:])
+    logger.info("")
+
+    # Phases 2-4 are independent: issue them concurrently over one client
+    # (one connection pool, auth header set once)
+    async with httpx.AsyncClient(
+        base_url=api_url,
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=10.0
+    ) as client:
+        health_response, project_response, stats_response = await asyncio.gather(
+            client.get("/health"),
+            client.get(f"/v1/projects/{project_id}"),
+            client.get(f"/v1/projects/{project_id}/stats"),
+            return_exceptions=True
+        )
 
     # Test API connection
-    print("[2/4] Testing API connection...")
-    async with httpx.AsyncClient() as client:
-        try:
-            # Test health endpoint
-            response = await client.get(f"{api_url}/health")
-            if response.status_code == 200:
-                print(f"✅ API is healthy: {response.json()}")
-            else:
-                print(f"⚠️  API health check returned: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Failed to connect to API: {e}")
-            return False
-    print()
+    logger.info("[2/4] Testing API connection...")
+    if isinstance(health_response, Exception):
+        logger.error("❌ Failed to connect to API: %s", health_response)
+        return False
+    if health_response.status_code == 200:
+        logger.info("✅ API is healthy: %s", health_response.json())
+    else:
+        logger.warning("⚠️  API health check returned: %s", health_response.status_code)
+    logger.info("")
 
     # Test project access
-    print("[3/4] Testing project access...")
-    async with httpx.AsyncClient() as client:
-        try:
-            # Get project info
-            response = await client.get(
-                f"{api_url}/v1/projects/{project_id}",
-                headers={"Authorization": f"Bearer {api_key}"}
-            )
-
-            if response.status_code == 200:
-                project_info = response.json()
-                print(f"✅ Project found: {project_info.get('name', 'Unknown')}")
-                print(f"   Description: {project_info.get('description', 'N/A')}")
-                print(f"   Database enabled: {project_info.get('database_enabled', False)}")
-            elif response.status_code == 401:
-                print(f"❌ Authentication failed - invalid API key")
-                return False
-            elif response.status_code == 404:
-                print(f"❌ Project not found: {project_id}")
-                return False
-            else:
-                print(f"❌ Failed to get project info: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return False
-        except Exception as e:
-            print(f"❌ Error accessing project: {e}")
+    logger.info("[3/4] Testing project access...")
+    try:
+        if isinstance(project_response, Exception):
+            raise project_response
+
+        if project_response.status_code == 200:
+            project_info = project_response.json()
+            logger.info("✅ Project found: %s", project_info.get('name', 'Unknown'))
+            logger.info("   Description: %s", project_info.get('description', 'N/A'))
+            logger.info("   Database enabled: %s", project_info.get('database_enabled', False))
+        elif project_response.status_code == 401:
+            logger.error("❌ Authentication failed - invalid API key")
+            return False
+        elif project_response.status_code == 404:
+            logger.error("❌ Project not found: %s", project_id)
             return False
-    print()
+        else:
+            logger.error("❌ Failed to get project info: %s", project_response.status_code)
+            logger.error("   Response: %s", project_response.text)
+            return False
+    except Exception as e:
+        logger.error("❌ Error accessing project: %s", e)
+        return False
+    logger.info("")
 
     # Test project statistics
-    print("[4/4] Getting project statistics...")
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{api_url}/v1/projects/{project_id}/stats",
-                headers={"Authorization": f"Bearer {api_key}"}
-            )
-
-            if response.status_code == 200:
-                stats = response.json()
-                print(f"✅ Project stats retrieved:")
-                print(f"   Total operations: {stats.get('total_operations', 0)}")
-                print(f"   Vector count: {stats.get('vector_count', 0)}")
-                print(f"   Table count: {stats.get('table_count', 0)}")
-            else:
-                print(f"⚠️  Stats not available (status: {response.status_code})")
-        except Exception as e:
-            print(f"⚠️  Could not retrieve stats: {e}")
-    print()
-
-    print("=" * 70)
-    print("✅ ZeroDB connection test PASSED!")
-    print("=" * 70)
-    print()
-    print("Next steps:")
-    print("1. Create ZeroDB tables (ocean_pages, ocean_blocks, ocean_block_links, ocean_tags)")
-    print("2. Test table operations")
-    print("3. Test embeddings generation")
-    print("4. Start FastAPI application")
-    print()
+    logger.info("[4/4] Getting project statistics...")
+    try:
+        if isinstance(stats_response, Exception):
+            raise stats_response
+
+        if stats_response.status_code == 200:
+            stats = stats_response.json()
+            logger.info("✅ Project stats retrieved:")
+            logger.info("   Total operations: %s", stats.get('total_operations', 0))
+            logger.info("   Vector count: %s", stats.get('vector_count', 0))
+            logger.info("   Table count: %s", stats.get('table_count', 0))
+        else:
+            logger.warning("⚠️  Stats not available (status: %s)", stats_response.status_code)
+    except Exception as e:
+        logger.warning("⚠️  Could not retrieve stats: %s", e)
+    logger.info("")
+
+    logger.info("=" * 70)
+    logger.info("✅ ZeroDB connection test PASSED!")
+    logger.info("=" * 70)
+    logger.info("")
+    logger.info("Next steps:")
+    logger.info("1. Create ZeroDB tables (ocean_pages, ocean_blocks, ocean_block_links, ocean_tags)")
+    logger.info("2. Test table operations")
+    logger.info("3. Test embeddings generation")
+    logger.info("4. Start FastAPI application")
+    logger.info("")
 
     return True
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test ZeroDB API connection and project setup")
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only print warnings and failures"
+    )
+    args = parser.parse_args()
+    configure_logging(quiet=args.quiet)
+
     try:
-        result = asyncio.run(test_zerodb_connection())
+        result = run(test_zerodb_connection)
         sys.exit(0 if result else 1)
     except KeyboardInterrupt:
-        print("\n❌ Test cancelled by user")
+        logger.error("\n❌ Test cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Unexpected error: %s", e)
         sys.exit(1)
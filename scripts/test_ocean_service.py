@@ -11,16 +11,89 @@ This script tests all 6 OceanService methods:
 6. move_page
 """
 
+import argparse
 import asyncio
+import logging
 import os
 import sys
+from functools import partial
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import httpx
 from dotenv import load_dotenv
 from app.services.ocean_service import OceanService
+from scripts._service_fixture import run
+
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the stream buffer (and exit)."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logging(quiet: bool = False) -> None:
+    """
+    Send script output through one block-buffered stdout handler.
+
+    Lines are written in ~8 KiB chunks (and flushed at exit) instead of one
+    write per line; quiet mode drops everything below WARNING. With
+    OCEAN_LOG_JSON=1 (and python-json-logger installed) each record is
+    emitted as a JSON object for CI log ingestion.
+    """
+    stream = open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=8192,
+        encoding=sys.stdout.encoding or "utf-8",
+        closefd=False
+    )
+    handler = BufferedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if os.getenv("OCEAN_LOG_JSON") == "1":
+        try:
+            from pythonjsonlogger import jsonlogger
+            handler.setFormatter(
+                jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+            )
+        except ImportError:
+            pass
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+
+
+async def with_retry(
+    operation: Callable[[], Awaitable[Any]],
+    attempts: int = 3,
+    base_delay: float = 0.1,
+    max_delay: float = 2.0
+) -> Any:
+    """
+    Await an idempotent service call, retrying transient HTTP failures.
+
+    Waits base_delay * 2**attempt (capped at max_delay) between attempts.
+    Page creation is not wrapped, since a retried create could duplicate pages.
+    """
+    for attempt in range(attempts):
+        try:
+            return await operation()
+        except httpx.HTTPError as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt)
+            logger.warning("⚠️  %s, retrying in %.1fs", e, delay)
+            await asyncio.sleep(delay)
 
 
 async def test_ocean_service():
@@ -33,21 +106,21 @@ async def test_ocean_service():
     project_id = os.getenv("ZERODB_PROJECT_ID")
     api_key = os.getenv("ZERODB_API_KEY")
 
-    print("=" * 70)
-    print("Ocean Service - Page Operations Test")
-    print("=" * 70)
-    print()
+    logger.info("=" * 70)
+    logger.info("Ocean Service - Page Operations Test")
+    logger.info("=" * 70)
+    logger.info("")
 
     # Initialize Ocean service (no ZeroDB client needed - uses direct HTTP)
-    print("[Setup] Initializing Ocean service...")
+    logger.info("[Setup] Initializing Ocean service...")
     service = OceanService(
         api_url=api_url,
         api_key=api_key,
         project_id=project_id
     )
-    print(f"✅ Ocean service initialized")
-    print(f"   Project ID: {project_id}")
-    print()
+    logger.info("✅ Ocean service initialized")
+    logger.info("   Project ID: %s", project_id)
+    logger.info("")
 
     # Test organization ID (use a test org)
     test_org_id = "org_test_ocean"
@@ -55,7 +128,7 @@ async def test_ocean_service():
 
     try:
         # Test 1: Create root page
-        print("[Test 1/6] Creating root page...")
+        logger.info("[Test 1/6] Creating root page...")
         root_page = await service.create_page(
             org_id=test_org_id,
             user_id=test_user_id,
@@ -65,133 +138,157 @@ async def test_ocean_service():
                 "metadata": {"test": True}
             }
         )
-        print(f"✅ Root page created: {root_page['page_id']}")
-        print(f"   Title: {root_page['title']}")
-        print(f"   Position: {root_page['position']}")
-        print()
+        logger.info("✅ Root page created: %s", root_page['page_id'])
+        logger.info("   Title: %s", root_page['title'])
+        logger.info("   Position: %s", root_page['position'])
+        logger.info("")
 
-        # Test 2: Get page
-        print("[Test 2/6] Getting page by ID...")
-        retrieved_page = await service.get_page(
-            page_id=root_page["page_id"],
-            org_id=test_org_id
+        # Tests 2 and 3 only depend on the root page: run them concurrently
+        retrieved_page, nested_page = await asyncio.gather(
+            with_retry(partial(
+                service.get_page,
+                page_id=root_page["page_id"],
+                org_id=test_org_id
+            )),
+            service.create_page(
+                org_id=test_org_id,
+                user_id=test_user_id,
+                page_data={
+                    "title": "Nested Page",
+                    "icon": "📄",
+                    "parent_page_id": root_page["page_id"]
+                }
+            )
         )
+
+        # Test 2: Get page
+        logger.info("[Test 2/6] Getting page by ID...")
         if retrieved_page:
-            print(f"✅ Page retrieved: {retrieved_page['title']}")
-            print(f"   Created at: {retrieved_page['created_at']}")
+            logger.info("✅ Page retrieved: %s", retrieved_page['title'])
+            logger.info("   Created at: %s", retrieved_page['created_at'])
         else:
-            print(f"⚠️  Page not found (page_id: {root_page['page_id']})")
+            logger.warning("⚠️  Page not found (page_id: %s)", root_page['page_id'])
             # Try getting all pages to see what's there
-            all = await service.get_pages(test_org_id, filters={})
-            print(f"   Total pages in org: {len(all)}")
-        print()
+            all = await with_retry(partial(service.get_pages, test_org_id, filters={}))
+            logger.info("   Total pages in org: %s", len(all))
+        logger.info("")
 
         # Test 3: Create nested page
-        print("[Test 3/6] Creating nested page...")
-        nested_page = await service.create_page(
-            org_id=test_org_id,
-            user_id=test_user_id,
-            page_data={
-                "title": "Nested Page",
-                "icon": "📄",
-                "parent_page_id": root_page["page_id"]
-            }
-        )
-        print(f"✅ Nested page created: {nested_page['page_id']}")
-        print(f"   Parent: {nested_page['parent_page_id']}")
-        print(f"   Position: {nested_page['position']}")
-        print()
+        logger.info("[Test 3/6] Creating nested page...")
+        logger.info("✅ Nested page created: %s", nested_page['page_id'])
+        logger.info("   Parent: %s", nested_page['parent_page_id'])
+        logger.info("   Position: %s", nested_page['position'])
+        logger.info("")
 
         # Test 4: Get all pages
-        print("[Test 4/6] Getting all pages for organization...")
-        all_pages = await service.get_pages(
+        logger.info("[Test 4/6] Getting all pages for organization...")
+        all_pages = await with_retry(partial(
+            service.get_pages,
             org_id=test_org_id,
             filters={"is_archived": False}
-        )
-        print(f"✅ Retrieved {len(all_pages)} pages")
+        ))
+        logger.info("✅ Retrieved %s pages", len(all_pages))
         for page in all_pages:
-            print(f"   - {page['title']} (position: {page['position']})")
-        print()
+            logger.info("   - %s (position: %s)", page['title'], page['position'])
+        logger.info("")
 
-        # Test 5: Update page
-        print("[Test 5/6] Updating page...")
-        updated_page = await service.update_page(
-            page_id=root_page["page_id"],
-            org_id=test_org_id,
-            updates={
-                "title": "Updated Root Page",
-                "is_favorite": True
-            }
+        # Tests 5 and 6 touch different pages: run them concurrently
+        updated_page, moved_page = await asyncio.gather(
+            with_retry(partial(
+                service.update_page,
+                page_id=root_page["page_id"],
+                org_id=test_org_id,
+                updates={
+                    "title": "Updated Root Page",
+                    "is_favorite": True
+                }
+            )),
+            with_retry(partial(
+                service.move_page,
+                page_id=nested_page["page_id"],
+                new_parent_id=None,  # Move to root
+                org_id=test_org_id
+            ))
         )
-        print(f"✅ Page updated: {updated_page['title']}")
-        print(f"   Is favorite: {updated_page['is_favorite']}")
-        print()
+
+        # Test 5: Update page
+        logger.info("[Test 5/6] Updating page...")
+        logger.info("✅ Page updated: %s", updated_page['title'])
+        logger.info("   Is favorite: %s", updated_page['is_favorite'])
+        logger.info("")
 
         # Test 6: Move page
-        print("[Test 6/6] Moving nested page to root...")
-        moved_page = await service.move_page(
-            page_id=nested_page["page_id"],
-            new_parent_id=None,  # Move to root
-            org_id=test_org_id
-        )
-        print(f"✅ Page moved: {moved_page['title']}")
-        print(f"   New parent: {moved_page['parent_page_id']} (None = root)")
-        print(f"   New position: {moved_page['position']}")
-        print()
+        logger.info("[Test 6/6] Moving nested page to root...")
+        logger.info("✅ Page moved: %s", moved_page['title'])
+        logger.info("   New parent: %s (None = root)", moved_page['parent_page_id'])
+        logger.info("   New position: %s", moved_page['position'])
+        logger.info("")
 
         # Test 7: Delete page
-        print("[Cleanup] Deleting test pages...")
-        deleted_root = await service.delete_page(
-            page_id=root_page["page_id"],
-            org_id=test_org_id
-        )
-        deleted_nested = await service.delete_page(
-            page_id=nested_page["page_id"],
-            org_id=test_org_id
+        logger.info("[Cleanup] Deleting test pages...")
+        deleted_root, deleted_nested = await asyncio.gather(
+            with_retry(partial(
+                service.delete_page,
+                page_id=root_page["page_id"],
+                org_id=test_org_id
+            )),
+            with_retry(partial(
+                service.delete_page,
+                page_id=nested_page["page_id"],
+                org_id=test_org_id
+            ))
         )
-        print(f"✅ Pages deleted (archived): root={deleted_root}, nested={deleted_nested}")
-        print()
+        logger.info("✅ Pages deleted (archived): root=%s, nested=%s", deleted_root, deleted_nested)
+        logger.info("")
 
         # Verify deletion
-        print("[Verify] Checking archived pages...")
-        archived_pages = await service.get_pages(
+        logger.info("[Verify] Checking archived pages...")
+        archived_pages = await with_retry(partial(
+            service.get_pages,
             org_id=test_org_id,
             filters={"is_archived": True}
-        )
-        print(f"✅ Found {len(archived_pages)} archived pages")
-        print()
-
-        print("=" * 70)
-        print("✅ All OceanService tests PASSED!")
-        print("=" * 70)
-        print()
-        print("Summary:")
-        print("- ✅ create_page: Creates pages with auto-incrementing positions")
-        print("- ✅ get_page: Retrieves pages by ID with org isolation")
-        print("- ✅ get_pages: Lists pages with filtering and pagination")
-        print("- ✅ update_page: Updates page fields and timestamps")
-        print("- ✅ delete_page: Soft deletes pages (is_archived=True)")
-        print("- ✅ move_page: Moves pages between parents with position recalc")
-        print()
+        ))
+        logger.info("✅ Found %s archived pages", len(archived_pages))
+        logger.info("")
+
+        logger.info("=" * 70)
+        logger.info("✅ All OceanService tests PASSED!")
+        logger.info("=" * 70)
+        logger.info("")
+        logger.info("Summary:")
+        logger.info("- ✅ create_page: Creates pages with auto-incrementing positions")
+        logger.info("- ✅ get_page: Retrieves pages by ID with org isolation")
+        logger.info("- ✅ get_pages: Lists pages with filtering and pagination")
+        logger.info("- ✅ update_page: Updates page fields and timestamps")
+        logger.info("- ✅ delete_page: Soft deletes pages (is_archived=True)")
+        logger.info("- ✅ move_page: Moves pages between parents with position recalc")
+        logger.info("")
 
         return True
 
     except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Ocean service test failed: %s", e)
         return False
+    finally:
+        await service.aclose()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test OceanService page operations")
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only print warnings and failures"
+    )
+    args = parser.parse_args()
+    configure_logging(quiet=args.quiet)
+
     try:
-        result = asyncio.run(test_ocean_service())
+        result = run(test_ocean_service)
         sys.exit(0 if result else 1)
     except KeyboardInterrupt:
-        print("\n❌ Test cancelled by user")
+        logger.error("\n❌ Test cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Unexpected error: %s", e)
         sys.exit(1)
@@ -16,12 +16,15 @@ import os
 import sys
 import time
 from datetime import datetime, timedelta
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
+import numpy as np
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.ocean_service import OceanService
+from scripts._service_fixture import get_service, run
 
 # Load environment
 load_dotenv()
@@ -33,6 +36,67 @@ PROJECT_ID = os.getenv("ZERODB_PROJECT_ID")
 TEST_ORG_ID = "test-org-search"
 TEST_USER_ID = "test-user-search"
 
+# Max searches in flight at once when a test fans out independent queries
+MAX_CONCURRENCY = 8
+
+# Max block deletes in flight during cleanup
+CLEANUP_CONCURRENCY = 16
+
+
+async def gather_timed(
+    operations: List[Awaitable[Any]],
+    max_concurrency: int = MAX_CONCURRENCY
+) -> Tuple[List[Tuple[Any, float]], float]:
+    """
+    Run independent operations concurrently (bounded by a semaphore).
+
+    Returns:
+        ([(result, elapsed_ms), ...] in input order, total wall-clock ms)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(operation: Awaitable[Any]) -> Tuple[Any, float]:
+        async with semaphore:
+            start_ns = time.perf_counter_ns()
+            result = await operation
+            return result, (time.perf_counter_ns() - start_ns) / 1e6
+
+    start_ns = time.perf_counter_ns()
+    timed_results = await asyncio.gather(*(bounded(op) for op in operations))
+    return timed_results, (time.perf_counter_ns() - start_ns) / 1e6
+
+
+# Display previews by (block_id, updated_at); blocks recur across queries
+_previews: Dict[Tuple[str, Optional[str]], str] = {}
+
+
+def block_preview(service: OceanService, block: Dict[str, Any], length: Optional[int] = 60) -> str:
+    """Searchable text of a block for display, truncated to length characters."""
+    key = (block["block_id"], block.get("updated_at"))
+    preview = _previews.get(key)
+    if preview is None:
+        preview = _previews[key] = service._extract_searchable_text(block)
+    return preview[:length]
+
+
+async def wait_for_page(
+    service: OceanService,
+    page_id: str,
+    timeout: float = 2.0,
+    interval: float = 0.025
+) -> None:
+    """
+    Poll until a newly created page is readable.
+
+    Raises:
+        TimeoutError: If the page is not readable within timeout seconds
+    """
+    deadline = time.perf_counter() + timeout
+    while not await service.get_page(page_id, TEST_ORG_ID):
+        if time.perf_counter() >= deadline:
+            raise TimeoutError(f"Page {page_id} not readable after {timeout}s")
+        await asyncio.sleep(interval)
+
 
 async def setup_test_data(service: OceanService) -> dict:
     """Create test pages and blocks for search demonstration"""
@@ -52,8 +116,8 @@ async def setup_test_data(service: OceanService) -> dict:
     )
     print(f"✓ Created test page: {page['page_id']}")
 
-    # Small delay to allow ZeroDB replication
-    await asyncio.sleep(1)
+    # Wait until ZeroDB returns the new page (replication)
+    await wait_for_page(service, page["page_id"])
 
     # Create diverse test blocks
     test_blocks = [
@@ -132,29 +196,30 @@ async def test_semantic_search(service: OceanService):
         "technical implementation details"
     ]
 
-    for query in queries:
-        print(f"\nQuery: '{query}'")
-        start_time = time.time()
-
-        results = await service.search(
+    timed_results, wall_ms = await gather_timed([
+        service.search(
             query=query,
             org_id=TEST_ORG_ID,
             search_type="semantic",
             limit=5,
             threshold=0.6
         )
+        for query in queries
+    ])
 
-        elapsed_ms = (time.time() - start_time) * 1000
-
+    for query, (results, elapsed_ms) in zip(queries, timed_results):
+        print(f"\nQuery: '{query}'")
         print(f"Results: {len(results)} blocks found in {elapsed_ms:.1f}ms")
 
         for i, result in enumerate(results[:3], 1):
             block = result["block"]
             score = result["score"]
-            preview = service._extract_searchable_text(block)[:60]
+            preview = block_preview(service, block)
 
             print(f"  {i}. [{block['block_type']}] {preview}... (score: {score:.3f})")
 
+    print(f"\n{len(queries)} queries completed in {wall_ms:.1f}ms wall-clock")
+
 
 async def test_metadata_search(service: OceanService, page_id: str):
     """Test metadata-based search with filters"""
@@ -175,7 +240,7 @@ async def test_metadata_search(service: OceanService, page_id: str):
     print(f"Results: {len(results)} heading blocks found")
     for i, result in enumerate(results, 1):
         block = result["block"]
-        preview = service._extract_searchable_text(block)
+        preview = block_preview(service, block, length=None)
         print(f"  {i}. {preview}")
 
     # Test 2: Filter by page
@@ -191,7 +256,7 @@ async def test_metadata_search(service: OceanService, page_id: str):
     print(f"Results: {len(results)} blocks found on page")
     for i, result in enumerate(results[:3], 1):
         block = result["block"]
-        preview = service._extract_searchable_text(block)[:60]
+        preview = block_preview(service, block)
         print(f"  {i}. [{block['block_type']}] {preview}...")
 
 
@@ -222,7 +287,7 @@ async def test_hybrid_search(service: OceanService, page_id: str):
     for test_case in test_cases:
         print(f"\nQuery: '{test_case['query']}'")
         print(f"Filters: {test_case['description']}")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         results = await service.search(
             query=test_case["query"],
@@ -233,7 +298,7 @@ async def test_hybrid_search(service: OceanService, page_id: str):
             threshold=0.6
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         print(f"Results: {len(results)} blocks found in {elapsed_ms:.1f}ms")
 
@@ -241,27 +306,48 @@ async def test_hybrid_search(service: OceanService, page_id: str):
             block = result["block"]
             final_score = result.get("final_score", result["score"])
             match_type = result.get("match_type", "unknown")
-            preview = service._extract_searchable_text(block)[:60]
+            preview = block_preview(service, block)
 
             print(f"  {i}. [{block['block_type']}] {preview}... (score: {final_score:.3f}, type: {match_type})")
 
 
+def print_latency_histogram(times: np.ndarray, buckets: int = 10, width: int = 40):
+    """Print a text histogram of latencies (ms) using log-spaced buckets."""
+    low = max(float(times.min()), 0.01)
+    high = max(float(times.max()), low * 1.01)
+    counts, edges = np.histogram(times, bins=np.geomspace(low, high, buckets + 1))
+    peak = max(int(counts.max()), 1)
+
+    for count, start, end in zip(counts, edges[:-1], edges[1:]):
+        bar = "#" * int(round(count / peak * width))
+        print(f"  {start:8.1f} - {end:8.1f}ms | {bar} {count}")
+
+
+def print_latency_summary(label: str, times: np.ndarray) -> float:
+    """Print average/percentile/min/max latencies (ms) and return the P95."""
+    p50_time, p95_time, p99_time = np.percentile(times, [50, 95, 99], method="nearest")
+
+    print(f"\n{label}:")
+    print(f"  Average: {float(np.mean(times)):.1f}ms")
+    print(f"  P50: {p50_time:.1f}ms")
+    print(f"  P95: {p95_time:.1f}ms")
+    print(f"  P99: {p99_time:.1f}ms")
+    print(f"  Min: {times.min():.1f}ms")
+    print(f"  Max: {times.max():.1f}ms")
+    return float(p95_time)
+
+
 async def test_performance(service: OceanService):
-    """Test search performance"""
+    """Test search performance, with and without the query caches"""
     print("\n" + "="*80)
     print("TEST 4: Performance Benchmarks")
     print("="*80)
 
     query = "vector search knowledge"
-    iterations = 5
+    iterations = 100
 
-    print(f"\nRunning {iterations} iterations of hybrid search...")
-    times = []
-
-    for i in range(iterations):
-        start_time = time.time()
-
-        await service.search(
+    def search():
+        return service.search(
             query=query,
             org_id=TEST_ORG_ID,
             search_type="hybrid",
@@ -269,26 +355,54 @@ async def test_performance(service: OceanService):
             threshold=0.7
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
-        times.append(elapsed_ms)
-
-        print(f"  Iteration {i+1}: {elapsed_ms:.1f}ms")
+    # Untimed warmup: the first call pays for DNS, TLS and connection setup
+    await service.search(
+        query="warmup",
+        org_id=TEST_ORG_ID,
+        search_type="hybrid",
+        limit=20,
+        threshold=0.7
+    )
 
-    avg_time = sum(times) / len(times)
-    p95_time = sorted(times)[int(len(times) * 0.95)]
+    # Uncached: the embedding and result caches are cleared before every
+    # search, so each one embeds the query and scans vectors. Run one at a
+    # time, since a concurrent search would refill the caches.
+    print(f"\nRunning {iterations} uncached iterations of hybrid search (sequential)...")
+    uncached_times = np.empty(iterations, dtype=np.float64)
+    for i in range(iterations):
+        service._embedding_cache.clear()
+        service._result_cache.invalidate(TEST_ORG_ID)
+        start_ns = time.perf_counter_ns()
+        await search()
+        uncached_times[i] = (time.perf_counter_ns() - start_ns) / 1e6
+
+    # Cached: the last uncached search left the query in both caches
+    print(f"Running {iterations} cached iterations of hybrid search "
+          f"(up to {MAX_CONCURRENCY} concurrent)...")
+    timed_results, wall_ms = await gather_timed([search() for _ in range(iterations)])
+    cached_times = np.array([elapsed_ms for _, elapsed_ms in timed_results], dtype=np.float64)
 
     print(f"\nPerformance Summary:")
-    print(f"  Average: {avg_time:.1f}ms")
-    print(f"  P95: {p95_time:.1f}ms")
-    print(f"  Min: {min(times):.1f}ms")
-    print(f"  Max: {max(times):.1f}ms")
+    p95_time = print_latency_summary("Uncached (embedding + vector search)", uncached_times)
+    print_latency_summary("Cached (result cache hits)", cached_times)
+    print(f"  Wall-clock: {wall_ms:.1f}ms ({iterations / wall_ms * 1000:.1f} searches/s)")
+
+    cache_info = service.embedding_cache_info()
+    lookups = cache_info.hits + cache_info.misses
+    hit_rate = cache_info.hits / lookups * 100 if lookups else 0.0
+    print(f"  Embedding cache (cached run): {cache_info.hits}/{lookups} hits ({hit_rate:.0f}%), "
+          f"{cache_info.currsize}/{cache_info.maxsize} entries")
 
-    # Check if performance meets target
+    # Log-spaced buckets (HDR-style) separate cache hits from full searches
+    print(f"\nLatency histogram (both runs):")
+    print_latency_histogram(np.concatenate([uncached_times, cached_times]))
+
+    # The target applies to real searches, not cache hits
     target = 200  # ms
     if p95_time < target:
-        print(f"  ✓ PASS: P95 ({p95_time:.1f}ms) < target ({target}ms)")
+        print(f"  ✓ PASS: uncached P95 ({p95_time:.1f}ms) < target ({target}ms)")
     else:
-        print(f"  ✗ WARN: P95 ({p95_time:.1f}ms) >= target ({target}ms)")
+        print(f"  ✗ WARN: uncached P95 ({p95_time:.1f}ms) >= target ({target}ms)")
 
 
 async def test_edge_cases(service: OceanService):
@@ -355,8 +469,19 @@ async def cleanup_test_data(service: OceanService, page_id: str):
     blocks = await service.get_blocks_by_page(page_id, TEST_ORG_ID)
     print(f"Deleting {len(blocks)} blocks...")
 
-    for block in blocks:
-        await service.delete_block(block["block_id"], TEST_ORG_ID)
+    # Deletes are independent; run them concurrently with bounded fan-out
+    semaphore = asyncio.Semaphore(CLEANUP_CONCURRENCY)
+
+    async def delete(block_id: str):
+        async with semaphore:
+            await service.delete_block(block_id, TEST_ORG_ID)
+
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            for block in blocks:
+                tg.create_task(delete(block["block_id"]))
+    else:  # Python < 3.11
+        await asyncio.gather(*(delete(block["block_id"]) for block in blocks))
 
     # Delete the page
     await service.delete_page(page_id, TEST_ORG_ID)
@@ -378,11 +503,7 @@ async def main():
     print(f"Test Organization: {TEST_ORG_ID}")
 
     # Initialize service
-    service = OceanService(
-        api_url=API_URL,
-        api_key=API_KEY,
-        project_id=PROJECT_ID
-    )
+    service = get_service()
 
     try:
         # Setup test data
@@ -410,10 +531,13 @@ async def main():
         if 'test_data' in locals():
             await cleanup_test_data(service, test_data["page_id"])
 
+        # Close the service's pooled HTTP connections
+        await service.aclose()
+
     print("\n" + "="*80)
     print("Issue #13: Hybrid semantic search implementation COMPLETE")
     print("="*80)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
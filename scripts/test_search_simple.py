@@ -9,7 +9,6 @@ Prerequisites:
 - Existing blocks in database (from previous tests)
 """
 
-import asyncio
 import os
 import sys
 import time
@@ -19,6 +18,7 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.ocean_service import OceanService
+from scripts._service_fixture import get_service, run
 
 # Load environment
 load_dotenv()
@@ -29,7 +29,7 @@ API_KEY = os.getenv("ZERODB_API_KEY")
 PROJECT_ID = os.getenv("ZERODB_PROJECT_ID")
 
 
-async def test_search_implementation():
+async def run_search_implementation(service: OceanService):
     """Test the search() method implementation"""
     print("\n" + "="*80)
     print("Ocean Hybrid Semantic Search - Implementation Test (Issue #13)")
@@ -37,13 +37,6 @@ async def test_search_implementation():
     print(f"API URL: {API_URL}")
     print(f"Project ID: {PROJECT_ID[:8]}...{PROJECT_ID[-8:]}")
 
-    # Initialize service
-    service = OceanService(
-        api_url=API_URL,
-        api_key=API_KEY,
-        project_id=PROJECT_ID
-    )
-
     # Test 1: Validate search method exists and has correct signature
     print("\n" + "="*80)
     print("TEST 1: Method Signature Validation")
@@ -109,6 +102,16 @@ async def test_search_implementation():
     except Exception as e:
         print(f"Note: Search execution had error (expected if no data): {e}")
 
+    # Metadata search must not call the embeddings API
+    from unittest.mock import AsyncMock, patch
+    with patch.object(
+        service,
+        "_generate_query_embedding",
+        AsyncMock(side_effect=AssertionError("metadata search generated an embedding"))
+    ), patch.object(service, "_search_metadata", AsyncMock(return_value=[])):
+        await service.search(query="test query", org_id="non-existent-org", search_type="metadata")
+    print("✓ Metadata search skips query embedding")
+
     # Test 3: Code structure validation
     print("\n" + "="*80)
     print("TEST 3: Implementation Structure")
@@ -144,8 +147,16 @@ async def test_search_implementation():
     print("TEST 4: Implementation Size")
     print("="*80)
 
-    search_source = inspect.getsource(service.search)
-    search_lines = len(search_source.splitlines())
+    # Parse the class source once and take every method's length from the AST
+    import ast
+    class_tree = ast.parse(inspect.getsource(OceanService))
+    line_counts = {
+        node.name: node.end_lineno - node.lineno + 1
+        for node in ast.walk(class_tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    search_lines = line_counts["search"]
     print(f"✓ search() method: ~{search_lines} lines")
 
     # Count all search-related methods
@@ -164,9 +175,7 @@ async def test_search_implementation():
 
     total_lines = search_lines
     for method_name in search_methods:
-        method = getattr(service, method_name)
-        source = inspect.getsource(method)
-        lines = len(source.splitlines())
+        lines = line_counts[method_name]
         total_lines += lines
         print(f"  {method_name}: ~{lines} lines")
 
@@ -233,8 +242,11 @@ async def main():
         print("ERROR: Missing ZERODB_API_KEY or ZERODB_PROJECT_ID in .env")
         return
 
+    # Initialize service
+    service = get_service()
+
     try:
-        await test_search_implementation()
+        await run_search_implementation(service)
         await test_performance_target()
 
         print("\n" + "="*80)
@@ -255,6 +267,10 @@ async def main():
         import traceback
         traceback.print_exc()
 
+    finally:
+        # Close the service's pooled HTTP connections
+        await service.aclose()
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
@@ -17,44 +17,87 @@ Usage:
 import asyncio
 import os
 import sys
-from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+
+import httpx
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.services.ocean_service import OceanService
+from scripts._service_fixture import API_KEY, API_URL, PROJECT_ID, create_service, run
+
+TEST_ORG_ID = "test-org-tag-service"
+TEST_USER_ID = "test-user-123"
+
+# Minimal block row for tag assignment, inserted directly (no page or
+# embedding needed); cleanup_test_data deletes it after each run
+TEST_BLOCK_ID = "test-block-123"
+TEST_BLOCK_DOC = {
+    "block_id": TEST_BLOCK_ID,
+    "organization_id": TEST_ORG_ID,
+    "page_id": "test-page-123",
+    "user_id": TEST_USER_ID,
+    "type": "text",
+    "content": {"text": "Test block for tag assignment"},
+    "properties": {"tags": []},
+    "created_at": "2025-12-24T10:00:00Z",
+    "updated_at": "2025-12-24T10:00:00Z"
+}
+
+
+# (step name, exception) for every failed step of the run
+FAILURES = []
+
+
+@asynccontextmanager
+async def step(name):
+    """
+    Run one test step, recording a failure instead of aborting the run.
+
+    Later steps still run (on the same client); steps that depend on a
+    failed one fail in turn and are recorded too.
+    """
+    print(name)
+    print("-" * 80)
+    try:
+        yield
+    except Exception as e:
+        FAILURES.append((name, e))
+        print(f"✗ FAILED: {e}")
+    print()
+
 
-# Load environment variables
-load_dotenv()
+def print_lines(lines):
+    """Print lines with a single write instead of one print() per line."""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
 
 
-async def test_tag_service():
-    """Test all tag operations."""
+def print_usage_counts(tags):
+    """Print each tag's usage count."""
+    print_lines(f"  - {tag['name']}: {tag['usage_count']} usage(s)" for tag in tags)
 
-    # Initialize service
-    api_url = os.getenv("ZERODB_API_URL", "https://api.ainative.studio")
-    api_key = os.getenv("ZERODB_API_KEY")
-    project_id = os.getenv("ZERODB_PROJECT_ID")
 
-    if not api_key or not project_id:
+async def run_tag_service(client: httpx.AsyncClient):
+    """Test all tag operations, sending every request through client."""
+
+    if not API_KEY or not PROJECT_ID:
         print("ERROR: ZERODB_API_KEY and ZERODB_PROJECT_ID must be set in .env")
         return
 
     print("=" * 80)
     print("Ocean Tag Service Test Suite")
     print("=" * 80)
-    print(f"API URL: {api_url}")
-    print(f"Project ID: {project_id}")
+    print(f"API URL: {API_URL}")
+    print(f"Project ID: {PROJECT_ID}")
     print()
 
-    service = OceanService(api_url, api_key, project_id)
-    test_org_id = "test-org-tag-service"
-    test_user_id = "test-user-123"
+    service = create_service(client)
+    test_org_id = TEST_ORG_ID
 
     # Test 1: Create tags
-    print("TEST 1: Create Tags")
-    print("-" * 80)
-
     tag1_data = {
         "name": "Important",
         "color": "#EF4444",  # Red
@@ -72,16 +115,17 @@ async def test_tag_service():
         "color": "#F59E0B",  # Orange
     }
 
-    try:
-        tag1 = await service.create_tag(test_org_id, tag1_data)
+    async with step("TEST 1: Create Tags"):
+        # Independent creates (distinct names): run them concurrently
+        tag1, tag2, tag3 = await asyncio.gather(
+            service.create_tag(test_org_id, tag1_data),
+            service.create_tag(test_org_id, tag2_data),
+            service.create_tag(test_org_id, tag3_data)
+        )
         print(f"✓ Created tag 1: {tag1['name']} ({tag1['tag_id']})")
         print(f"  Color: {tag1['color']}, Description: {tag1['description']}")
         print(f"  Usage count: {tag1['usage_count']}")
-
-        tag2 = await service.create_tag(test_org_id, tag2_data)
         print(f"✓ Created tag 2: {tag2['name']} ({tag2['tag_id']})")
-
-        tag3 = await service.create_tag(test_org_id, tag3_data)
         print(f"✓ Created tag 3: {tag3['name']} ({tag3['tag_id']})")
 
         # Test duplicate name prevention
@@ -92,41 +136,22 @@ async def test_tag_service():
         except ValueError as e:
             print(f"✓ Correctly rejected duplicate: {e}")
 
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return
-
-    print()
-
     # Test 2: Get tags
-    print("TEST 2: Get Tags")
-    print("-" * 80)
-
-    try:
-        all_tags = await service.get_tags(test_org_id)
+    async with step("TEST 2: Get Tags"):
+        # All tags, filter by name, filter by color: read-only, run concurrently
+        all_tags, filtered, red_tags = await asyncio.gather(
+            service.get_tags(test_org_id),
+            service.get_tags(test_org_id, {"name": "Important"}),
+            service.get_tags(test_org_id, {"color": "#EF4444"})
+        )
         print(f"✓ Retrieved {len(all_tags)} tags for organization")
-        for tag in all_tags:
-            print(f"  - {tag['name']} ({tag['color']}) - Usage: {tag['usage_count']}")
+        print_lines(f"  - {tag['name']} ({tag['color']}) - Usage: {tag['usage_count']}" for tag in all_tags)
 
-        # Test filtering by name
-        filtered = await service.get_tags(test_org_id, {"name": "Important"})
         print(f"\n✓ Filter by name 'Important': {len(filtered)} result(s)")
-
-        # Test filtering by color
-        red_tags = await service.get_tags(test_org_id, {"color": "#EF4444"})
         print(f"✓ Filter by color '#EF4444': {len(red_tags)} result(s)")
 
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return
-
-    print()
-
     # Test 3: Update tag
-    print("TEST 3: Update Tag")
-    print("-" * 80)
-
-    try:
+    async with step("TEST 3: Update Tag"):
         updated_tag = await service.update_tag(
             tag1['tag_id'],
             test_org_id,
@@ -148,56 +173,35 @@ async def test_tag_service():
         except ValueError as e:
             print(f"✓ Correctly rejected conflict: {e}")
 
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return
-
-    print()
-
     # Test 4: Create a test block for tag assignment
     print("TEST 4: Create Test Block for Tag Assignment")
     print("-" * 80)
 
     try:
         # Note: This requires ocean_blocks table to exist
-        # For now, we'll create a mock block document
-        test_block_id = "test-block-123"
-
-        # Create a test block directly in ZeroDB
-        import httpx
-        async with httpx.AsyncClient() as client:
-            block_doc = {
-                "block_id": test_block_id,
-                "organization_id": test_org_id,
-                "page_id": "test-page-123",
-                "user_id": test_user_id,
-                "type": "text",
-                "content": {"text": "Test block for tag assignment"},
-                "properties": {"tags": []},
-                "created_at": "2025-12-24T10:00:00Z",
-                "updated_at": "2025-12-24T10:00:00Z"
-            }
+        test_block_id = TEST_BLOCK_ID
+
+        # Create the test block directly in ZeroDB (on the shared client)
+        response = await client.post(
+            f"{API_URL}/v1/public/zerodb/mcp/execute",
+            headers=service.headers,
+            json={
+                "operation": "insert_rows",
+                "params": {
+                    "project_id": PROJECT_ID,
+                    "table_name": "ocean_blocks",
+                    "rows": [TEST_BLOCK_DOC]
+                }
+            },
+            timeout=30.0
+        )
 
-            response = await client.post(
-                f"{api_url}/v1/public/zerodb/mcp/execute",
-                headers=service.headers,
-                json={
-                    "operation": "insert_rows",
-                    "params": {
-                        "project_id": project_id,
-                        "table_name": "ocean_blocks",
-                        "rows": [block_doc]
-                    }
-                },
-                timeout=30.0
-            )
-
-            if response.status_code == 200:
-                print(f"✓ Created test block: {test_block_id}")
-            else:
-                print(f"Note: Could not create test block (ocean_blocks table may not exist yet)")
-                print(f"  Skipping tag assignment tests")
-                test_block_id = None
+        if response.status_code == 200:
+            print(f"✓ Created test block: {test_block_id}")
+        else:
+            print(f"Note: Could not create test block (ocean_blocks table may not exist yet)")
+            print(f"  Skipping tag assignment tests")
+            test_block_id = None
 
     except Exception as e:
         print(f"Note: Could not create test block: {e}")
@@ -208,10 +212,7 @@ async def test_tag_service():
 
     # Test 5: Assign tags to block
     if test_block_id:
-        print("TEST 5: Assign Tags to Block")
-        print("-" * 80)
-
-        try:
+        async with step("TEST 5: Assign Tags to Block"):
             # Assign tag1 to block
             success = await service.assign_tag_to_block(test_block_id, tag1['tag_id'], test_org_id)
             print(f"✓ Assigned tag '{updated_tag['name']}' to block: {success}")
@@ -223,8 +224,7 @@ async def test_tag_service():
             # Check usage counts
             tags_after_assign = await service.get_tags(test_org_id)
             print("\nUsage counts after assignment:")
-            for tag in tags_after_assign:
-                print(f"  - {tag['name']}: {tag['usage_count']} usage(s)")
+            print_usage_counts(tags_after_assign)
 
             # Test duplicate assignment prevention
             print("\nTesting duplicate assignment prevention...")
@@ -234,17 +234,8 @@ async def test_tag_service():
             else:
                 print(f"✗ FAILED: Should have prevented duplicate assignment")
 
-        except Exception as e:
-            print(f"✗ FAILED: {e}")
-            return
-
-        print()
-
         # Test 6: Remove tag from block
-        print("TEST 6: Remove Tag from Block")
-        print("-" * 80)
-
-        try:
+        async with step("TEST 6: Remove Tag from Block"):
             # Remove tag1 from block
             success = await service.remove_tag_from_block(test_block_id, tag1['tag_id'], test_org_id)
             print(f"✓ Removed tag '{updated_tag['name']}' from block: {success}")
@@ -252,8 +243,7 @@ async def test_tag_service():
             # Check usage counts
             tags_after_remove = await service.get_tags(test_org_id)
             print("\nUsage counts after removal:")
-            for tag in tags_after_remove:
-                print(f"  - {tag['name']}: {tag['usage_count']} usage(s)")
+            print_usage_counts(tags_after_remove)
 
             # Test removal of non-assigned tag
             print("\nTesting removal of non-assigned tag...")
@@ -263,25 +253,15 @@ async def test_tag_service():
             else:
                 print(f"✗ FAILED: Should have returned False")
 
-        except Exception as e:
-            print(f"✗ FAILED: {e}")
-            return
-
-        print()
-
     # Test 7: Delete tag
-    print("TEST 7: Delete Tag")
-    print("-" * 80)
-
-    try:
+    async with step("TEST 7: Delete Tag"):
         success = await service.delete_tag(tag3['tag_id'], test_org_id)
         print(f"✓ Deleted tag '{tag3['name']}': {success}")
 
         # Verify deletion
         remaining_tags = await service.get_tags(test_org_id)
         print(f"✓ Remaining tags: {len(remaining_tags)}")
-        for tag in remaining_tags:
-            print(f"  - {tag['name']}")
+        print_lines(f"  - {tag['name']}" for tag in remaining_tags)
 
         # Test deletion of non-existent tag
         print("\nTesting deletion of non-existent tag...")
@@ -291,16 +271,16 @@ async def test_tag_service():
         else:
             print(f"✗ FAILED: Should have returned False")
 
-    except Exception as e:
-        print(f"✗ FAILED: {e}")
-        return
-
-    print()
-
     # Summary
     print("=" * 80)
     print("TEST SUMMARY")
     print("=" * 80)
+    if FAILURES:
+        print(f"✗ {len(FAILURES)} step(s) failed:")
+        print_lines(f"  - {name}: {error}" for name, error in FAILURES)
+        print("=" * 80)
+        return
+
     print("✓ All tag service tests passed!")
     print()
     print("Implemented methods:")
@@ -321,5 +301,31 @@ async def test_tag_service():
     print("=" * 80)
 
 
+async def cleanup_test_data(client: httpx.AsyncClient):
+    """Delete all tags and blocks of the test organization (so reruns start clean)."""
+    if not API_KEY or not PROJECT_ID:
+        return
+
+    service = create_service(client)
+    deleted_tags, deleted_blocks = await asyncio.gather(
+        service.bulk_delete_by_org(service.tags_table_name, TEST_ORG_ID),
+        service.bulk_delete_by_org(service.blocks_table_name, TEST_ORG_ID)
+    )
+    print(f"Cleanup: deleted {deleted_tags} tag(s) and {deleted_blocks} block(s)")
+
+
+async def main():
+    """Run the tag tests over one pooled HTTP client."""
+    async with httpx.AsyncClient(
+        http2=OceanService.HTTP2_ENABLED,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=30.0
+    ) as client:
+        try:
+            await run_tag_service(client)
+        finally:
+            await cleanup_test_data(client)
+
+
 if __name__ == "__main__":
-    asyncio.run(test_tag_service())
+    run(main)
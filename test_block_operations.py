@@ -16,33 +16,26 @@ Run this script to verify all functionality works correctly.
 
 import asyncio
 import sys
-import os
-from dotenv import load_dotenv
+import httpx
 
-# Load environment variables
-load_dotenv()
-
-# Import service
+# Import service (configuration is read from the environment / .env)
 from app.services.ocean_service import OceanService
-
-# Configuration from environment
-API_URL = os.getenv("ZERODB_API_URL", "https://api.ainative.studio")
-API_KEY = os.getenv("ZERODB_API_KEY")
-PROJECT_ID = os.getenv("ZERODB_PROJECT_ID", "public")
+from scripts._service_fixture import create_service, run
 
 # Test organization and user
 TEST_ORG_ID = "test-org-ocean-blocks"
 TEST_USER_ID = "test-user-ocean-blocks"
 
 
-async def main():
+async def run_block_operations(client: httpx.AsyncClient):
+    """Test all block operations, sending every request through client."""
     print("=" * 80)
     print("Ocean Block Operations Test Suite (Issue #7)")
     print("=" * 80)
     print()
 
     # Initialize service
-    service = OceanService(API_URL, API_KEY, PROJECT_ID)
+    service = create_service(client)
     print("✓ OceanService initialized")
     print()
 
@@ -119,55 +112,73 @@ async def main():
         print(f"✗ Failed to create task block: {e}")
         return
 
-    # Step 4: Test create_block_batch
+    # Step 4: Test create_block_batch (one embedding request, one insert_rows call)
     print("Step 4: Testing create_block_batch (5 blocks)...")
+    batch_blocks = [
+        {
+            "block_type": "heading",
+            "content": {"text": "Heading: Ocean Features"}
+        },
+        {
+            "block_type": "text",
+            "content": {"text": "Ocean supports real-time collaboration"}
+        },
+        {
+            "block_type": "list",
+            "content": {"items": ["Feature 1", "Feature 2", "Feature 3"]}
+        },
+        {
+            "block_type": "link",
+            "content": {
+                "text": "Ocean Documentation",
+                "url": "https://ocean.ainative.studio"
+            }
+        },
+        {
+            "block_type": "page_link",
+            "content": {
+                "displayText": "Related Page",
+                "linkedPageId": None
+            }
+        }
+    ]
     try:
         blocks_batch = await service.create_block_batch(
             page_id=page_id,
             org_id=TEST_ORG_ID,
             user_id=TEST_USER_ID,
-            blocks_list=[
-                {
-                    "block_type": "heading",
-                    "content": {"text": "Heading: Ocean Features"}
-                },
-                {
-                    "block_type": "text",
-                    "content": {"text": "Ocean supports real-time collaboration"}
-                },
-                {
-                    "block_type": "list",
-                    "content": {"items": ["Feature 1", "Feature 2", "Feature 3"]}
-                },
-                {
-                    "block_type": "link",
-                    "content": {
-                        "text": "Ocean Documentation",
-                        "url": "https://ocean.ainative.studio"
-                    }
-                },
-                {
-                    "block_type": "page_link",
-                    "content": {
-                        "displayText": "Related Page",
-                        "linkedPageId": None
-                    }
-                }
-            ]
+            blocks_list=batch_blocks
         )
         print(f"✓ Batch created {len(blocks_batch)} blocks")
-        for idx, block in enumerate(blocks_batch):
-            has_vector = "✓" if block.get("vector_id") else "✗"
-            print(f"  {has_vector} Block {idx + 1}: {block['block_type']} (pos {block['position']})")
+        sys.stdout.write("".join(
+            f"  {'✓' if block.get('vector_id') else '✗'} Block {idx + 1}: "
+            f"{block['block_type']} (pos {block['position']})\n"
+            for idx, block in enumerate(blocks_batch)
+        ))
+        # All rows go out in a single insert_rows call, so the blocks come back
+        # in request order
+        if [block["block_type"] for block in blocks_batch] == [block["block_type"] for block in batch_blocks]:
+            print("  ✓ Blocks returned in request order")
+        else:
+            print("  ✗ WARNING: Blocks returned out of request order")
         print()
     except Exception as e:
         print(f"✗ Failed to create batch: {e}")
         return
 
+    # Steps 5 and 6 only read what steps 2-4 wrote: run both reads concurrently
+    retrieved_block, all_blocks = await asyncio.gather(
+        service.get_block(block1_id, TEST_ORG_ID),
+        service.get_blocks_by_page(page_id, TEST_ORG_ID),
+        return_exceptions=True
+    )
+
     # Step 5: Test get_block
     print("Step 5: Testing get_block...")
+    if isinstance(retrieved_block, Exception):
+        print(f"✗ Failed to get block: {retrieved_block}")
+        return
     try:
-        retrieved_block = await service.get_block(block1_id, TEST_ORG_ID)
         if retrieved_block:
             print(f"✓ Retrieved block: {block1_id}")
             print(f"  Type: {retrieved_block['block_type']}")
@@ -182,13 +193,16 @@ async def main():
 
     # Step 6: Test get_blocks_by_page
     print("Step 6: Testing get_blocks_by_page...")
+    if isinstance(all_blocks, Exception):
+        print(f"✗ Failed to get blocks by page: {all_blocks}")
+        return
     try:
-        all_blocks = await service.get_blocks_by_page(page_id, TEST_ORG_ID)
         print(f"✓ Retrieved {len(all_blocks)} blocks for page")
         print("  Blocks by position:")
-        for block in all_blocks[:5]:  # Show first 5
-            content_preview = str(block['content'])[:40]
-            print(f"    [{block['position']}] {block['block_type']}: {content_preview}...")
+        sys.stdout.write("".join(  # Show first 5
+            f"    [{block['position']}] {block['block_type']}: {str(block['content'])[:40]}...\n"
+            for block in all_blocks[:5]
+        ))
         if len(all_blocks) > 5:
             print(f"    ... and {len(all_blocks) - 5} more")
         print()
@@ -235,9 +249,11 @@ async def main():
             # Verify order
             all_blocks = await service.get_blocks_by_page(page_id, TEST_ORG_ID)
             print(f"  Updated order:")
-            for block in all_blocks[:5]:
-                marker = "👉" if block['block_id'] == block1_id else "  "
-                print(f"    {marker} [{block['position']}] {block['block_type']}")
+            sys.stdout.write("".join(
+                f"    {'👉' if block['block_id'] == block1_id else '  '} "
+                f"[{block['position']}] {block['block_type']}\n"
+                for block in all_blocks[:5]
+            ))
         else:
             print(f"✗ Failed to move block")
         print()
@@ -326,5 +342,15 @@ async def main():
     print("=" * 80)
 
 
+async def main():
+    """Run the block tests over one pooled HTTP client."""
+    async with httpx.AsyncClient(
+        http2=OceanService.HTTP2_ENABLED,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=30.0
+    ) as client:
+        await run_block_operations(client)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
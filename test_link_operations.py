@@ -2,49 +2,95 @@
 """
 Test script for Ocean link management operations.
 
-This script tests the 4 link management methods:
+This script tests the 5 link management methods:
 1. create_link() - Create bidirectional links with circular reference prevention
-2. delete_link() - Delete links with org isolation
-3. get_page_backlinks() - Get all blocks linking to a page
-4. get_block_backlinks() - Get all blocks linking to a block
+2. create_link_batch() - Create several links with one insert
+3. delete_link() - Delete links with org isolation
+4. get_page_backlinks() - Get all blocks linking to a page
+5. get_block_backlinks() - Get all blocks linking to a block
+
+Credentials are read from the environment (ZERODB_API_KEY and
+ZERODB_PROJECT_ID, .env is loaded). Under pytest the test is skipped when
+they are missing, before any request is sent.
 
 Usage:
     python test_link_operations.py
+    pytest test_link_operations.py
 """
 
 import asyncio
+import functools
+import io
 import sys
 from datetime import datetime
-from app.services.ocean_service import OceanService
 
-# Configuration (update these with your ZeroDB credentials)
-ZERODB_API_URL = "https://api.ainative.studio"
-ZERODB_API_KEY = "your-api-key-here"  # TODO: Update
-ZERODB_PROJECT_ID = "your-project-id-here"  # TODO: Update
+import pytest
+
+from app.services.ocean_service import OceanService
+from scripts._service_fixture import API_KEY, PROJECT_ID, create_service
 
 # Test organization and user IDs
 TEST_ORG_ID = "test-org-links-001"
 TEST_USER_ID = "test-user-links-001"
 
 
-async def test_link_operations():
+def flush_output(out: io.StringIO):
+    """Write buffered output to stdout in one call and reset the buffer."""
+    sys.stdout.write(out.getvalue())
+    out.seek(0)
+    out.truncate(0)
+
+
+@pytest.fixture
+async def service():
+    """OceanService from the environment; skips when ZeroDB credentials are missing."""
+    if not (API_KEY and PROJECT_ID):
+        pytest.skip("ZERODB_API_KEY and ZERODB_PROJECT_ID are required")
+
+    # Leaving the block closes the pooled HTTP client, so every call in the
+    # run shares one set of keep-alive connections
+    async with create_service() as service:
+        yield service
+
+
+@pytest.mark.integration
+async def test_link_operations(service: OceanService):
     """Test all link management operations."""
+    assert await run_link_operations(service)
+
+
+async def main():
+    """Run the link tests as a script."""
     print("=" * 70)
     print("Ocean Link Management Test Script")
     print("=" * 70)
     print()
 
-    # Initialize service
     print("Initializing Ocean service...")
-    service = OceanService(
-        api_url=ZERODB_API_URL,
-        api_key=ZERODB_API_KEY,
-        project_id=ZERODB_PROJECT_ID
-    )
-    print("✓ Service initialized\n")
+    async with create_service() as service:
+        print("✓ Service initialized\n")
+        return await run_link_operations(service)
+
+
+async def run_link_operations(service: OceanService) -> bool:
+    """
+    Run the link test steps on an open service, buffering their output.
+
+    Returns True if every step passed.
+    """
+    out = io.StringIO()
+    try:
+        return await _run_link_steps(service, out)
+    finally:
+        flush_output(out)
+
+
+async def _run_link_steps(service: OceanService, out: io.StringIO) -> bool:
+    """Link test steps; output goes to out and is written to stdout once per step."""
+    emit = functools.partial(print, file=out)
 
     # Step 1: Create test page
-    print("STEP 1: Creating test page...")
+    emit("STEP 1: Creating test page...")
     try:
         page = await service.create_page(
             org_id=TEST_ORG_ID,
@@ -56,76 +102,98 @@ async def test_link_operations():
             }
         )
         page_id = page["page_id"]
-        print(f"✓ Page created: {page_id}")
-        print(f"  Title: {page['title']}")
-        print()
+        emit(f"✓ Page created: {page_id}")
+        emit(f"  Title: {page['title']}")
+        emit()
     except Exception as e:
-        print(f"✗ Failed to create page: {e}")
-        return
+        emit(f"✗ Failed to create page: {e}")
+        return False
+
+    flush_output(out)
 
     # Step 2: Create test blocks
-    print("STEP 2: Creating test blocks...")
-    block_ids = []
+    emit("STEP 2: Creating test blocks...")
     try:
-        # Create 3 test blocks
-        for i in range(3):
-            block = await service.create_block(
-                page_id=page_id,
-                org_id=TEST_ORG_ID,
-                user_id=TEST_USER_ID,
-                block_data={
+        # Create 3 test blocks in one batch insert (one embedding call)
+        blocks = await service.create_block_batch(
+            page_id=page_id,
+            org_id=TEST_ORG_ID,
+            user_id=TEST_USER_ID,
+            blocks_list=[
+                {
                     "block_type": "text",
                     "content": {"text": f"Test block {i+1} for linking"},
                     "position": i
                 }
-            )
-            block_ids.append(block["block_id"])
-            print(f"✓ Block {i+1} created: {block['block_id']}")
-        print()
+                for i in range(3)
+            ]
+        )
+        block_ids = [block["block_id"] for block in blocks]
+        for i, block_id in enumerate(block_ids):
+            emit(f"✓ Block {i+1} created: {block_id}")
+        emit()
     except Exception as e:
-        print(f"✗ Failed to create blocks: {e}")
-        return
+        emit(f"✗ Failed to create blocks: {e}")
+        return False
 
-    # Step 3: Test create_link (block-to-block)
-    print("STEP 3: Testing create_link (block-to-block)...")
+    flush_output(out)
+
+    # Steps 3-4: the block-to-block and block-to-page links are created with a
+    # single batch insert; a failure is reported by both steps
     try:
-        link1 = await service.create_link(
-            source_block_id=block_ids[0],
-            target_id=block_ids[1],
-            link_type="reference",
+        link1, link2 = await service.create_link_batch(
             org_id=TEST_ORG_ID,
-            is_page_link=False
+            links_list=[
+                {
+                    "source_block_id": block_ids[0],
+                    "target_id": block_ids[1],
+                    "link_type": "reference"
+                },
+                {
+                    "source_block_id": block_ids[2],
+                    "target_id": page_id,
+                    "link_type": "mention",
+                    "is_page_link": True
+                }
+            ]
         )
-        print(f"✓ Link created: {link1['link_id']}")
-        print(f"  Type: {link1['link_type']}")
-        print(f"  Source: {link1['source_block_id']}")
-        print(f"  Target: {link1['target_block_id']}")
-        print()
     except Exception as e:
-        print(f"✗ Failed to create link: {e}")
-        return
+        link1 = link2 = e
+
+    # Step 3: Test create_link (block-to-block)
+    emit("STEP 3: Testing create_link (block-to-block)...")
+    try:
+        if isinstance(link1, Exception):
+            raise link1
+        emit(f"✓ Link created: {link1['link_id']}")
+        emit(f"  Type: {link1['link_type']}")
+        emit(f"  Source: {link1['source_block_id']}")
+        emit(f"  Target: {link1['target_block_id']}")
+        emit()
+    except Exception as e:
+        emit(f"✗ Failed to create link: {e}")
+        return False
+
+    flush_output(out)
 
     # Step 4: Test create_link (block-to-page)
-    print("STEP 4: Testing create_link (block-to-page)...")
+    emit("STEP 4: Testing create_link (block-to-page)...")
     try:
-        link2 = await service.create_link(
-            source_block_id=block_ids[2],
-            target_id=page_id,
-            link_type="mention",
-            org_id=TEST_ORG_ID,
-            is_page_link=True
-        )
-        print(f"✓ Page link created: {link2['link_id']}")
-        print(f"  Type: {link2['link_type']}")
-        print(f"  Source Block: {link2['source_block_id']}")
-        print(f"  Target Page: {link2['target_page_id']}")
-        print()
+        if isinstance(link2, Exception):
+            raise link2
+        emit(f"✓ Page link created: {link2['link_id']}")
+        emit(f"  Type: {link2['link_type']}")
+        emit(f"  Source Block: {link2['source_block_id']}")
+        emit(f"  Target Page: {link2['target_page_id']}")
+        emit()
     except Exception as e:
-        print(f"✗ Failed to create page link: {e}")
-        return
+        emit(f"✗ Failed to create page link: {e}")
+        return False
+
+    flush_output(out)
 
     # Step 5: Test circular reference prevention
-    print("STEP 5: Testing circular reference prevention...")
+    emit("STEP 5: Testing circular reference prevention...")
     try:
         # Try to create circular link: block[1] -> block[0] (should fail)
         circular_link = await service.create_link(
@@ -135,89 +203,109 @@ async def test_link_operations():
             org_id=TEST_ORG_ID,
             is_page_link=False
         )
-        print(f"✗ Circular reference NOT prevented! Link created: {circular_link['link_id']}")
-        print("  This is a bug - circular references should be blocked")
-        print()
+        emit(f"✗ Circular reference NOT prevented! Link created: {circular_link['link_id']}")
+        emit("  This is a bug - circular references should be blocked")
+        emit()
+        return False
     except ValueError as e:
         if "Circular reference detected" in str(e):
-            print(f"✓ Circular reference prevented correctly")
-            print(f"  Error: {e}")
-            print()
+            emit(f"✓ Circular reference prevented correctly")
+            emit(f"  Error: {e}")
+            emit()
         else:
-            print(f"✗ Unexpected error: {e}")
-            return
+            emit(f"✗ Unexpected error: {e}")
+            return False
     except Exception as e:
-        print(f"✗ Failed with unexpected error: {e}")
-        return
+        emit(f"✗ Failed with unexpected error: {e}")
+        return False
 
-    # Step 6: Test get_block_backlinks
-    print("STEP 6: Testing get_block_backlinks...")
-    try:
-        backlinks = await service.get_block_backlinks(
+    flush_output(out)
+
+    # Steps 6-7: block and page backlinks are independent reads; fetch both concurrently
+    backlinks, page_backlinks = await asyncio.gather(
+        service.get_block_backlinks(
             block_id=block_ids[1],
             org_id=TEST_ORG_ID
-        )
-        print(f"✓ Retrieved {len(backlinks)} backlinks for block {block_ids[1]}")
+        ),
+        service.get_page_backlinks(
+            page_id=page_id,
+            org_id=TEST_ORG_ID
+        ),
+        return_exceptions=True
+    )
+
+    # Step 6: Test get_block_backlinks
+    emit("STEP 6: Testing get_block_backlinks...")
+    try:
+        if isinstance(backlinks, Exception):
+            raise backlinks
+        emit(f"✓ Retrieved {len(backlinks)} backlinks for block {block_ids[1]}")
         for bl in backlinks:
-            print(f"  - Link {bl['link_id']} ({bl['link_type']})")
-            print(f"    From block: {bl['source_block_id']}")
-            print(f"    Preview: {bl['source_content_preview']}")
-        print()
+            emit(f"  - Link {bl['link_id']} ({bl['link_type']})")
+            emit(f"    From block: {bl['source_block_id']}")
+            emit(f"    Preview: {bl['source_content_preview']}")
+        emit()
     except Exception as e:
-        print(f"✗ Failed to get backlinks: {e}")
-        return
+        emit(f"✗ Failed to get backlinks: {e}")
+        return False
+
+    flush_output(out)
 
     # Step 7: Test get_page_backlinks
-    print("STEP 7: Testing get_page_backlinks...")
+    emit("STEP 7: Testing get_page_backlinks...")
     try:
-        page_backlinks = await service.get_page_backlinks(
-            page_id=page_id,
-            org_id=TEST_ORG_ID
-        )
-        print(f"✓ Retrieved {len(page_backlinks)} backlinks for page {page_id}")
+        if isinstance(page_backlinks, Exception):
+            raise page_backlinks
+        emit(f"✓ Retrieved {len(page_backlinks)} backlinks for page {page_id}")
         for bl in page_backlinks:
-            print(f"  - Link {bl['link_id']} ({bl['link_type']})")
-            print(f"    From block: {bl['source_block_id']}")
-            print(f"    Preview: {bl['source_content_preview']}")
-        print()
+            emit(f"  - Link {bl['link_id']} ({bl['link_type']})")
+            emit(f"    From block: {bl['source_block_id']}")
+            emit(f"    Preview: {bl['source_content_preview']}")
+        emit()
     except Exception as e:
-        print(f"✗ Failed to get page backlinks: {e}")
-        return
+        emit(f"✗ Failed to get page backlinks: {e}")
+        return False
+
+    flush_output(out)
 
     # Step 8: Test delete_link
-    print("STEP 8: Testing delete_link...")
+    emit("STEP 8: Testing delete_link...")
     try:
         deleted = await service.delete_link(
             link_id=link1['link_id'],
             org_id=TEST_ORG_ID
         )
         if deleted:
-            print(f"✓ Link deleted: {link1['link_id']}")
+            emit(f"✓ Link deleted: {link1['link_id']}")
         else:
-            print(f"✗ Failed to delete link (returned False)")
-        print()
+            emit(f"✗ Failed to delete link (returned False)")
+        emit()
     except Exception as e:
-        print(f"✗ Failed to delete link: {e}")
-        return
+        emit(f"✗ Failed to delete link: {e}")
+        return False
+
+    flush_output(out)
 
     # Step 9: Verify deletion
-    print("STEP 9: Verifying link deletion...")
+    emit("STEP 9: Verifying link deletion...")
     try:
         backlinks_after_delete = await service.get_block_backlinks(
             block_id=block_ids[1],
             org_id=TEST_ORG_ID
         )
-        print(f"✓ Backlinks after deletion: {len(backlinks_after_delete)}")
-        print(f"  Before: 1 backlink, After: {len(backlinks_after_delete)} backlinks")
+        emit(f"✓ Backlinks after deletion: {len(backlinks_after_delete)}")
+        emit(f"  Before: 1 backlink, After: {len(backlinks_after_delete)} backlinks")
         if len(backlinks_after_delete) == 0:
-            print("  Link successfully deleted!")
-        print()
+            emit("  Link successfully deleted!")
+        emit()
     except Exception as e:
-        print(f"✗ Failed to verify deletion: {e}")
-        return
+        emit(f"✗ Failed to verify deletion: {e}")
+        return False
+
+    flush_output(out)
 
     # Step 10: Test multi-tenant isolation
-    print("STEP 10: Testing multi-tenant isolation...")
+    emit("STEP 10: Testing multi-tenant isolation...")
     try:
         # Try to access link from different org (should return False)
         wrong_org_delete = await service.delete_link(
@@ -225,44 +313,49 @@ async def test_link_operations():
             org_id="wrong-org-id"
         )
         if wrong_org_delete:
-            print(f"✗ Multi-tenant isolation BROKEN! Link deleted from wrong org")
+            emit(f"✗ Multi-tenant isolation BROKEN! Link deleted from wrong org")
+            return False
         else:
-            print(f"✓ Multi-tenant isolation working")
-            print(f"  Link not accessible from different organization")
-        print()
+            emit(f"✓ Multi-tenant isolation working")
+            emit(f"  Link not accessible from different organization")
+        emit()
     except Exception as e:
-        print(f"✗ Failed isolation test: {e}")
-        return
+        emit(f"✗ Failed isolation test: {e}")
+        return False
+
+    flush_output(out)
 
     # Summary
-    print("=" * 70)
-    print("Test Summary")
-    print("=" * 70)
-    print("✓ All 4 link management methods tested successfully:")
-    print("  1. create_link() - Creates links with validation")
-    print("  2. delete_link() - Deletes links with org isolation")
-    print("  3. get_page_backlinks() - Retrieves page backlinks")
-    print("  4. get_block_backlinks() - Retrieves block backlinks")
-    print()
-    print("✓ Circular reference prevention working")
-    print("✓ Multi-tenant isolation working")
-    print("✓ Bidirectional linking working")
-    print()
-    print("Link management implementation complete! 🎉")
-    print("=" * 70)
+    emit("=" * 70)
+    emit("Test Summary")
+    emit("=" * 70)
+    emit("✓ All 5 link management methods tested successfully:")
+    emit("  1. create_link() - Creates links with validation")
+    emit("  2. create_link_batch() - Creates links with one insert")
+    emit("  3. delete_link() - Deletes links with org isolation")
+    emit("  4. get_page_backlinks() - Retrieves page backlinks")
+    emit("  5. get_block_backlinks() - Retrieves block backlinks")
+    emit()
+    emit("✓ Circular reference prevention working")
+    emit("✓ Multi-tenant isolation working")
+    emit("✓ Bidirectional linking working")
+    emit()
+    emit("Link management implementation complete! 🎉")
+    emit("=" * 70)
+    return True
 
 
 if __name__ == "__main__":
     # Check configuration
-    if ZERODB_API_KEY == "your-api-key-here":
-        print("❌ ERROR: Please update ZERODB_API_KEY in the script")
-        print("   Edit test_link_operations.py and set your ZeroDB API key")
+    if not API_KEY:
+        print("❌ ERROR: ZERODB_API_KEY is not set")
+        print("   Set it in the environment or in .env")
         sys.exit(1)
 
-    if ZERODB_PROJECT_ID == "your-project-id-here":
-        print("❌ ERROR: Please update ZERODB_PROJECT_ID in the script")
-        print("   Edit test_link_operations.py and set your ZeroDB project ID")
+    if not PROJECT_ID:
+        print("❌ ERROR: ZERODB_PROJECT_ID is not set")
+        print("   Set it in the environment or in .env")
         sys.exit(1)
 
     # Run tests
-    asyncio.run(test_link_operations())
+    sys.exit(0 if asyncio.run(main()) else 1)
@@ -0,0 +1,128 @@
+"""
+In-memory fake of the ZeroDB HTTP API for OceanService tests.
+
+FakeZeroDB serves the table, MCP and embedding endpoints that OceanService
+calls, from plain dicts, through an httpx.MockTransport. The real service
+runs unchanged on top of it, so client-side rules (circular link
+prevention, organization isolation, deletion visibility) are exercised
+without network round trips:
+
+    zerodb = FakeZeroDB()
+    async with httpx.AsyncClient(transport=zerodb.transport()) as client:
+        service = OceanService(api_url=..., api_key=..., project_id=..., client=client)
+
+Filters are plain field equality, which is all OceanService sends.
+"""
+
+import re
+import uuid
+from typing import Any, Dict, List, Optional
+
+import httpx
+import orjson
+
+
+TABLE_ROUTE = re.compile(r"^/v1/projects/[^/]+/database/tables/(?P<table>[^/]+)/(?P<action>rows|query)(?:/(?P<row_id>[^/]+))?$")
+EMBED_ROUTE = re.compile(r"^/v1/[^/]+/embeddings/embed-and-store$")
+MCP_ROUTE = "/v1/public/zerodb/mcp/execute"
+
+
+class FakeZeroDB:
+    """ZeroDB tables kept in memory: table name -> row_id -> row_data"""
+
+    def __init__(self):
+        self.tables: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.request_count = 0
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport that answers OceanService requests from this fake"""
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Route one request to the matching table, MCP or embedding handler"""
+        self.request_count += 1
+        path = request.url.path
+        body = orjson.loads(request.content) if request.content else {}
+
+        if path == MCP_ROUTE:
+            return self._mcp(body["operation"], body.get("params", {}))
+
+        if EMBED_ROUTE.match(path):
+            return httpx.Response(200, json={
+                "vector_ids": [str(uuid.uuid4()) for _ in body["texts"]]
+            })
+
+        match = TABLE_ROUTE.match(path)
+        if not match:
+            return httpx.Response(404, json={"detail": f"Unknown route {path}"})
+
+        table = self.tables.setdefault(match["table"], {})
+        row_id = match["row_id"]
+
+        if match["action"] == "query":
+            rows = self._filter(table, body.get("filter"))
+            skip = body.get("skip", 0)
+            rows = rows[skip:skip + body.get("limit", 100)]
+            return httpx.Response(200, json={
+                "data": [{"row_id": rid, "row_data": data} for rid, data in rows]
+            })
+
+        if row_id is None and request.method == "POST":
+            row_id = self._insert(table, body["row_data"])
+            return httpx.Response(201, json={"row_id": row_id})
+
+        if row_id not in table:
+            return httpx.Response(404, json={"detail": "Row not found"})
+
+        if request.method == "PATCH":
+            table[row_id].update(body["row_data"])
+            return httpx.Response(200, json={"row_id": row_id, "row_data": table[row_id]})
+
+        if request.method == "DELETE":
+            del table[row_id]
+            return httpx.Response(204)
+
+        return httpx.Response(405)
+
+    def _mcp(self, operation: str, params: Dict[str, Any]) -> httpx.Response:
+        """Handle an MCP bridge operation"""
+        if operation == "insert_rows":
+            table = self.tables.setdefault(params["table_name"], {})
+            for row in params["rows"]:
+                self._insert(table, row)
+            return httpx.Response(200, json={
+                "success": True,
+                "result": {"inserted": len(params["rows"])}
+            })
+
+        if operation == "query_rows":
+            table = self.tables.setdefault(params["table_name"], {})
+            rows = self._filter(table, params.get("filter"))[:params.get("limit", 100)]
+            return httpx.Response(200, json={
+                "success": True,
+                "result": {"rows": [{**data, "row_id": rid} for rid, data in rows]}
+            })
+
+        if operation == "delete_vector":
+            return httpx.Response(200, json={"success": True})
+
+        return httpx.Response(200, json={"success": False, "error": f"Unsupported operation {operation}"})
+
+    @staticmethod
+    def _insert(table: Dict[str, Dict[str, Any]], row_data: Dict[str, Any]) -> str:
+        """Store a copy of row_data under a new row_id"""
+        row_id = str(uuid.uuid4())
+        table[row_id] = dict(row_data)
+        return row_id
+
+    @staticmethod
+    def _filter(
+        table: Dict[str, Dict[str, Any]],
+        filters: Optional[Dict[str, Any]]
+    ) -> List[tuple]:
+        """(row_id, row_data) pairs whose fields equal every filter value"""
+        filters = filters or {}
+        return [
+            (row_id, data) for row_id, data in table.items()
+            if all(data.get(field) == value for field, value in filters.items())
+        ]
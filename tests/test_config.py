@@ -10,43 +10,24 @@ import pytest
 from app.config import Settings
 
 
-class TestSettings:
-    """Test Settings configuration"""
-
-    def test_settings_loads_successfully(self):
-        """Test that Settings can be instantiated"""
-        settings = Settings()
-
-        # Verify core attributes exist
-        assert hasattr(settings, 'PROJECT_NAME')
-        assert hasattr(settings, 'API_V1_STR')
-        assert hasattr(settings, 'DEBUG')
-        assert hasattr(settings, 'BACKEND_CORS_ORIGINS')
-
-    def test_api_v1_str_has_correct_prefix(self):
-        """Test that API_V1_STR has the correct format"""
-        settings = Settings()
-
-        assert settings.API_V1_STR.startswith('/api/v')
+@pytest.fixture(scope="session")
+def settings():
+    """One Settings instance for the session (env parsing and validation run once)"""
+    return Settings()
 
-    def test_backend_cors_origins_is_list(self):
-        """Test that BACKEND_CORS_ORIGINS is a list"""
-        settings = Settings()
 
-        assert isinstance(settings.BACKEND_CORS_ORIGINS, list)
-
-    def test_project_name_is_non_empty(self):
-        """Test that PROJECT_NAME is set"""
-        settings = Settings()
-
-        assert settings.PROJECT_NAME
-        assert len(settings.PROJECT_NAME) > 0
-
-    def test_debug_is_boolean(self):
-        """Test that DEBUG is a boolean"""
-        settings = Settings()
+class TestSettings:
+    """Test Settings configuration"""
 
-        assert isinstance(settings.DEBUG, bool)
+    @pytest.mark.parametrize("attr,predicate", [
+        pytest.param("PROJECT_NAME", lambda v: isinstance(v, str) and len(v) > 0, id="project-name-non-empty"),
+        pytest.param("API_V1_STR", lambda v: v.startswith("/api/v"), id="api-v1-prefix"),
+        pytest.param("BACKEND_CORS_ORIGINS", lambda v: isinstance(v, list), id="cors-origins-list"),
+        pytest.param("DEBUG", lambda v: isinstance(v, bool), id="debug-boolean"),
+    ])
+    def test_settings_attribute(self, settings, attr, predicate):
+        """Test that core settings exist and have the expected format"""
+        assert predicate(getattr(settings, attr))
 
 
 if __name__ == "__main__":
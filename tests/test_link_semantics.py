@@ -0,0 +1,52 @@
+"""
+Link Semantics Tests
+
+Runs the link steps from test_link_operations.py (create, batch create,
+circular reference prevention, backlinks, deletion, organization isolation)
+against an in-memory FakeZeroDB instead of the real API. The service logic
+is the real OceanService; only the HTTP backend is faked, so these run in
+milliseconds without credentials. test_link_operations.py keeps covering
+the wire contract against ZeroDB.
+"""
+
+import httpx
+import pytest
+
+from app.services.ocean_service import OceanService
+from fake_zerodb import FakeZeroDB
+from test_link_operations import TEST_ORG_ID, run_link_operations
+
+
+@pytest.fixture
+def zerodb():
+    """Empty in-memory ZeroDB"""
+    return FakeZeroDB()
+
+
+@pytest.fixture
+async def service(zerodb):
+    """OceanService whose HTTP client is served by the fake"""
+    async with httpx.AsyncClient(transport=zerodb.transport()) as client:
+        yield OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project",
+            client=client
+        )
+
+
+async def test_link_operations(service):
+    """Every link step passes against the fake backend"""
+    assert await run_link_operations(service)
+
+
+async def test_links_are_scoped_to_organization(service, zerodb):
+    """Links are stored with their org and invisible to other orgs"""
+    assert await run_link_operations(service)
+
+    links = zerodb.tables[service.links_table_name].values()
+    assert links and all(link["organization_id"] == TEST_ORG_ID for link in links)
+
+    [remaining] = links
+    assert await service.get_page_backlinks(remaining["target_page_id"], "other-org") == []
+    assert not await service.delete_link(remaining["link_id"], "other-org")
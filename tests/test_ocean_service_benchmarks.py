@@ -0,0 +1,97 @@
+"""
+OceanService Latency Benchmarks
+
+Times the main write operations against ZeroDB with the async_benchmark
+fixture (warmup, then repeated rounds) and asserts their p95 stays within the
+realistic targets from PERFORMANCE.md. A regression that adds a sequential
+round trip (e.g. un-batching create_block_batch) pushes p95 over budget.
+
+    pytest tests/test_ocean_service_benchmarks.py -m slow
+
+Tests are skipped when ZeroDB credentials are not configured.
+"""
+
+import itertools
+
+import pytest
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow, pytest.mark.asyncio(scope="session")]
+
+TEST_USER_ID = "test-user-benchmark"
+
+# Realistic p95 targets in seconds (PERFORMANCE.md, "Realistic Targets")
+BLOCK_CRUD_P95 = 0.8
+TAG_CRUD_P95 = 0.8
+
+
+@pytest.fixture
+def bench_page(ocean_loop, ocean_service, test_org):
+    """A page in the test organization to write blocks to."""
+    return ocean_loop.run_until_complete(ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Ocean Benchmark Page"}
+    ))
+
+
+async def test_create_tag_latency(ocean_service, test_org, async_benchmark):
+    """create_tag p95 within the CRUD target."""
+    names = (f"bench-tag-{i}" for i in itertools.count())
+    try:
+        stats = await async_benchmark(
+            lambda: ocean_service.create_tag(test_org, {"name": next(names)})
+        )
+    finally:
+        await ocean_service.bulk_delete_by_org(ocean_service.tags_table_name, test_org)
+
+    assert stats["p95"] < TAG_CRUD_P95
+
+
+async def test_create_block_latency(ocean_service, test_org, bench_page, async_benchmark):
+    """create_block (including its embedding) p95 within the block CRUD target."""
+    stats = await async_benchmark(lambda: ocean_service.create_block(
+        page_id=bench_page["page_id"],
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        block_data={"block_type": "text", "content": {"text": "Benchmark block"}}
+    ))
+
+    assert stats["p95"] < BLOCK_CRUD_P95
+
+
+async def test_create_block_batch_latency(ocean_service, test_org, bench_page, async_benchmark):
+    """A 5-block batch costs about as much as a single block."""
+    blocks = [
+        {"block_type": "text", "content": {"text": f"Benchmark batch block {i}"}}
+        for i in range(5)
+    ]
+    stats = await async_benchmark(lambda: ocean_service.create_block_batch(
+        page_id=bench_page["page_id"],
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        blocks_list=blocks
+    ))
+
+    assert stats["p95"] < BLOCK_CRUD_P95
+
+
+async def test_move_block_latency(ocean_service, test_org, bench_page, async_benchmark):
+    """move_block p95 within the block CRUD target."""
+    blocks = await ocean_service.create_block_batch(
+        page_id=bench_page["page_id"],
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        blocks_list=[
+            {"block_type": "text", "content": {"text": f"Benchmark move block {i}"}}
+            for i in range(5)
+        ]
+    )
+    block_id = blocks[0]["block_id"]
+    positions = itertools.cycle([4, 0])
+
+    stats = await async_benchmark(
+        lambda: ocean_service.move_block(block_id, next(positions), test_org)
+    )
+
+    assert stats["p95"] < BLOCK_CRUD_P95
@@ -0,0 +1,142 @@
+"""
+OceanService Block Operations Integration Tests
+
+pytest port of test_block_operations.py. Exercises the block methods of
+OceanService directly against ZeroDB (no API server needed):
+1. create_block
+2. create_block_batch
+3. get_block
+4. get_blocks_by_page
+5. update_block
+6. delete_block
+7. move_block
+8. convert_block_type
+
+Each test runs in its own organization (see the test_org fixture), so the
+suite can be fanned out with pytest-xdist alongside the tag tests:
+
+    pytest tests/test_ocean_service_blocks.py tests/test_ocean_service_tags.py -n auto
+
+Tests are skipped when ZeroDB credentials are not configured.
+"""
+
+import pytest
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(scope="session")]
+
+TEST_USER_ID = "test-user-ocean-blocks"
+
+BATCH_BLOCKS = [
+    {"block_type": "heading", "content": {"text": "Heading: Ocean Features"}},
+    {"block_type": "text", "content": {"text": "Ocean supports real-time collaboration"}},
+    {"block_type": "list", "content": {"items": ["Feature 1", "Feature 2", "Feature 3"]}},
+    {"block_type": "link", "content": {"text": "Ocean Documentation", "url": "https://ocean.ainative.studio"}},
+    {"block_type": "page_link", "content": {"displayText": "Related Page", "linkedPageId": None}},
+]
+
+
+@pytest.fixture
+def block_page(ocean_loop, ocean_service, test_org):
+    """A page in the test organization to hold blocks."""
+    return ocean_loop.run_until_complete(ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Block Operations Test Page", "icon": "🧪"}
+    ))
+
+
+@pytest.fixture
+def page_blocks(ocean_loop, ocean_service, test_org, block_page):
+    """BATCH_BLOCKS created on the page, in order."""
+    return ocean_loop.run_until_complete(ocean_service.create_block_batch(
+        page_id=block_page["page_id"],
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        blocks_list=BATCH_BLOCKS
+    ))
+
+
+@pytest.mark.parametrize("block_data", [
+    pytest.param({"block_type": "text", "content": {"text": "This is a test text block for Ocean."}}, id="text"),
+    pytest.param({
+        "block_type": "task",
+        "content": {"text": "Complete Ocean block operations implementation", "checked": False},
+        "properties": {"priority": "high"}
+    }, id="task"),
+])
+async def test_create_and_get_block(ocean_service, test_org, block_page, block_data):
+    """create_block embeds searchable content and get_block returns it."""
+    block = await ocean_service.create_block(
+        page_id=block_page["page_id"],
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        block_data=block_data
+    )
+
+    assert block["vector_id"]
+    assert block["vector_dimensions"] == 768
+
+    retrieved = await ocean_service.get_block(block["block_id"], test_org)
+    assert retrieved["block_type"] == block_data["block_type"]
+    assert retrieved["content"] == block_data["content"]
+
+
+async def test_create_block_batch(page_blocks):
+    """Batch blocks keep their order and types and are all embedded."""
+    assert [block["block_type"] for block in page_blocks] == [b["block_type"] for b in BATCH_BLOCKS]
+    assert [block["position"] for block in page_blocks] == list(range(len(BATCH_BLOCKS)))
+    assert all(block["vector_id"] for block in page_blocks)
+
+
+async def test_get_blocks_by_page(ocean_service, test_org, block_page, page_blocks):
+    """get_blocks_by_page lists the page's blocks by position."""
+    blocks = await ocean_service.get_blocks_by_page(block_page["page_id"], test_org)
+
+    assert [block["block_id"] for block in blocks] == [block["block_id"] for block in page_blocks]
+
+
+async def test_update_block_regenerates_embedding(ocean_service, test_org, page_blocks):
+    """Changing a block's text replaces its embedding."""
+    block = page_blocks[1]
+    updated = await ocean_service.update_block(
+        block_id=block["block_id"],
+        org_id=test_org,
+        updates={"content": {"text": "UPDATED: This text has been modified"}}
+    )
+
+    assert updated["content"]["text"] == "UPDATED: This text has been modified"
+    assert updated["vector_id"] and updated["vector_id"] != block["vector_id"]
+
+
+async def test_move_block(ocean_service, test_org, block_page, page_blocks):
+    """move_block puts the block at the new position and renumbers the rest."""
+    block_id = page_blocks[0]["block_id"]
+    moved = await ocean_service.move_block(block_id=block_id, new_position=3, org_id=test_org)
+
+    assert moved["position"] == 3
+    blocks = await ocean_service.get_blocks_by_page(block_page["page_id"], test_org)
+    assert [block["position"] for block in blocks] == list(range(len(BATCH_BLOCKS)))
+    assert blocks[3]["block_id"] == block_id
+
+
+async def test_convert_block_type(ocean_service, test_org, page_blocks):
+    """Converting text to task keeps the text and adds an unchecked box."""
+    block = page_blocks[1]
+    converted = await ocean_service.convert_block_type(
+        block_id=block["block_id"],
+        new_type="task",
+        org_id=test_org
+    )
+
+    assert converted["block_type"] == "task"
+    assert converted["content"]["text"] == block["content"]["text"]
+    assert converted["content"]["checked"] is False
+
+
+async def test_delete_block(ocean_service, test_org, page_blocks):
+    """Deleted blocks are no longer returned by get_block."""
+    block_id = page_blocks[0]["block_id"]
+
+    assert await ocean_service.delete_block(block_id, test_org)
+    assert await ocean_service.get_block(block_id, test_org) is None
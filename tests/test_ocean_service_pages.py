@@ -0,0 +1,133 @@
+"""
+OceanService Page Operations Integration Tests
+
+pytest port of scripts/test_ocean_service.py. Exercises the page methods of
+OceanService directly against ZeroDB (no API server needed):
+1. create_page
+2. get_page
+3. get_pages
+4. update_page
+5. delete_page
+6. move_page
+
+Each test runs in its own organization (see the test_org fixture), so the
+suite can be fanned out with pytest-xdist:
+
+    pytest tests/test_ocean_service_pages.py -n auto
+
+Tests are skipped when ZeroDB credentials are not configured.
+"""
+
+import asyncio
+
+import pytest
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(scope="session")]
+
+TEST_USER_ID = "user_test_123"
+
+PAGE_SHAPES = [
+    pytest.param({"title": "Test Root Page", "icon": "📋", "metadata": {"test": True}}, id="with-metadata"),
+    pytest.param({"title": "Plain Page"}, id="title-only"),
+    pytest.param({"title": "Covered Page", "icon": "🌊", "cover_image": "https://example.com/cover.png"}, id="with-cover"),
+]
+
+
+@pytest.mark.parametrize("page_data", PAGE_SHAPES)
+async def test_create_get_update_page(ocean_service, test_org, page_data):
+    """create_page -> get_page -> update_page round trip for several payload shapes."""
+    page = await ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data=page_data
+    )
+    assert page["page_id"]
+    assert page["title"] == page_data["title"]
+    assert page["parent_page_id"] is None
+
+    retrieved = await ocean_service.get_page(page_id=page["page_id"], org_id=test_org)
+    assert retrieved is not None
+    assert retrieved["page_id"] == page["page_id"]
+    assert retrieved["title"] == page_data["title"]
+
+    updated = await ocean_service.update_page(
+        page_id=page["page_id"],
+        org_id=test_org,
+        updates={"title": f"Updated {page_data['title']}", "is_favorite": True}
+    )
+    assert updated is not None
+    assert updated["title"] == f"Updated {page_data['title']}"
+    assert updated["is_favorite"] is True
+
+
+async def test_get_page_wrong_org_returns_none(ocean_service, test_org):
+    """get_page enforces organization isolation."""
+    page = await ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Isolated Page"}
+    )
+
+    assert await ocean_service.get_page(page_id=page["page_id"], org_id=f"{test_org}_other") is None
+
+
+async def test_nested_page_and_listing(ocean_service, test_org):
+    """Nested pages record their parent and both pages are listed."""
+    root = await ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Root Page"}
+    )
+    nested = await ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Nested Page", "icon": "📄", "parent_page_id": root["page_id"]}
+    )
+    assert nested["parent_page_id"] == root["page_id"]
+
+    pages = await ocean_service.get_pages(org_id=test_org, filters={"is_archived": False})
+    assert {root["page_id"], nested["page_id"]} <= {p["page_id"] for p in pages}
+
+
+async def test_move_page_to_root(ocean_service, test_org):
+    """move_page with new_parent_id=None moves a nested page to the root."""
+    root = await ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Root Page"}
+    )
+    nested = await ocean_service.create_page(
+        org_id=test_org,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Nested Page", "parent_page_id": root["page_id"]}
+    )
+
+    moved = await ocean_service.move_page(
+        page_id=nested["page_id"],
+        new_parent_id=None,
+        org_id=test_org
+    )
+    assert moved is not None
+    assert moved["parent_page_id"] is None
+
+
+async def test_delete_page_archives(ocean_service, test_org):
+    """delete_page soft-deletes: pages show up with is_archived=True."""
+    pages = await asyncio.gather(*(
+        ocean_service.create_page(
+            org_id=test_org,
+            user_id=TEST_USER_ID,
+            page_data={"title": title}
+        )
+        for title in ("Delete Me 1", "Delete Me 2")
+    ))
+
+    deleted = await asyncio.gather(*(
+        ocean_service.delete_page(page_id=page["page_id"], org_id=test_org)
+        for page in pages
+    ))
+    assert all(deleted)
+
+    archived = await ocean_service.get_pages(org_id=test_org, filters={"is_archived": True})
+    assert {page["page_id"] for page in pages} <= {p["page_id"] for p in archived}
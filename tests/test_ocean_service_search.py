@@ -0,0 +1,137 @@
+"""
+OceanService Search Integration Tests
+
+pytest port of scripts/test_search.py. Every query and filter combination is
+its own test, running in its own organization (see the test_org fixture), so
+the cases spread across workers with pytest-xdist:
+
+    pytest tests/test_ocean_service_search.py -n auto
+
+Tests are skipped when ZeroDB credentials are not configured.
+"""
+
+import pytest
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(scope="session")]
+
+TEST_USER_ID = "test-user-search"
+
+SEARCH_BLOCKS = [
+    {"block_type": "heading", "content": {"text": "Ocean Search Features"}},
+    {"block_type": "text", "content": {"text": "Ocean provides powerful hybrid semantic search combining vector similarity with metadata filtering."}},
+    {"block_type": "text", "content": {"text": "Search across your entire knowledge base using natural language queries."}},
+    {"block_type": "task", "content": {"text": "Implement semantic search functionality", "checked": True}},
+    {"block_type": "text", "content": {"text": "ZeroDB vector database enables fast and accurate semantic matching."}},
+    {"block_type": "list", "content": {"items": ["Vector search", "Metadata filtering", "Hybrid ranking"]}},
+    {"block_type": "text", "content": {"text": "Knowledge management made easy with AI-powered search capabilities."}},
+]
+
+
+async def _create_search_page(ocean_service, org_id):
+    page = await ocean_service.create_page(
+        org_id=org_id,
+        user_id=TEST_USER_ID,
+        page_data={"title": "Ocean Search Test Page"}
+    )
+    await ocean_service.create_block_batch(
+        page_id=page["page_id"],
+        org_id=org_id,
+        user_id=TEST_USER_ID,
+        blocks_list=SEARCH_BLOCKS
+    )
+    return page
+
+
+@pytest.fixture
+def search_page(ocean_loop, ocean_service, test_org):
+    """A page in the test organization holding SEARCH_BLOCKS."""
+    return ocean_loop.run_until_complete(_create_search_page(ocean_service, test_org))
+
+
+@pytest.mark.parametrize("query", [
+    "How does search work?",
+    "vector database",
+    "knowledge management",
+])
+async def test_semantic_search(ocean_service, test_org, search_page, query):
+    """Semantic results stay within the organization, limit and threshold."""
+    results = await ocean_service.search(
+        query=query,
+        org_id=test_org,
+        search_type="semantic",
+        limit=5,
+        threshold=0.6
+    )
+
+    assert len(results) <= 5
+    for result in results:
+        assert result["block"]["organization_id"] == test_org
+        assert result["score"] >= 0.6
+
+
+@pytest.mark.parametrize("query,filter_kind", [
+    ("semantic search implementation", None),
+    ("vector search", "block_types"),
+    ("knowledge", "page_id"),
+])
+async def test_hybrid_search(ocean_service, test_org, search_page, query, filter_kind):
+    """Hybrid results honor block type and page filters."""
+    filters = {
+        None: {},
+        "block_types": {"block_types": ["text"]},
+        "page_id": {"page_id": search_page["page_id"]},
+    }[filter_kind]
+
+    results = await ocean_service.search(
+        query=query,
+        org_id=test_org,
+        search_type="hybrid",
+        filters=filters,
+        limit=5,
+        threshold=0.6
+    )
+
+    assert len(results) <= 5
+    for result in results:
+        block = result["block"]
+        assert block["organization_id"] == test_org
+        if filter_kind == "block_types":
+            assert block["block_type"] == "text"
+        elif filter_kind == "page_id":
+            assert block["page_id"] == search_page["page_id"]
+
+
+@pytest.mark.parametrize("block_types", [["heading"], ["text", "task"]])
+async def test_metadata_search_block_types(ocean_service, test_org, search_page, block_types):
+    """Metadata search returns only the requested block types."""
+    results = await ocean_service.search(
+        query="search",
+        org_id=test_org,
+        search_type="metadata",
+        filters={"block_types": block_types},
+        limit=10
+    )
+
+    assert all(result["block"]["block_type"] in block_types for result in results)
+
+
+@pytest.mark.parametrize("query,search_type", [
+    pytest.param("", "hybrid", id="empty-query"),
+    pytest.param("test", "invalid", id="invalid-search-type"),
+])
+async def test_invalid_search_raises(ocean_service, test_org, query, search_type):
+    """Invalid queries and search types raise ValueError."""
+    with pytest.raises(ValueError):
+        await ocean_service.search(query=query, org_id=test_org, search_type=search_type)
+
+
+async def test_search_organization_isolation(ocean_service, test_org, search_page):
+    """Another organization never sees this organization's blocks."""
+    results = await ocean_service.search(
+        query="Ocean search",
+        org_id=f"{test_org}_other",
+        search_type="hybrid"
+    )
+
+    assert results == []
@@ -0,0 +1,159 @@
+"""
+OceanService Tag Integration Tests
+
+pytest port of scripts/test_tag_service.py. Each test runs in its own
+organization (see the test_org fixture) and cleans up its tags and blocks, so
+the cases are independent of each other and of the search tests and can run
+in parallel with pytest-xdist:
+
+    pytest tests/test_ocean_service_tags.py tests/test_ocean_service_search.py -n auto
+
+Tests are skipped when ZeroDB credentials are not configured.
+"""
+
+import asyncio
+
+import pytest
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(scope="session")]
+
+TEST_USER_ID = "test-user-tags"
+
+TAGS = [
+    {"name": "Important", "color": "#EF4444", "description": "High priority tasks"},
+    {"name": "In Progress", "color": "#3B82F6", "description": "Currently working on"},
+    {"name": "Review", "color": "#F59E0B"},
+]
+
+
+async def _create_tags(ocean_service, org_id):
+    return await asyncio.gather(*(
+        ocean_service.create_tag(org_id, tag_data) for tag_data in TAGS
+    ))
+
+
+async def _delete_tags_and_blocks(ocean_service, org_id):
+    await asyncio.gather(
+        ocean_service.bulk_delete_by_org(ocean_service.tags_table_name, org_id),
+        ocean_service.bulk_delete_by_org(ocean_service.blocks_table_name, org_id)
+    )
+
+
+@pytest.fixture
+def tags(ocean_loop, ocean_service, test_org):
+    """TAGS created in the test organization; its tags and blocks are deleted afterwards."""
+    yield ocean_loop.run_until_complete(_create_tags(ocean_service, test_org))
+
+    ocean_loop.run_until_complete(_delete_tags_and_blocks(ocean_service, test_org))
+
+
+# Tagging only reads block_id, organization_id and properties, so the block is
+# inserted as a bare row: no page, position lookup or embedding round trips
+TAG_BLOCK_DOC = {
+    "block_id": "test-block-tags",
+    "page_id": "test-page-tags",
+    "user_id": TEST_USER_ID,
+    "block_type": "text",
+    "content": {"text": "Test block for tag assignment"},
+    "properties": {"tags": []},
+    "created_at": "2025-12-24T10:00:00Z",
+    "updated_at": "2025-12-24T10:00:00Z"
+}
+
+
+async def _insert_block_row(ocean_service, block_doc):
+    async with ocean_service._http_client() as client:
+        response = await client.post(
+            f"{ocean_service.api_url}/v1/public/zerodb/mcp/execute",
+            headers=ocean_service.headers,
+            content=ocean_service._encode_json({
+                "operation": "insert_rows",
+                "params": {
+                    "project_id": ocean_service.project_id,
+                    "table_name": ocean_service.blocks_table_name,
+                    "rows": [block_doc]
+                }
+            }),
+            timeout=30.0
+        )
+    assert response.status_code == 200, response.text
+
+
+@pytest.fixture
+def tag_block(ocean_loop, ocean_service, test_org, tags):
+    """An untagged block row in the test organization (deleted with the tags fixture)."""
+    block_doc = {**TAG_BLOCK_DOC, "organization_id": test_org, "properties": {"tags": []}}
+    ocean_loop.run_until_complete(_insert_block_row(ocean_service, block_doc))
+    return block_doc
+
+
+async def test_create_tags(tags):
+    """New tags keep their fields and start unused."""
+    for tag, tag_data in zip(tags, TAGS):
+        assert tag["name"] == tag_data["name"]
+        assert tag["color"] == tag_data["color"]
+        assert tag["usage_count"] == 0
+
+
+async def test_create_tag_rejects_duplicate_name(ocean_service, test_org, tags):
+    """Tag names are unique within an organization."""
+    with pytest.raises(ValueError):
+        await ocean_service.create_tag(test_org, {"name": "Important"})
+
+
+@pytest.mark.parametrize("filters,expected", [
+    pytest.param(None, len(TAGS), id="all"),
+    pytest.param({"name": "Important"}, 1, id="name"),
+    pytest.param({"color": "#EF4444"}, 1, id="color"),
+])
+async def test_get_tags(ocean_service, test_org, tags, filters, expected):
+    """get_tags lists the organization's tags and applies filters."""
+    results = await ocean_service.get_tags(test_org, filters)
+
+    assert len(results) == expected
+    assert all(tag["organization_id"] == test_org for tag in results)
+
+
+async def test_update_tag(ocean_service, test_org, tags):
+    """Updates change name, color and description."""
+    updated = await ocean_service.update_tag(
+        tags[0]["tag_id"],
+        test_org,
+        {"name": "Critical", "color": "#DC2626", "description": "Urgent high priority tasks"}
+    )
+
+    assert updated["name"] == "Critical"
+    assert updated["color"] == "#DC2626"
+    assert updated["description"] == "Urgent high priority tasks"
+
+
+async def test_update_tag_rejects_name_conflict(ocean_service, test_org, tags):
+    """A tag cannot be renamed to another tag's name."""
+    with pytest.raises(ValueError):
+        await ocean_service.update_tag(tags[1]["tag_id"], test_org, {"name": "Important"})
+
+
+async def test_assign_and_remove_tag(ocean_service, test_org, tags, tag_block):
+    """Assigning and removing a tag keeps its usage count in step."""
+    tag_id = tags[0]["tag_id"]
+    block_id = tag_block["block_id"]
+
+    assert await ocean_service.assign_tag_to_block(block_id, tag_id, test_org)
+    assert not await ocean_service.assign_tag_to_block(block_id, tag_id, test_org)
+    [tag] = await ocean_service.get_tags(test_org, {"name": "Important"})
+    assert tag["usage_count"] == 1
+
+    assert await ocean_service.remove_tag_from_block(block_id, tag_id, test_org)
+    assert not await ocean_service.remove_tag_from_block(block_id, tag_id, test_org)
+    [tag] = await ocean_service.get_tags(test_org, {"name": "Important"})
+    assert tag["usage_count"] == 0
+
+
+async def test_delete_tag(ocean_service, test_org, tags):
+    """Deleted tags disappear; deleting an unknown tag returns False."""
+    assert await ocean_service.delete_tag(tags[2]["tag_id"], test_org)
+    assert not await ocean_service.delete_tag("non-existent-id", test_org)
+
+    remaining = await ocean_service.get_tags(test_org)
+    assert sorted(tag["name"] for tag in remaining) == ["Important", "In Progress"]
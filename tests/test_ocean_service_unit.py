@@ -11,6 +11,10 @@ to avoid external dependencies on ZeroDB. Tests focus on:
 Issue #20: Achieve 80%+ test coverage
 """
 
+import asyncio
+import httpx
+import numpy as np
+import orjson
 import pytest
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -43,6 +47,17 @@ class TestOceanServiceInit:
             "Content-Type": "application/json"
         }
 
+    def test_headers_are_read_only(self):
+        """Test that the shared request headers cannot be mutated by a call site"""
+        service = OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+        with pytest.raises(TypeError):
+            service.headers["X-Extra"] = "value"
+
     def test_init_strips_trailing_slash(self):
         """Test that __init__ removes trailing slash from api_url"""
         service = OceanService(
@@ -54,6 +69,60 @@ class TestOceanServiceInit:
         assert service.api_url == "https://api.example.com"
 
 
+class TestHTTPClient:
+    """Test HTTP client pooling and injection"""
+
+    @pytest.mark.asyncio
+    async def test_injected_client_is_used_and_left_open(self):
+        """Test that a caller-provided client is shared and not closed by aclose"""
+        client = MagicMock(aclose=AsyncMock())
+        service = OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project",
+            client=client
+        )
+
+        assert service._get_client() is client
+        await service.aclose()
+        client.aclose.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_own_client_is_reused_until_closed(self):
+        """Test that the service reuses its pooled client and closes it in aclose"""
+        service = OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+        client = service._get_client()
+        assert service._get_client() is client
+        await service.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_from_previous_loop_is_closed(self):
+        """Test that a client bound to another event loop is replaced and closed"""
+        service = OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+        stale = service._get_client()
+        service._client_loop = asyncio.new_event_loop()
+        service._client_loop.close()
+
+        client = service._get_client()
+        await asyncio.gather(*service._closing_clients)
+
+        assert client is not stale
+        assert stale.is_closed
+        assert not client.is_closed
+        await service.aclose()
+
+
 class TestPageCreationValidation:
     """Test page creation input validation"""
 
@@ -279,6 +348,229 @@ class TestLinkCreationValidation:
             )
 
 
+class TestLinkCycleDetection:
+    """Test that circular link checks only read the links reachable from the target"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @staticmethod
+    def link_client(*edges):
+        """Client whose link queries return the (source, target) edges of the queried source"""
+        async def post(url, **kwargs):
+            body = orjson.loads(kwargs["content"])
+            if "operation" in body:
+                return httpx.Response(200, json={"success": True})
+            source = body["filter"]["source_block_id"]
+            return httpx.Response(200, json={"data": [
+                {"row_id": f"r{i}", "row_data": {"source_block_id": s, "target_block_id": t}}
+                for i, (s, t) in enumerate(edges) if s == source
+            ]})
+
+        return MagicMock(post=AsyncMock(side_effect=post))
+
+    @staticmethod
+    def queried_sources(client):
+        """Source block IDs of the link queries sent, in order"""
+        bodies = [orjson.loads(c.kwargs["content"]) for c in client.post.await_args_list]
+        return [body["filter"]["source_block_id"] for body in bodies if "filter" in body]
+
+    @pytest.mark.asyncio
+    async def test_indirect_cycle_is_rejected_after_reachable_queries(self, service):
+        """Test that a -> b -> c rejects c -> a reading only the links reachable from a"""
+        client = self.link_client(("a", "b"), ("b", "c"), ("x", "y"))
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_block_by_id", AsyncMock(return_value={"block_id": "x"})):
+            with pytest.raises(ValueError, match="Circular reference detected"):
+                await service.create_link("c", "a", "reference", "org-1")
+
+        assert self.queried_sources(client) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_failed_link_query_rejects_create(self, service):
+        """Test that the cycle check fails closed when links cannot be read"""
+        client = MagicMock(post=AsyncMock(return_value=httpx.Response(500, json={})))
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_block_by_id", AsyncMock(return_value={"block_id": "x"})):
+            with pytest.raises(Exception, match="Failed to load links"):
+                await service.create_link("c", "a", "reference", "org-1")
+
+        # Nothing was inserted
+        client.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reachable_blocks_are_bounded(self, service):
+        """Test that a link graph larger than LINK_GRAPH_MAX_BLOCKS rejects the create"""
+        client = self.link_client(*((f"b{i}", f"b{i + 1}") for i in range(10)))
+        service.LINK_GRAPH_MAX_BLOCKS = 5
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_block_by_id", AsyncMock(return_value={"block_id": "x"})):
+            with pytest.raises(Exception, match="Cannot check link for cycles"):
+                await service.create_link("a", "b0", "reference", "org-1")
+
+    @pytest.mark.asyncio
+    async def test_link_batch_inserts_once_and_checks_earlier_links(self, service):
+        """Test that create_link_batch inserts in one call and rejects cycles within the batch"""
+        client = self.link_client()
+        links = [
+            {"source_block_id": "a", "target_id": "b", "link_type": "reference"},
+            {"source_block_id": "b", "target_id": "p", "link_type": "mention", "is_page_link": True}
+        ]
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_block_by_id", AsyncMock(return_value={"block_id": "x"})), \
+                patch.object(service, "get_page", AsyncMock(return_value={"page_id": "p"})):
+            created = await service.create_link_batch("org-1", links)
+
+            assert [link["target_block_id"] for link in created] == ["b", None]
+            assert created[1]["target_page_id"] == "p"
+            assert self.queried_sources(client) == ["b"]
+            assert client.post.await_count == 2
+            insert = orjson.loads(client.post.await_args.kwargs["content"])
+            assert insert["operation"] == "insert_rows"
+            assert len(insert["params"]["rows"]) == 2
+
+            with pytest.raises(ValueError, match="Circular reference detected"):
+                await service.create_link_batch("org-1", [
+                    {"source_block_id": "a", "target_id": "b", "link_type": "reference"},
+                    {"source_block_id": "b", "target_id": "a", "link_type": "reference"}
+                ])
+            # Only the link queries for b and a: nothing was inserted
+            assert client.post.await_count == 4
+
+    def test_has_circular_reference(self, service):
+        """Test cycle detection over an adjacency list, including shared descendants"""
+        graph = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []}
+
+        assert service._has_circular_reference("d", "a", graph)
+        assert service._has_circular_reference("a", "a", graph)
+        assert not service._has_circular_reference("a", "d", graph)
+        assert not service._has_circular_reference("x", "a", graph)
+
+
+class TestBacklinkCache:
+    """Test that backlink lists are served from cache until links change"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_block_backlinks_query_once(self, service):
+        """Test that a second get_block_backlinks call makes no requests"""
+        link = {
+            "link_id": "link-1",
+            "link_type": "reference",
+            "source_block_id": "a",
+            "target_block_id": "b",
+            "created_at": "2025-12-24T10:00:00Z"
+        }
+        client = MagicMock(post=AsyncMock(return_value=httpx.Response(
+            200, json={"data": [{"row_id": "r1", "row_data": link}]}
+        )))
+        get_block = AsyncMock(return_value={"block_id": "x", "page_id": "p", "block_type": "text"})
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_block_by_id", get_block):
+            first = await service.get_block_backlinks("b", "org-1")
+            second = await service.get_block_backlinks("b", "org-1")
+
+            assert client.post.await_count == 1
+            assert get_block.await_count == 2
+            assert first == second
+            assert second[0]["source_block_id"] == "a"
+
+            # Deleting a link invalidates the org's backlinks
+            with patch.object(service, "_get_link_by_id", AsyncMock(return_value=None)):
+                await service.delete_link("link-1", "org-1")
+            await service.get_block_backlinks("b", "org-1")
+
+            assert client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mutating_returned_backlinks_leaves_cache_intact(self, service):
+        """Test that callers editing returned backlinks do not change the cached entry"""
+        link = {
+            "link_id": "link-1",
+            "link_type": "reference",
+            "source_block_id": "a",
+            "target_block_id": "b",
+            "created_at": "2025-12-24T10:00:00Z"
+        }
+        client = MagicMock(post=AsyncMock(return_value=httpx.Response(
+            200, json={"data": [{"row_id": "r1", "row_data": link}]}
+        )))
+        get_block = AsyncMock(return_value={"block_id": "x", "page_id": "p", "block_type": "text"})
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_block_by_id", get_block):
+            first = await service.get_block_backlinks("b", "org-1")
+            first[0]["link_type"] = "edited"
+            second = await service.get_block_backlinks("b", "org-1")
+
+        assert second[0]["link_type"] == "reference"
+        assert client.post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_backlinks_overlapping_link_create_are_not_cached(self, service):
+        """Test that backlinks read while a link insert is in flight are dropped"""
+        insert_started = asyncio.Event()
+        release_insert = asyncio.Event()
+
+        async def post(url, **kwargs):
+            if url.endswith("/rows"):
+                insert_started.set()
+                await release_insert.wait()
+                return httpx.Response(201, json={"row_id": "r1"})
+            return httpx.Response(200, json={"data": []})
+
+        client = MagicMock(post=AsyncMock(side_effect=post))
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_block_by_id", AsyncMock(return_value={"block_id": "x"})):
+            write = asyncio.create_task(service.create_link("a", "b", "reference", "org-1"))
+            await insert_started.wait()
+            assert await service.get_block_backlinks("b", "org-1") == []
+            release_insert.set()
+            await write
+            queries = client.post.await_count
+            await service.get_block_backlinks("b", "org-1")
+
+        assert client.post.await_count == queries + 1
+
+    @pytest.mark.asyncio
+    async def test_shared_source_block_is_fetched_once(self, service):
+        """Test that backlinks from the same source block share one lookup"""
+        links = [
+            {"link_id": f"link-{i}", "link_type": "mention", "source_block_id": source, "created_at": "t"}
+            for i, source in enumerate(["a", "a", "gone"])
+        ]
+        get_block = AsyncMock(side_effect=lambda block_id, org_id: None if block_id == "gone" else {
+            "block_id": block_id, "page_id": "p", "block_type": "text", "content": {"text": "Shared"}
+        })
+
+        with patch.object(service, "_get_block_by_id", get_block):
+            backlinks = await service._enrich_backlinks(links, "org-1")
+
+        assert get_block.await_count == 2
+        assert [backlink["link_id"] for backlink in backlinks] == ["link-0", "link-1"]
+        assert all(backlink["source_content_preview"] == "Shared" for backlink in backlinks)
+
+
 class TestServiceHelperMethods:
     """Test private helper methods"""
 
@@ -344,5 +636,997 @@ class TestServiceHelperMethods:
         assert result["public_field"] == "visible"
 
 
+class TestQueryEmbeddingBatching:
+    """Test micro-batching of query embeddings"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_request(self, service):
+        """Test that concurrent queries are embedded in a single API call"""
+        async def fake_generate(texts):
+            return np.array([[float(len(text))] for text in texts], dtype=np.float32)
+
+        with patch.object(service, "_generate_embeddings", AsyncMock(side_effect=fake_generate)) as mock_generate:
+            results = await asyncio.gather(
+                service._generate_query_embedding("a"),
+                service._generate_query_embedding("bb"),
+                service._generate_query_embedding("ccc")
+            )
+
+        assert [r.tolist() for r in results] == [[1.0], [2.0], [3.0]]
+        mock_generate.assert_awaited_once_with(["a", "bb", "ccc"])
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_all_callers(self, service):
+        """Test that an embedding API failure is raised to every waiting caller"""
+        with patch.object(service, "_generate_embeddings", AsyncMock(side_effect=Exception("boom"))):
+            results = await asyncio.gather(
+                service._generate_query_embedding("a"),
+                service._generate_query_embedding("b"),
+                return_exceptions=True
+            )
+
+        assert all(isinstance(r, Exception) and str(r) == "boom" for r in results)
+
+
+class TestQueryEmbeddingCache:
+    """Test query embedding LRU cache"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_uses_cache(self, service):
+        """Test that a normalized repeat query does not call the API again"""
+        embeddings = np.array([[0.1, 0.2]], dtype=np.float32)
+
+        with patch.object(service, "_generate_embeddings", AsyncMock(return_value=embeddings)) as mock_generate:
+            first = await service._generate_query_embedding("Ocean Search")
+            second = await service._generate_query_embedding("  ocean search ")
+
+        assert first is second
+        assert first.dtype == np.float32
+        mock_generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, service):
+        """Test that the cache is bounded by its maxsize"""
+        service._embedding_cache.maxsize = 2
+
+        with patch.object(service, "_generate_embeddings", AsyncMock(return_value=np.ones((1, 1), dtype=np.float32))):
+            await service._generate_query_embedding("first")
+            await service._generate_query_embedding("second")
+            await service._generate_query_embedding("third")
+
+        assert len(service._embedding_cache) == 2
+        assert service._embedding_cache_key("first") not in service._embedding_cache
+
+    @pytest.mark.asyncio
+    async def test_cache_info_counts_hits_and_misses(self, service):
+        """Test that embedding_cache_info reports lookups"""
+        with patch.object(service, "_generate_embeddings", AsyncMock(return_value=np.ones((1, 1), dtype=np.float32))):
+            for _ in range(5):
+                await service._generate_query_embedding("vector search knowledge")
+
+        info = service.embedding_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (4, 1, 1)
+        assert info.maxsize == service.EMBEDDING_CACHE_SIZE
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_batches_uncached_queries(self, service):
+        """Test that warm_cache embeds new queries in one call and primes the cache"""
+        embeddings = np.array([[1.0], [2.0]], dtype=np.float32)
+
+        with patch.object(service, "_generate_embeddings", AsyncMock(return_value=embeddings)) as mock_generate:
+            added = await service.warm_cache(["alpha", "Alpha ", "beta", ""])
+            cached = await service._generate_query_embedding("beta")
+
+        assert added == 2
+        assert cached.tolist() == [2.0]
+        mock_generate.assert_awaited_once_with(["alpha", "beta"])
+
+
+class TestSemanticResultCache:
+    """Test reuse of search results for near-duplicate queries"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @pytest.mark.asyncio
+    async def test_similar_query_served_from_cache(self, service):
+        """Test that a paraphrase above the threshold skips the vector search"""
+        embeddings = {
+            "knowledge management": np.array([1.0, 0.0], dtype=np.float32),
+            "managing knowledge": np.array([0.995, 0.0999], dtype=np.float32),
+            "unrelated": np.array([0.0, 1.0], dtype=np.float32),
+        }
+        results = [{"block_id": "b1", "score": 0.9}]
+
+        with patch.object(service, "_generate_query_embedding", AsyncMock(side_effect=embeddings.get)), \
+                patch.object(service, "_search_semantic", AsyncMock(return_value=results)) as mock_search:
+            first = await service.search("knowledge management", "org-1", search_type="semantic")
+            second = await service.search("managing knowledge", "org-1", search_type="semantic")
+            await service.search("unrelated", "org-1", search_type="semantic")
+
+        assert first == second == results
+        assert mock_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_scoped_by_org_and_filters(self, service):
+        """Test that other orgs and other filters do not share results"""
+        with patch.object(service, "_generate_query_embedding", AsyncMock(return_value=np.array([1.0, 0.0], dtype=np.float32))), \
+                patch.object(service, "_search_hybrid", AsyncMock(return_value=[])) as mock_search:
+            await service.search("query", "org-1")
+            await service.search("query", "org-2")
+            await service.search("query", "org-1", filters={"block_types": ["heading"]})
+            await service.search("query", "org-1")
+
+        assert mock_search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_block_write_invalidates_org(self, service):
+        """Test that writing a block drops the org's cached results"""
+        with patch.object(service, "_generate_query_embedding", AsyncMock(return_value=np.array([1.0, 0.0], dtype=np.float32))), \
+                patch.object(service, "_search_semantic", AsyncMock(return_value=[])) as mock_search, \
+                patch.object(service, "get_block", AsyncMock(return_value=None)):
+            await service.search("query", "org-1", search_type="semantic")
+            await service.delete_block("block-1", "org-1")
+            await service.search("query", "org-1", search_type="semantic")
+
+        assert mock_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_overlapping_block_write_is_not_cached(self, service):
+        """Test that results fetched while a block write is in flight are dropped"""
+        write_started = asyncio.Event()
+        release_write = asyncio.Event()
+
+        async def get_block(block_id, org_id):
+            write_started.set()
+            await release_write.wait()
+            return None
+
+        with patch.object(service, "_generate_query_embedding", AsyncMock(return_value=np.array([1.0, 0.0], dtype=np.float32))), \
+                patch.object(service, "_search_semantic", AsyncMock(return_value=[])) as mock_search, \
+                patch.object(service, "get_block", side_effect=get_block):
+            write = asyncio.create_task(service.delete_block("block-1", "org-1"))
+            await write_started.wait()
+            await service.search("query", "org-1", search_type="semantic")
+            release_write.set()
+            await write
+            await service.search("query", "org-1", search_type="semantic")
+
+        assert mock_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_requires_same_query_text(self, service):
+        """Test that hybrid results are not shared between different query texts"""
+        embeddings = {
+            "knowledge management": np.array([1.0, 0.0], dtype=np.float32),
+            "managing knowledge": np.array([0.995, 0.0999], dtype=np.float32),
+        }
+
+        with patch.object(service, "_generate_query_embedding", AsyncMock(side_effect=embeddings.get)), \
+                patch.object(service, "_search_hybrid", AsyncMock(return_value=[])) as mock_search:
+            await service.search("knowledge management", "org-1")
+            await service.search("managing knowledge", "org-1")
+            await service.search("knowledge management", "org-1")
+
+        assert mock_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_copies(self, service):
+        """Test that mutating returned results does not change the cache"""
+        results = [{"block": {"block_id": "b1", "content": "original"}, "score": 0.9}]
+
+        with patch.object(service, "_generate_query_embedding", AsyncMock(return_value=np.array([1.0, 0.0], dtype=np.float32))), \
+                patch.object(service, "_search_semantic", AsyncMock(return_value=results)):
+            first = await service.search("query", "org-1", search_type="semantic")
+            first[0]["block"]["content"] = "changed"
+            second = await service.search("query", "org-1", search_type="semantic")
+            second[0]["score"] = 0.0
+            third = await service.search("query", "org-1", search_type="semantic")
+
+        assert third == [{"block": {"block_id": "b1", "content": "original"}, "score": 0.9}]
+
+    @pytest.mark.asyncio
+    async def test_page_blocks_are_fetched_while_embedding(self, service):
+        """Test that a page-scoped hybrid search loads the page's blocks concurrently with the embedding"""
+        page_fetched = asyncio.Event()
+
+        async def embed(query):
+            await page_fetched.wait()
+            return np.array([1.0, 0.0], dtype=np.float32)
+
+        async def get_blocks_by_page(page_id, org_id, pagination=None):
+            page_fetched.set()
+            return [{"block_id": "b1", "page_id": page_id}]
+
+        with patch.object(service, "_generate_query_embedding", side_effect=embed), \
+                patch.object(service, "get_blocks_by_page", side_effect=get_blocks_by_page), \
+                patch.object(service, "_search_hybrid", AsyncMock(return_value=[])) as mock_search:
+            await asyncio.wait_for(service.search("query", "org-1", filters={"page_id": "page-1"}), timeout=1.0)
+
+        assert mock_search.await_args.kwargs["prefetched_blocks"] == {"b1": {"block_id": "b1", "page_id": "page-1"}}
+
+    @pytest.mark.asyncio
+    async def test_metadata_search_skips_embedding(self, service):
+        """Test that metadata search never generates a query embedding"""
+        with patch.object(service, "_generate_query_embedding", AsyncMock(side_effect=AssertionError("embedded"))), \
+                patch.object(service, "_search_metadata", AsyncMock(return_value=[])) as mock_search:
+            results = await service.search("query", "org-1", search_type="metadata")
+
+        assert results == []
+        mock_search.assert_awaited_once()
+
+
+class TestTagCache:
+    """Test caching of get_tags results between tag writes"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @staticmethod
+    def fake_client(status_code=200):
+        """Client whose tag query returns one tag"""
+        return MagicMock(post=AsyncMock(return_value=httpx.Response(
+            status_code,
+            json={"data": [{"row_id": "r1", "row_data": {"tag_id": "t1", "name": "Important"}}]}
+        )))
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_tags_uses_cache(self, service):
+        """Test that identical get_tags calls hit ZeroDB once per filter set"""
+        client = self.fake_client()
+
+        with patch.object(service, "_get_client", return_value=client):
+            first = await service.get_tags("org-1")
+            second = await service.get_tags("org-1")
+            await service.get_tags("org-1", {"name": "Important"})
+            await service.get_tags("org-2")
+
+        assert first == second
+        assert first is not second
+        assert client.post.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_mutating_returned_tags_leaves_cache_intact(self, service):
+        """Test that callers editing returned tag dicts do not change the cached rows"""
+        client = self.fake_client()
+
+        with patch.object(service, "_get_client", return_value=client):
+            first = await service.get_tags("org-1")
+            first[0]["name"] = "Edited"
+            second = await service.get_tags("org-1")
+            second[0]["name"] = "Edited again"
+            third = await service.get_tags("org-1")
+
+        assert third[0]["name"] == "Important"
+        assert client.post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_query_is_not_cached(self, service):
+        """Test that an error response is not cached"""
+        client = self.fake_client(status_code=500)
+
+        with patch.object(service, "_get_client", return_value=client):
+            assert await service.get_tags("org-1") == []
+            assert await service.get_tags("org-1") == []
+
+        assert client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tag_write_invalidates_org(self, service):
+        """Test that a tag write drops the org's cached tag lists"""
+        client = self.fake_client()
+
+        with patch.object(service, "_get_client", return_value=client):
+            await service.get_tags("org-1")
+            await service.delete_tag("missing-tag", "org-1")
+            await service.get_tags("org-1")
+
+        # get_tags, delete_tag's uncached existence check, get_tags again
+        assert client.post.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_tags_overlapping_tag_write_is_not_cached(self, service):
+        """Test that a tag list read while a tag insert is in flight is dropped"""
+        insert_started = asyncio.Event()
+        release_insert = asyncio.Event()
+        tags = {"data": [{"row_id": "r1", "row_data": {"tag_id": "t1", "name": "Important"}}]}
+
+        async def post(url, **kwargs):
+            if url.endswith("/rows"):
+                insert_started.set()
+                await release_insert.wait()
+                return httpx.Response(201, json={"row_id": "r2"})
+            if "name" in orjson.loads(kwargs["content"])["filter"]:
+                return httpx.Response(200, json={"data": []})
+            return httpx.Response(200, json=tags)
+
+        client = MagicMock(post=AsyncMock(side_effect=post))
+
+        with patch.object(service, "_get_client", return_value=client):
+            write = asyncio.create_task(service.create_tag("org-1", {"name": "Review"}))
+            await insert_started.wait()
+            await service.get_tags("org-1")
+            release_insert.set()
+            await write
+            queries = client.post.await_count
+            await service.get_tags("org-1")
+
+        assert client.post.await_count == queries + 1
+
+    @pytest.mark.asyncio
+    async def test_assign_tag_caches_updated_usage_count(self, service):
+        """Test that get_tags after assign_tag_to_block is served without a query"""
+        tag = {"tag_id": "t1", "name": "Important", "usage_count": 0}
+        block = {"block_id": "b1", "properties": {"tags": []}}
+
+        async def post(url, **kwargs):
+            row_data = block if "/ocean_blocks/" in url else tag
+            return httpx.Response(200, json={"data": [{"row_id": "r1", "row_data": row_data}]})
+
+        client = MagicMock(
+            post=AsyncMock(side_effect=post),
+            patch=AsyncMock(return_value=httpx.Response(200, json={}))
+        )
+
+        with patch.object(service, "_get_client", return_value=client):
+            assert await service.assign_tag_to_block("b1", "t1", "org-1")
+            queries = client.post.await_count
+            tags = await service.get_tags("org-1")
+
+        assert client.post.await_count == queries
+        assert tags[0]["usage_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_assign_tag_replaces_list_read_during_patch(self, service):
+        """Test that a tag list cached while the usage count PATCH is in flight is replaced"""
+        tag = {"tag_id": "t1", "name": "Important", "usage_count": 0}
+        block = {"block_id": "b1", "properties": {"tags": []}}
+        patch_started = asyncio.Event()
+        release_patch = asyncio.Event()
+
+        async def post(url, **kwargs):
+            row_data = block if "/ocean_blocks/" in url else tag
+            return httpx.Response(200, json={"data": [{"row_id": "r1", "row_data": row_data}]})
+
+        async def patch_row(url, **kwargs):
+            if "/ocean_tags/" in url:
+                patch_started.set()
+                await release_patch.wait()
+            return httpx.Response(200, json={})
+
+        client = MagicMock(post=AsyncMock(side_effect=post), patch=AsyncMock(side_effect=patch_row))
+
+        with patch.object(service, "_get_client", return_value=client):
+            assign = asyncio.create_task(service.assign_tag_to_block("b1", "t1", "org-1"))
+            await patch_started.wait()
+            assert (await service.get_tags("org-1"))[0]["usage_count"] == 0
+            release_patch.set()
+            assert await assign
+            tags = await service.get_tags("org-1")
+
+        assert tags[0]["usage_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_assign_tag_skips_cache_after_concurrent_tag_write(self, service):
+        """Test that the usage count is not cached if another tag write overlapped it"""
+        tag = {"tag_id": "t1", "name": "Important", "usage_count": 0}
+        block = {"block_id": "b1", "properties": {"tags": []}}
+        patch_started = asyncio.Event()
+        release_patch = asyncio.Event()
+
+        async def post(url, **kwargs):
+            row_data = block if "/ocean_blocks/" in url else tag
+            return httpx.Response(200, json={"data": [{"row_id": "r1", "row_data": row_data}]})
+
+        async def patch_row(url, **kwargs):
+            if "/ocean_tags/" in url:
+                patch_started.set()
+                await release_patch.wait()
+            return httpx.Response(200, json={})
+
+        client = MagicMock(post=AsyncMock(side_effect=post), patch=AsyncMock(side_effect=patch_row))
+
+        with patch.object(service, "_get_client", return_value=client):
+            assign = asyncio.create_task(service.assign_tag_to_block("b1", "t1", "org-1"))
+            await patch_started.wait()
+            await service.delete_tag("missing-tag", "org-1")
+            release_patch.set()
+            assert await assign
+            queries = client.post.await_count
+            await service.get_tags("org-1")
+
+        assert client.post.await_count == queries + 1
+
+
+class TestBlockQueries:
+    """Test that block reads are served by a single ZeroDB query"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_blocks_by_page_is_one_query(self, service):
+        """Test that get_blocks_by_page returns full rows from one query, ordered by position"""
+        rows = [
+            {"row_id": f"r{position}", "row_data": {"block_id": f"b{position}", "position": position}}
+            for position in (2, 0, 1)
+        ]
+        client = MagicMock(post=AsyncMock(return_value=httpx.Response(200, json={"data": rows})))
+
+        with patch.object(service, "_get_client", return_value=client):
+            blocks = await service.get_blocks_by_page("page-1", "org-1")
+
+        client.post.assert_awaited_once()
+        assert [b["block_id"] for b in blocks] == ["b0", "b1", "b2"]
+
+    @pytest.mark.asyncio
+    async def test_move_block_updates_positions_without_per_block_lookups(self, service):
+        """Test that move_block reads the page once and patches each affected row once"""
+        rows = [
+            {"row_id": f"r{position}", "row_data": {"block_id": f"b{position}", "page_id": "page-1", "position": position}}
+            for position in range(4)
+        ]
+        client = MagicMock(
+            post=AsyncMock(return_value=httpx.Response(200, json={"data": rows})),
+            patch=AsyncMock(return_value=httpx.Response(200, json={"row_data": {"block_id": "b0", "position": 2}}))
+        )
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "get_block", AsyncMock(return_value=rows[0]["row_data"])):
+            moved = await service.move_block("b0", 2, "org-1")
+
+        assert moved == {"block_id": "b0", "position": 2}
+        client.post.assert_awaited_once()
+        positions = {
+            call.args[0].rsplit("/", 1)[1]: orjson.loads(call.kwargs["content"])["row_data"]["position"]
+            for call in client.patch.await_args_list
+        }
+        assert positions == {"r0": 2, "r1": 0, "r2": 1}
+
+    @pytest.mark.asyncio
+    async def test_move_block_fails_if_a_shift_fails(self, service):
+        """Test that a rejected sibling PATCH makes move_block report failure"""
+        rows = [
+            {"row_id": f"r{position}", "row_data": {"block_id": f"b{position}", "page_id": "page-1", "position": position}}
+            for position in range(4)
+        ]
+
+        async def patch_row(url, **kwargs):
+            status_code = 500 if url.endswith("/r1") else 200
+            return httpx.Response(status_code, json={"row_data": {}})
+
+        client = MagicMock(
+            post=AsyncMock(return_value=httpx.Response(200, json={"data": rows})),
+            patch=AsyncMock(side_effect=patch_row)
+        )
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "get_block", AsyncMock(return_value=rows[0]["row_data"])):
+            assert await service.move_block("b0", 2, "org-1") is None
+
+        assert client.patch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_move_block_patches_are_bounded(self, service):
+        """Test that at most MOVE_BLOCK_CONCURRENCY position PATCHes are in flight"""
+        rows = [
+            {"row_id": f"r{position}", "row_data": {"block_id": f"b{position}", "page_id": "page-1", "position": position}}
+            for position in range(10)
+        ]
+        in_flight = []
+        peak = 0
+
+        async def patch_row(url, **kwargs):
+            nonlocal peak
+            in_flight.append(url)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(url)
+            return httpx.Response(200, json={"row_data": {}})
+
+        client = MagicMock(
+            post=AsyncMock(return_value=httpx.Response(200, json={"data": rows})),
+            patch=AsyncMock(side_effect=patch_row)
+        )
+        service.MOVE_BLOCK_CONCURRENCY = 3
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "get_block", AsyncMock(return_value=rows[0]["row_data"])):
+            assert await service.move_block("b0", 9, "org-1") == {}
+
+        assert client.patch.await_count == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_update_block_replaces_embedding_and_patches_row(self, service):
+        """Test that a content change swaps the embedding and writes the new vector_id"""
+        existing = {
+            "block_id": "b1", "page_id": "page-1", "block_type": "text",
+            "content": {"text": "old"}, "vector_id": "vec-old"
+        }
+
+        requests = []
+
+        async def post(url, **kwargs):
+            body = orjson.loads(kwargs["content"])
+            if url.endswith("/embeddings/embed-and-store"):
+                requests.append("embed")
+                return httpx.Response(200, json={"vector_ids": ["vec-new"]})
+            if url.endswith("/query"):
+                requests.append("query")
+                return httpx.Response(200, json={"data": [{"row_id": "r1", "row_data": existing}]})
+            assert body["operation"] == "delete_vector"
+            requests.append(f"delete {body['params']['vector_id']}")
+            return httpx.Response(200, json={"success": True})
+
+        async def patch_row(url, **kwargs):
+            requests.append("patch")
+            return httpx.Response(200, json={"row_data": orjson.loads(kwargs["content"])["row_data"]})
+
+        client = MagicMock(post=AsyncMock(side_effect=post), patch=AsyncMock(side_effect=patch_row))
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "get_block", AsyncMock(return_value=existing)):
+            updated = await service.update_block("b1", "org-1", {"content": {"text": "new"}})
+
+        assert updated["vector_id"] == "vec-new"
+        assert updated["content"] == {"text": "new"}
+        assert client.patch.await_args.args[0].endswith("/rows/r1")
+        # The old vector is only deleted once the row points at the new one
+        assert requests == ["query", "embed", "patch", "delete vec-old"]
+
+    @pytest.mark.asyncio
+    async def test_update_block_without_row_skips_embedding(self, service):
+        """Test that no vector is created or deleted when the row is gone"""
+        existing = {
+            "block_id": "b1", "page_id": "page-1", "block_type": "text",
+            "content": {"text": "old"}, "vector_id": "vec-old"
+        }
+        client = MagicMock(post=AsyncMock(return_value=httpx.Response(200, json={"data": []})))
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "get_block", AsyncMock(return_value=existing)):
+            assert await service.update_block("b1", "org-1", {"content": {"text": "new"}}) is None
+
+        # Only the row_id lookup
+        client.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_update_deletes_new_vector_and_keeps_old(self, service):
+        """Test that a rejected PATCH removes the new vector instead of the old one"""
+        existing = {
+            "block_id": "b1", "page_id": "page-1", "block_type": "text",
+            "content": {"text": "old"}, "vector_id": "vec-old"
+        }
+        deleted = []
+
+        async def post(url, **kwargs):
+            body = orjson.loads(kwargs["content"])
+            if url.endswith("/embeddings/embed-and-store"):
+                return httpx.Response(200, json={"vector_ids": ["vec-new"]})
+            if url.endswith("/query"):
+                return httpx.Response(200, json={"data": [{"row_id": "r1", "row_data": existing}]})
+            deleted.append(body["params"]["vector_id"])
+            return httpx.Response(200, json={"success": True})
+
+        client = MagicMock(
+            post=AsyncMock(side_effect=post),
+            patch=AsyncMock(return_value=httpx.Response(500, json={}))
+        )
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "get_block", AsyncMock(return_value=existing)):
+            assert await service.update_block("b1", "org-1", {"content": {"text": "new"}}) is None
+
+        assert deleted == ["vec-new"]
+
+    @pytest.mark.asyncio
+    async def test_update_block_keeps_embedding_for_unchanged_text(self, service):
+        """Test that a case/whitespace-only edit skips embedding regeneration"""
+        existing = {
+            "block_id": "b1", "page_id": "page-1", "block_type": "text",
+            "content": {"text": "Hello world"}, "vector_id": "vec-old",
+            "text_hash": service._text_hash("Hello world")
+        }
+
+        async def patch_row(url, **kwargs):
+            return httpx.Response(200, json={"row_data": orjson.loads(kwargs["content"])["row_data"]})
+
+        client = MagicMock(
+            post=AsyncMock(return_value=httpx.Response(200, json={"data": [{"row_id": "r1", "row_data": existing}]})),
+            patch=AsyncMock(side_effect=patch_row)
+        )
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "get_block", AsyncMock(return_value=existing)):
+            updated = await service.update_block("b1", "org-1", {"content": {"text": "  hello WORLD "}})
+
+        assert "vector_id" not in updated
+        assert updated["text_hash"] == existing["text_hash"]
+        # Only the row_id lookup: no embed-and-store or delete_vector calls
+        client.post.assert_awaited_once()
+
+
+class TestBulkDeleteByOrg:
+    """Test organization-wide row deletion used for test teardown"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @pytest.mark.asyncio
+    async def test_deletes_every_listed_row(self, service):
+        """Test that all rows from one query are deleted by row_id"""
+        rows = [{"row_id": f"r{i}", "row_data": {"organization_id": "org-1"}} for i in range(3)]
+        client = MagicMock(
+            post=AsyncMock(return_value=httpx.Response(200, json={"data": rows})),
+            delete=AsyncMock(return_value=httpx.Response(204))
+        )
+
+        with patch.object(service, "_get_client", return_value=client):
+            deleted = await service.bulk_delete_by_org("ocean_tags", "org-1")
+
+        assert deleted == 3
+        client.post.assert_awaited_once()
+        assert orjson.loads(client.post.await_args.kwargs["content"])["filter"] == {"organization_id": "org-1"}
+        assert sorted(call.args[0].rsplit("/", 1)[1] for call in client.delete.await_args_list) == ["r0", "r1", "r2"]
+
+    @pytest.mark.asyncio
+    async def test_deletes_are_bounded(self, service):
+        """Test that at most BULK_DELETE_CONCURRENCY deletes are in flight"""
+        rows = [{"row_id": f"r{i}", "row_data": {"organization_id": "org-1"}} for i in range(10)]
+        in_flight = []
+        peak = 0
+
+        async def delete(url, **kwargs):
+            nonlocal peak
+            in_flight.append(url)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(url)
+            return httpx.Response(204)
+
+        client = MagicMock(
+            post=AsyncMock(return_value=httpx.Response(200, json={"data": rows})),
+            delete=AsyncMock(side_effect=delete)
+        )
+        service.BULK_DELETE_CONCURRENCY = 3
+
+        with patch.object(service, "_get_client", return_value=client):
+            assert await service.bulk_delete_by_org("ocean_tags", "org-1") == 10
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_get_tags_overlapping_delete_is_not_cached(self, service):
+        """Test that tag lists read while the deletes are in flight are dropped"""
+        rows = [{"row_id": "r1", "row_data": {"tag_id": "t1", "organization_id": "org-1"}}]
+        delete_started = asyncio.Event()
+        release_delete = asyncio.Event()
+
+        async def delete(url, **kwargs):
+            delete_started.set()
+            await release_delete.wait()
+            return httpx.Response(204)
+
+        client = MagicMock(
+            post=AsyncMock(return_value=httpx.Response(200, json={"data": rows})),
+            delete=AsyncMock(side_effect=delete)
+        )
+
+        with patch.object(service, "_get_client", return_value=client):
+            teardown = asyncio.create_task(service.bulk_delete_by_org("ocean_tags", "org-1"))
+            await delete_started.wait()
+            await service.get_tags("org-1")
+            release_delete.set()
+            await teardown
+            queries = client.post.await_count
+            await service.get_tags("org-1")
+
+        assert client.post.await_count == queries + 1
+
+    @pytest.mark.asyncio
+    async def test_requires_org_id(self, service):
+        """Test that an empty org_id never reaches ZeroDB"""
+        with pytest.raises(ValueError):
+            await service.bulk_delete_by_org("ocean_tags", "")
+
+
+class TestBlockEmbeddingBatching:
+    """Test that block batches are embedded in as few API calls as possible"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @staticmethod
+    def fake_client():
+        """Client whose embed-and-store returns one vector ID per text"""
+        async def post(url, **kwargs):
+            if url.endswith("/embeddings/embed-and-store"):
+                texts = orjson.loads(kwargs["content"])["texts"]
+                return httpx.Response(200, json={
+                    "vector_ids": [f"vec-{text}" for text in texts]
+                })
+            return httpx.Response(200)
+
+        return MagicMock(post=AsyncMock(side_effect=post))
+
+    @staticmethod
+    def embed_calls(client):
+        return [
+            call for call in client.post.await_args_list
+            if call.args[0].endswith("/embeddings/embed-and-store")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_block_batch_uses_one_embedding_call(self, service):
+        """Test that create_block_batch embeds all blocks in a single request"""
+        client = self.fake_client()
+        blocks = [{"block_type": "text", "content": {"text": f"block {i}"}} for i in range(10)]
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_next_block_position", AsyncMock(return_value=0)):
+            created = await service.create_block_batch("page-1", "org-1", "user-1", blocks)
+
+        assert len(self.embed_calls(client)) == 1
+        assert [b["vector_id"] for b in created] == [f"vec-block {i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_block_batch_inserts_rows_in_one_call(self, service):
+        """Test that create_block_batch writes every block in a single insert_rows request"""
+        client = self.fake_client()
+        blocks = [{"block_type": "text", "content": {"text": f"block {i}"}} for i in range(10)]
+
+        with patch.object(service, "_get_client", return_value=client), \
+                patch.object(service, "_get_next_block_position", AsyncMock(return_value=0)):
+            created = await service.create_block_batch("page-1", "org-1", "user-1", blocks)
+
+        insert_calls = [
+            call for call in client.post.await_args_list
+            if call.args[0].endswith("/mcp/execute")
+        ]
+        assert len(insert_calls) == 1
+        params = orjson.loads(insert_calls[0].kwargs["content"])["params"]
+        assert [row["block_id"] for row in params["rows"]] == [b["block_id"] for b in created]
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked_in_order(self, service):
+        """Test that oversized batches are split but vector IDs keep text order"""
+        client = self.fake_client()
+        texts = [f"t{i}" for i in range(service.EMBEDDING_STORE_BATCH_SIZE * 2 + 5)]
+
+        with patch.object(service, "_get_client", return_value=client):
+            vector_ids = await service._generate_and_store_embeddings_batch(
+                texts, [{} for _ in texts]
+            )
+
+        assert len(self.embed_calls(client)) == 3
+        assert vector_ids == [f"vec-{text}" for text in texts]
+
+
+class TestQueryEmbeddingNormalization:
+    """Test that generated query embeddings are unit length"""
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_returns_unit_vectors(self):
+        """Test that rows returned by the embeddings API are L2-normalized"""
+        service = OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+        response = MagicMock(status_code=200, content=b'{"embeddings": [[3.0, 4.0], [0.0, 2.0]]}')
+        client = MagicMock(post=AsyncMock(return_value=response))
+
+        with patch.object(service, "_get_client", return_value=client):
+            embeddings = await service._generate_embeddings(["a", "b"])
+
+        assert embeddings.dtype == np.float32
+        assert np.allclose(embeddings, [[0.6, 0.8], [0.0, 1.0]])
+        assert not embeddings.flags.writeable
+
+
+class TestFreshnessBoost:
+    """Test search result freshness boost"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    def test_boost_buckets_use_reference_time(self, service):
+        """Test that boosts are bucketed by age relative to the given time"""
+        now = datetime(2025, 6, 30, 12, 0, 0)
+
+        assert service._calculate_freshness_boost("2025-06-28T12:00:00", now) == 0.05
+        assert service._calculate_freshness_boost("2025-06-10T12:00:00", now) == 0.03
+        assert service._calculate_freshness_boost("2025-05-01T12:00:00", now) == 0.01
+        assert service._calculate_freshness_boost("2024-01-01T12:00:00", now) == 0.0
+
+    def test_timezone_aware_timestamp(self, service):
+        """Test that Z-suffixed timestamps are compared in UTC"""
+        now = datetime(2025, 6, 30, 12, 0, 0)
+
+        assert service._calculate_freshness_boost("2025-06-29T12:00:00Z", now) == 0.05
+
+    def test_missing_or_invalid_timestamp(self, service):
+        """Test that missing or malformed timestamps get no boost"""
+        assert service._calculate_freshness_boost("") == 0.0
+        assert service._calculate_freshness_boost("not-a-date") == 0.0
+
+
+class TestSearchResultFilters:
+    """Test post-vector-search result filtering"""
+
+    @pytest.fixture
+    def service(self):
+        """Create OceanService instance for testing"""
+        return OceanService(
+            api_url="https://api.example.com",
+            api_key="test-key",
+            project_id="test-project"
+        )
+
+    @pytest.fixture
+    def results(self):
+        """Create search results covering each filter dimension"""
+        def result(block_id, block_type, tags, created_at):
+            return {
+                "block": {
+                    "block_id": block_id,
+                    "block_type": block_type,
+                    "properties": {"tags": tags},
+                    "created_at": created_at
+                },
+                "score": 0.9
+            }
+
+        return [
+            result("b1", "text", ["t1"], "2025-01-10T00:00:00"),
+            result("b2", "heading", ["t2"], "2025-02-10T00:00:00"),
+            result("b3", "task", ["t1"], "2025-03-10T00:00:00"),
+        ]
+
+    def test_no_filters_returns_results_unchanged(self, service, results):
+        """Test that results pass through when no filters apply"""
+        assert service._apply_additional_filters(results, {}) is results
+
+    def test_single_block_type_is_rechecked(self, service, results):
+        """Test that a single block type is checked against the block rows"""
+        filtered = service._apply_additional_filters(results, {"block_types": ["text"]})
+
+        assert [r["block"]["block_id"] for r in filtered] == ["b1"]
+
+    def test_combined_filters(self, service, results):
+        """Test block types, tags and date range applied together"""
+        filtered = service._apply_additional_filters(results, {
+            "block_types": ["text", "task"],
+            "tags": ["t1"],
+            "date_range": {"start": "2025-02-01T00:00:00"}
+        })
+
+        assert [r["block"]["block_id"] for r in filtered] == ["b3"]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_rechecks_stale_vector_block_type(self, service):
+        """Test that a block converted since it was embedded is dropped by its current type"""
+        converted = {"block_id": "b1", "block_type": "heading", "content": {"text": "query"}}
+
+        with patch.object(service, "_search_vectors", AsyncMock(return_value=[
+                    {"id": "v1", "score": 0.9, "metadata": {"block_id": "b1", "block_type": "text"}}
+                ])), \
+                patch.object(service, "_get_blocks_by_ids", AsyncMock(return_value={"b1": converted})):
+            results = await service._search_hybrid(
+                "query", "org-1", {"block_types": ["text"]}, limit=10, threshold=0.7,
+                query_embedding=np.ones(2, dtype=np.float32)
+            )
+
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_vector_search_falls_back_without_operators(self, service):
+        """Test that a rejected __in filter is retried as plain equality filters"""
+        rejected = MagicMock(status_code=422, text="unknown operator")
+        accepted = MagicMock(status_code=200, content=b'{"results": [{"id": "v1"}]}')
+        client = MagicMock(post=AsyncMock(side_effect=[rejected, accepted]))
+
+        with patch.object(service, "_get_client", return_value=client):
+            results = await service._search_vectors(
+                query_embedding=np.ones(2, dtype=np.float32),
+                metadata_filter={"organization_id": "org-1", "block_type__in": ["text", "task"]},
+                threshold=0.7,
+                limit=10
+            )
+
+        assert results == [{"id": "v1"}]
+        assert service._vector_filter_operators_supported is False
+        retried_body = client.post.await_args_list[1].kwargs["content"]
+        assert b"block_type__in" not in retried_body
+
+    @pytest.mark.asyncio
+    async def test_metadata_search_keeps_empty_pushdown_result(self, service):
+        """Test that an empty result from the operator filter is not refetched unfiltered"""
+        client = MagicMock(post=AsyncMock(return_value=httpx.Response(200, json={"data": []})))
+
+        with patch.object(service, "_get_client", return_value=client):
+            results = await service._search_metadata(
+                "query", "org-1", {"block_types": ["text", "task"]}, limit=10
+            )
+
+        assert results == []
+        client.post.assert_awaited_once()
+        assert service._filter_operators_supported is True
+
+    @pytest.mark.asyncio
+    async def test_metadata_search_falls_back_without_operators(self, service):
+        """Test that a rejected operator filter is retried as the plain filter"""
+        block = {"block_id": "b1", "block_type": "task", "content": {"text": "query"}}
+        client = MagicMock(post=AsyncMock(side_effect=[
+            httpx.Response(422, text="unknown operator"),
+            httpx.Response(200, json={"data": [{"row_data": block}]})
+        ]))
+
+        with patch.object(service, "_get_client", return_value=client):
+            results = await service._search_metadata(
+                "query", "org-1", {"block_types": ["text", "task"]}, limit=10
+            )
+
+        assert [r["block"]["block_id"] for r in results] == ["b1"]
+        assert service._filter_operators_supported is False
+        retried_body = client.post.await_args_list[1].kwargs["content"]
+        assert b"block_type__in" not in retried_body
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])